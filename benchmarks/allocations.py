@@ -0,0 +1,281 @@
+"""
+Memory allocated by each phase of a large response.
+
+Traces with ``tracemalloc`` the phases of rendering a response and reports,
+for each one, the memory still held once it is over, the peak reached
+during the phase and the number of memory blocks held, with the files that
+allocated the most and the number of objects produced, by type:
+
+- ``validate``: validating the models, with hypermedia disabled
+- ``hypermedia``: resolving the hyperfields of every model
+- ``model_dump``: serializing the models with hypermedia
+- ``response_validate``: the ``_validate`` checks of the response class
+- ``encode``: encoding the serialized content as JSON
+
+By default, collections of the example apps are traced, as built by
+``benchmarks.render``. Any hypermodel can be traced instead, with its data
+read from a JSON file, once the module declaring it, and calling
+``init_app``, is imported::
+
+    python -m benchmarks.allocations --formats hal --items 10000 --depth 2
+    python -m benchmarks.allocations --model myapp.models:Catalog \\
+        --data catalog.json --response-class fastapi_hypermodel:HALResponse
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import sys
+import tracemalloc
+import warnings
+from collections import Counter
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from benchmarks.render import (
+    SUITES,
+    hypermedia_disabled,
+    make_document,
+    response_class_of,
+    run_metadata,
+    walk,
+)
+from fastapi_hypermodel import HyperModel
+from fastapi_hypermodel.base import values_view
+
+# Parameters of a run and the reports of its phases
+Run = Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]
+
+# Number of files reported as allocating the most, for each phase
+TOP_FILES = 5
+
+
+def count_types(value: Any) -> Dict[str, int]:
+    """
+    Count the distinct objects reachable from ``value`` by type, leaving out
+    the builtin types.
+    """
+    counts: Counter[str] = Counter()
+    seen = set()
+    pending = [value]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        kind = type(current)
+        if kind.__module__ != "builtins":
+            counts[kind.__name__] += 1
+
+        if isinstance(current, BaseModel):
+            pending.extend(vars(current).values())
+        elif isinstance(current, Mapping):
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+
+    return dict(counts.most_common())
+
+
+def trace(function: Callable[[], Any]) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run ``function`` under ``tracemalloc`` and return its result with the
+    memory it allocated and still holds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)
+        ])
+    finally:
+        tracemalloc.stop()
+
+    statistics = snapshot.statistics("filename")
+    report = {
+        "bytes": current,
+        "peak_bytes": peak,
+        "blocks": sum(statistic.count for statistic in statistics),
+        "top": [
+            {
+                "file": statistic.traceback[0].filename,
+                "bytes": statistic.size,
+                "blocks": statistic.count,
+            }
+            for statistic in statistics[:TOP_FILES]
+        ],
+    }
+    return result, report
+
+
+def measure_allocations(
+    model: Type[HyperModel],
+    data: Any,
+    response_class: Type[JSONResponse] = JSONResponse,
+    *,
+    by_alias: bool = True,
+    exclude_unset: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Trace the phases of rendering ``data`` as a response of ``model`` and
+    yield a report per phase. The app ``model`` is bound to resolves the
+    links.
+
+    Args:
+        model (Type[HyperModel]): Response model, bound to an app
+        data (Any): Raw data validated as ``model``
+        response_class (Type[JSONResponse]): Class of the response rendering
+            the serialized content
+        by_alias (bool): Serialize the fields by alias, as FastAPI does
+        exclude_unset (bool): Leave out the unset fields when serializing
+
+    Returns:
+        Iterator[Dict[str, Any]]: The report of each phase
+    """
+    app = model._app  # noqa: SLF001
+    elements = list(walk(model, data))
+
+    def validate() -> HyperModel:
+        with hypermedia_disabled(model):
+            return model.model_validate(data)
+
+    def hypermedia() -> List[Any]:
+        return [
+            hyperfield(app, values_view(element.values))
+            for element in elements
+            for hyperfield in element.hyperfields
+        ]
+
+    validated = model.model_validate(data)
+    content = validated.model_dump(
+        mode="json", by_alias=by_alias, exclude_unset=exclude_unset
+    )
+    response = response_class.__new__(response_class)
+    response_validate = getattr(response, "_validate", None)
+
+    phases: Dict[str, Optional[Callable[[], Any]]] = {
+        "validate": validate,
+        "hypermedia": hypermedia,
+        "model_dump": lambda: validated.model_dump(
+            mode="json", by_alias=by_alias, exclude_unset=exclude_unset
+        ),
+        "response_validate": (
+            (lambda: response_validate(content)) if response_validate else None
+        ),
+        "encode": lambda: JSONResponse.render(response, content),
+    }
+
+    for phase, function in phases.items():
+        if function is None:
+            continue
+
+        result, report = trace(function)
+        yield {
+            "benchmark": "allocations",
+            "model": model.__name__,
+            "phase": phase,
+            **report,
+            "types": count_types(result),
+        }
+        del result
+
+
+def import_object(path: str) -> Any:
+    module_name, _, name = path.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, name)
+
+
+def example_runs(
+    formats: List[str], items: int, depth: int, fanout: int
+) -> Iterator[Run]:
+    for name in formats:
+        suite = SUITES[name]
+        document = make_document(suite, items, depth, fanout)
+        parameters = {"format": name, "items": items, "depth": depth, "fanout": fanout}
+        yield (
+            parameters,
+            measure_allocations(
+                document.model,
+                document.data,
+                cast(Type[JSONResponse], response_class_of(document.route)),
+                by_alias=document.route.response_model_by_alias,
+                exclude_unset=document.route.response_model_exclude_unset,
+            ),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--formats", default=",".join(SUITES))
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--fanout", type=int, default=2)
+    parser.add_argument("--model", help="Hypermodel to trace, as module:name")
+    parser.add_argument("--data", type=Path, help="JSON file of the model data")
+    parser.add_argument(
+        "--response-class",
+        default="starlette.responses:JSONResponse",
+        help="Response class of the model, as module:name",
+    )
+    parser.add_argument("--label", default=None, help="Name of the run")
+    arguments = parser.parse_args()
+
+    if arguments.model and not arguments.data:
+        parser.error("--model requires --data")
+
+    # Embedded hypermodels are serialized as their own type, not as ``Self``
+    warnings.filterwarnings("ignore", "Pydantic serializer warnings")
+
+    metadata = run_metadata(arguments.label)
+
+    if arguments.model:
+        data = json.loads(arguments.data.read_text(encoding="utf-8"))
+        runs: List[Run] = [
+            (
+                {},
+                measure_allocations(
+                    import_object(arguments.model),
+                    data,
+                    import_object(arguments.response_class),
+                ),
+            )
+        ]
+    else:
+        runs = list(
+            example_runs(
+                arguments.formats.split(","),
+                arguments.items,
+                arguments.depth,
+                arguments.fanout,
+            )
+        )
+
+    for parameters, reports in runs:
+        for report in reports:
+            sys.stdout.write(json.dumps({**metadata, **parameters, **report}) + "\n")
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Compare two benchmark runs, such as the output of ``benchmarks.render`` for
+two versions of the library.
+
+Results are matched on their parameters, and a JSON line is written for each
+pair with the ratio of the current measure to the baseline one. With
+``--threshold``, the exit status is 1 when any ratio is above it. Run with::
+
+    python -m benchmarks.compare baseline.jsonl current.jsonl --threshold 1.1
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+# Measures compared, by order of preference, and fields describing the run
+# rather than the benchmark parameters
+MEASURES = ("min_seconds", "bytes_per_link")
+RUN_FIELDS = frozenset({
+    "version",
+    "label",
+    "python",
+    "pydantic",
+    "repeat",
+    "models",
+    "median_seconds",
+    "us_per_model",
+    "bytes",
+    "peak_bytes",
+})
+
+ResultKey = Tuple[Tuple[str, Any], ...]
+
+
+def measure_of(result: Mapping[str, Any]) -> Optional[str]:
+    return next((measure for measure in MEASURES if measure in result), None)
+
+
+def load(path: Path) -> Dict[ResultKey, Mapping[str, Any]]:
+    results: Dict[ResultKey, Mapping[str, Any]] = {}
+    with path.open(encoding="utf-8") as lines:
+        for line in lines:
+            if not line.strip():
+                continue
+
+            result = json.loads(line)
+            key = tuple(
+                sorted(
+                    (name, value)
+                    for name, value in result.items()
+                    if name not in RUN_FIELDS and name not in MEASURES
+                )
+            )
+            results[key] = result
+    return results
+
+
+def compare(
+    baseline: Mapping[ResultKey, Mapping[str, Any]],
+    current: Mapping[ResultKey, Mapping[str, Any]],
+) -> Iterator[Dict[str, Any]]:
+    for key, result in current.items():
+        reference = baseline.get(key)
+        measure = measure_of(result)
+        if reference is None or measure is None or not reference.get(measure):
+            continue
+
+        yield {
+            **dict(key),
+            "measure": measure,
+            "baseline": reference[measure],
+            "current": result[measure],
+            "ratio": round(result[measure] / reference[measure], 3),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=None)
+    arguments = parser.parse_args()
+
+    regressions = 0
+    for comparison in compare(load(arguments.baseline), load(arguments.current)):
+        sys.stdout.write(json.dumps(comparison) + "\n")
+        if arguments.threshold and comparison["ratio"] > arguments.threshold:
+            regressions += 1
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
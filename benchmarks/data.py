@@ -0,0 +1,82 @@
+"""
+Synthetic data shaped like the data of the example apps, in any size.
+
+Items and people follow ``examples/*/data.py``. Documents deeper than the
+example people are built by nesting groups of people, each group holding
+``fanout`` members of the level below.
+"""
+
+from typing import Any, Dict, List
+
+ItemData = Dict[str, Any]
+
+# Depth of the people of the example apps, holding items
+PEOPLE_DEPTH = 2
+
+
+def make_item(index: int) -> ItemData:
+    return {
+        "id_": f"item{index:06}",
+        "name": f"Item {index}",
+        "description": f"Description of item {index}",
+        "price": round(index * 1.25, 2),
+    }
+
+
+def make_person(index: int, items: List[ItemData], items_key: str) -> ItemData:
+    return {
+        "id_": f"person{index:06}",
+        "name": f"Person {index}",
+        "is_locked": index % 2 == 0,
+        items_key: items,
+    }
+
+
+def make_group(index: int, members: List[ItemData], members_key: str) -> ItemData:
+    return {"id_": f"group{index:06}", "name": f"Group {index}", members_key: members}
+
+
+def make_items(count: int) -> List[ItemData]:
+    return [make_item(index) for index in range(count)]
+
+
+def make_people(count: int, fanout: int, items_key: str) -> List[ItemData]:
+    return [make_person(index, make_items(fanout), items_key) for index in range(count)]
+
+
+def make_tree(
+    count: int,
+    depth: int,
+    fanout: int,
+    items_key: str,
+    members_key: str,
+) -> List[ItemData]:
+    """
+    Build ``count`` elements with ``depth`` levels of nested hypermedia
+    below the collection holding them: items at depth 1, people holding
+    items at depth 2 and groups above people past that.
+
+    Args:
+        count (int): Number of elements of the collection
+        depth (int): Levels of nested elements, from 1
+        fanout (int): Number of children of each nested element
+        items_key (str): Key of the items of a person
+        members_key (str): Key of the members of a group
+
+    Returns:
+        List[ItemData]: Elements of the collection
+    """
+    if depth <= 1:
+        return make_items(count)
+
+    if depth == PEOPLE_DEPTH:
+        return make_people(count, fanout, items_key)
+
+    return [
+        make_group(
+            index,
+            make_tree(fanout, depth - 1, fanout, items_key, members_key),
+            members_key,
+        )
+        for index in range(count)
+    ]
@@ -0,0 +1,101 @@
+"""
+Memory taken by the resolved links of a large collection.
+
+Builds HAL and Siren items with two links each and reports, with
+``tracemalloc``, the memory held once the items are built. Run with::
+
+    python -m benchmarks.link_memory --links 50000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Any, Dict, List, Sequence, Type
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from fastapi_hypermodel import (
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    SirenHyperModel,
+    SirenLinkFor,
+)
+
+LINKS_PER_ITEM = 2
+
+app = FastAPI()
+
+
+@app.get("/items/{id_}")
+def read_item(id_: str) -> Any:
+    return {"id_": id_}
+
+
+@app.put("/items/{id_}")
+def update_item(id_: str) -> Any:
+    return {"id_": id_}
+
+
+class HALItem(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("read_item", {"id_": "<id_>"}),
+        "update": HALFor("update_item", {"id_": "<id_>"}),
+    })
+
+
+class SirenItem(SirenHyperModel):
+    id_: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("read_item", {"id_": "<id_>"}, rel=["self"]),
+        SirenLinkFor("update_item", {"id_": "<id_>"}, rel=["update"]),
+    )
+
+
+def measure(model: Type[BaseModel], links: int) -> Dict[str, Any]:
+    """
+    Build enough items of ``model`` to hold ``links`` links and return the
+    memory they hold, the item IDs excluded.
+    """
+    ids = [f"item{index:06}" for index in range(links // LINKS_PER_ITEM)]
+    model(id_="warmup")
+
+    gc.collect()
+    tracemalloc.start()
+    items: List[BaseModel] = [model(id_=id_) for id_ in ids]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "benchmark": "link_memory",
+        "model": model.__name__,
+        "items": len(items),
+        "links": len(items) * LINKS_PER_ITEM,
+        "bytes": current,
+        "peak_bytes": peak,
+        "bytes_per_link": round(current / (len(items) * LINKS_PER_ITEM)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=50_000)
+    arguments = parser.parse_args()
+
+    HALHyperModel.init_app(app)
+    SirenHyperModel.init_app(app)
+
+    for model in (HALItem, SirenItem):
+        result = measure(model, arguments.links)
+        sys.stdout.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Throughput and latency of the example apps under load.
+
+Serves the ``examples/hal``, ``examples/siren`` and ``examples/url_for`` apps,
+with their data replaced by ``--items`` synthetic items and people, and
+drives each endpoint with ``--concurrency`` concurrent clients for
+``--duration`` seconds. The same data is served by a plain FastAPI app
+without hypermedia, as the ``plain`` format, to measure the overhead of the
+hypermedia.
+
+Apps are called in-process through the ASGI interface by default, or over
+HTTP when served by ``uvicorn`` with ``--server``. A JSON line is written per
+format, endpoint and dataset size, with the requests per second and the
+latency percentiles. Run with::
+
+    python -m benchmarks.load --items 10,100,1000 --concurrency 16 --duration 5
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import sys
+import threading
+import time
+import warnings
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+import httpx
+from fastapi import FastAPI
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from benchmarks.data import ItemData, make_items, make_person
+from benchmarks.render import SUITES, parse_sizes, run_metadata
+from examples.hal import items as hal_items
+from examples.hal import people as hal_people
+from examples.siren import items as siren_items
+from examples.siren import people as siren_people
+from examples.url_for import items as url_for_items
+from examples.url_for import people as url_for_people
+
+# Items held by each person of the dataset
+ITEMS_PER_PERSON = 2
+PERCENTILES = (50, 95, 99)
+SERVER_START_TIMEOUT = 10.0
+
+
+class PlainItem(BaseModel):
+    id_: str
+    name: str
+    description: Optional[str] = None
+    price: float
+
+
+class PlainItemCollection(BaseModel):
+    items: Sequence[PlainItem]
+
+
+class PlainPerson(BaseModel):
+    id_: str
+    name: str
+    is_locked: bool
+
+    items: Sequence[PlainItem]
+
+
+class PlainPersonCollection(BaseModel):
+    people: Sequence[PlainPerson]
+
+
+plain_items: Dict[str, List[ItemData]] = {"items": []}
+plain_people: Dict[str, List[ItemData]] = {"people": []}
+
+plain_app = FastAPI()
+
+
+@plain_app.get("/items", response_model=PlainItemCollection)
+def read_items() -> Any:
+    return plain_items
+
+
+@plain_app.get("/items/{id_}", response_model=PlainItem)
+def read_item(id_: str) -> Any:
+    return next(item for item in plain_items["items"] if item["id_"] == id_)
+
+
+@plain_app.get("/people", response_model=PlainPersonCollection)
+def read_people() -> Any:
+    return plain_people
+
+
+@plain_app.get("/people/{id_}", response_model=PlainPerson)
+def read_person(id_: str) -> Any:
+    return next(person for person in plain_people["people"] if person["id_"] == id_)
+
+
+class Target(NamedTuple):
+    app: FastAPI
+    # Data of the app, replaced in place
+    items: Any
+    people: Any
+    items_key: str
+
+
+TARGETS = {
+    "hal": Target(SUITES["hal"].app, hal_items, hal_people, "sc:items"),
+    "siren": Target(SUITES["siren"].app, siren_items, siren_people, "items"),
+    "url_for": Target(SUITES["url_for"].app, url_for_items, url_for_people, "items"),
+    "plain": Target(plain_app, plain_items, plain_people, "items"),
+}
+
+ENDPOINTS = ("/items", "/items/{item}", "/people", "/people/{person}")
+
+
+def load_dataset(target: Target, size: int) -> Dict[str, str]:
+    """
+    Replace the data served by ``target`` with ``size`` items and people,
+    in place, and return the IDs of the first item and person.
+    """
+    items = make_items(size)
+    people = [
+        make_person(
+            index,
+            items[index : index + ITEMS_PER_PERSON],
+            target.items_key,
+        )
+        for index in range(size)
+    ]
+    target.items[target.items_key] = items
+    target.people["people"] = people
+    return {"item": items[0]["id_"], "person": people[0]["id_"]}
+
+
+class Server:
+    """Serve an app with ``uvicorn`` on a free local port, in a thread."""
+
+    def __init__(self: Self, app: FastAPI) -> None:
+        import uvicorn
+
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+
+        config = uvicorn.Config(app, port=self.port, log_level="warning")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self: Self) -> Self:
+        self._thread.start()
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                error_message = "The uvicorn server did not start"
+                raise RuntimeError(error_message)
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+
+
+@asynccontextmanager
+async def client_for(
+    app: FastAPI, port: Optional[int]
+) -> AsyncIterator[httpx.AsyncClient]:
+    if port is None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            yield client
+        return
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        yield client
+
+
+async def drive(
+    client: httpx.AsyncClient, path: str, concurrency: int, duration: float
+) -> Dict[str, Any]:
+    """
+    Request ``path`` from ``concurrency`` concurrent clients for ``duration``
+    seconds and return the throughput and the latencies, in milliseconds.
+    """
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.is_error:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    quantiles = (
+        statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies
+    )
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        **{
+            f"p{percentile}_ms": round(
+                quantiles[min(percentile, len(quantiles)) - 1], 3
+            )
+            for percentile in PERCENTILES
+        },
+    }
+
+
+async def run_target(
+    name: str, size: int, concurrency: int, duration: float, port: Optional[int]
+) -> List[Dict[str, Any]]:
+    target = TARGETS[name]
+    ids = load_dataset(target, size)
+
+    results: List[Dict[str, Any]] = []
+    async with client_for(target.app, port) as client:
+        for endpoint in ENDPOINTS:
+            path = endpoint.format(**ids)
+            # Warm up the caches of the links
+            await client.get(path)
+            results.append({
+                "benchmark": "load",
+                "format": name,
+                "endpoint": endpoint,
+                "items": size,
+                "concurrency": concurrency,
+                "server": "uvicorn" if port is not None else "asgi",
+                **await drive(client, path, concurrency, duration),
+            })
+    return results
+
+
+def run(
+    name: str, size: int, concurrency: int, duration: float, *, server: bool
+) -> Iterator[Dict[str, Any]]:
+    if not server:
+        yield from asyncio.run(run_target(name, size, concurrency, duration, None))
+        return
+
+    with Server(TARGETS[name].app) as running:
+        yield from asyncio.run(
+            run_target(name, size, concurrency, duration, running.port)
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--formats", default=",".join(TARGETS))
+    parser.add_argument("--items", type=parse_sizes, default="10,100,1000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument(
+        "--server", action="store_true", help="Serve the apps with uvicorn"
+    )
+    parser.add_argument("--label", default=None, help="Name of the run")
+    arguments = parser.parse_args()
+
+    # Embedded hypermodels are serialized as their own type, not as ``Self``
+    warnings.filterwarnings("ignore", "Pydantic serializer warnings")
+
+    metadata = run_metadata(arguments.label)
+    for name in arguments.formats.split(","):
+        for size in arguments.items:
+            for result in run(
+                name,
+                size,
+                arguments.concurrency,
+                arguments.duration,
+                server=arguments.server,
+            ):
+                sys.stdout.write(json.dumps({**metadata, **result}) + "\n")
+                sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
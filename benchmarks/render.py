@@ -0,0 +1,426 @@
+"""
+Rendering time of HAL, Siren and UrlFor collections at scale.
+
+Renders collections of synthetic data with the models and routes of the
+``examples/hal``, ``examples/siren`` and ``examples/url_for`` apps, and
+times each phase of a response separately:
+
+- ``build``: validating the models, with hypermedia disabled
+- ``links``: resolving the hyperfields of every built model
+- ``validate``: the response validation run by FastAPI, links included
+- ``encode``: serializing the validated models and rendering the body
+
+Collections hold ``--items`` elements with ``--depth`` levels of nested
+hypermodels: items at depth 1, people holding items at depth 2, and groups
+of people past that, each nested element holding ``--fanout`` children.
+Results are written as JSON lines, one per format, phase, size and depth,
+tagged with the library version so runs can be compared with
+``benchmarks.compare``. Run with::
+
+    python -m benchmarks.render --items 10,1000,100000 --depths 1,3,5
+"""
+
+import argparse
+import gc
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import time
+import warnings
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
+
+import pydantic
+from fastapi import FastAPI
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import Field, create_model
+from starlette.responses import Response
+
+from benchmarks.data import PEOPLE_DEPTH, ItemData, make_tree
+from examples.hal import app as hal_app
+from examples.siren import app as siren_app
+from examples.url_for import app as url_for_app
+from fastapi_hypermodel import (
+    AbstractHyperField,
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HyperModel,
+    SirenActionFor,
+    SirenHyperModel,
+    SirenLinkFor,
+    UrlFor,
+)
+from fastapi_hypermodel.base import get_embedded_fields, values_view
+
+# Field definitions of a model: the annotation and the default value
+FieldDefinitions = Dict[str, Tuple[Any, Any]]
+
+
+class Suite(NamedTuple):
+    name: str
+    app: FastAPI
+    base: Type[HyperModel]
+    items_key: str
+    members_key: str
+    members_alias: Optional[str]
+    # Hypermedia of the groups and of the collection of groups
+    group_links: FieldDefinitions
+    collection_links: FieldDefinitions
+
+
+SUITES = {
+    "hal": Suite(
+        name="hal",
+        app=hal_app,
+        base=HALHyperModel,
+        items_key="sc:items",
+        members_key="sc:members",
+        members_alias="sc:members",
+        group_links={
+            "links": (
+                HALLinks,
+                FrozenDict({"self": HALFor("read_person", {"id_": "<id_>"})}),
+            ),
+        },
+        collection_links={
+            "links": (
+                HALLinks,
+                FrozenDict({
+                    "self": HALFor("read_people"),
+                    "find": HALFor("read_person", templated=True),
+                }),
+            ),
+        },
+    ),
+    "siren": Suite(
+        name="siren",
+        app=siren_app,
+        base=SirenHyperModel,
+        items_key="items",
+        members_key="members",
+        members_alias=None,
+        group_links={
+            "links": (
+                Sequence[SirenLinkFor],
+                (SirenLinkFor("read_person", {"id_": "<id_>"}, rel=["self"]),),
+            ),
+        },
+        collection_links={
+            "links": (
+                Sequence[SirenLinkFor],
+                (SirenLinkFor("read_people", rel=["self"]),),
+            ),
+            "actions": (
+                Sequence[SirenActionFor],
+                (SirenActionFor("read_person", templated=True, name="find"),),
+            ),
+        },
+    ),
+    "url_for": Suite(
+        name="url_for",
+        app=url_for_app,
+        base=HyperModel,
+        items_key="items",
+        members_key="members",
+        members_alias=None,
+        group_links={"href": (UrlFor, UrlFor("read_person", {"id_": "<id_>"}))},
+        collection_links={
+            "href": (UrlFor, UrlFor("read_people")),
+            "find": (UrlFor, UrlFor("read_person", templated=True)),
+        },
+    ),
+}
+
+
+class Element(NamedTuple):
+    hyperfields: Tuple[AbstractHyperField[Any], ...]
+    values: Mapping[str, Any]
+
+
+class Document(NamedTuple):
+    route: APIRoute
+    model: Type[HyperModel]
+    data: Mapping[str, Any]
+
+
+def library_version() -> str:
+    try:
+        return importlib.metadata.version("fastapi-hypermodel")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def run_metadata(label: Optional[str]) -> Dict[str, Any]:
+    """Describe the run, so results of several versions can be compared."""
+    return {
+        "version": library_version(),
+        "label": label,
+        "python": platform.python_version(),
+        "pydantic": pydantic.VERSION,
+    }
+
+
+def find_route(app: FastAPI, name: str) -> APIRoute:
+    return next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.name == name
+    )
+
+
+def response_class_of(route: APIRoute) -> Type[Response]:
+    response_class = route.response_class
+    if isinstance(response_class, DefaultPlaceholder):
+        return cast(Type[Response], response_class.value)
+    return response_class
+
+
+def group_route(suite: Suite, depth: int) -> APIRoute:
+    """
+    Build a route returning groups ``depth`` levels deep, configured like
+    the route of the people of the example app.
+    """
+    people_route = find_route(suite.app, "read_people")
+    members: Type[HyperModel] = people_route.response_model.model_fields[
+        "people"
+    ].annotation.__args__[0]
+
+    for level in range(PEOPLE_DEPTH, depth):
+        members = create_model(  # type: ignore[call-overload]
+            f"{suite.name.title()}Group{level}",
+            __base__=suite.base,
+            id_=(str, ...),
+            name=(str, ...),
+            members=(
+                Sequence[members],  # type: ignore[valid-type]
+                Field(alias=suite.members_alias),
+            ),
+            **suite.group_links,
+        )
+
+    collection = create_model(  # type: ignore[call-overload]
+        f"{suite.name.title()}GroupCollection{depth}",
+        __base__=suite.base,
+        groups=(Sequence[members], ...),  # type: ignore[valid-type]
+        **suite.collection_links,
+    )
+
+    return APIRoute(
+        "/groups",
+        people_route.endpoint,
+        response_model=collection,
+        response_model_exclude_unset=people_route.response_model_exclude_unset,
+        response_class=response_class_of(people_route),
+        name="read_groups",
+    )
+
+
+def make_document(suite: Suite, items: int, depth: int, fanout: int) -> Document:
+    elements = make_tree(items, depth, fanout, suite.items_key, suite.members_key)
+
+    if depth <= 1:
+        route = find_route(suite.app, "read_items")
+        data: Dict[str, List[ItemData]] = {suite.items_key: elements}
+    elif depth == PEOPLE_DEPTH:
+        route = find_route(suite.app, "read_people")
+        data = {"people": elements}
+    else:
+        route = group_route(suite, depth)
+        data = {"groups": elements}
+
+    return Document(route, route.response_model, data)
+
+
+@contextmanager
+def hypermedia_disabled(model: Type[HyperModel]) -> Iterator[None]:
+    """Build ``model`` without hypermedia, unbinding the app it uses."""
+    base: Type[HyperModel] = next(cls for cls in model.__mro__ if "_app" in vars(cls))
+    app = base._app  # noqa: SLF001
+    base._app = None  # noqa: SLF001
+    try:
+        yield
+    finally:
+        base._app = app  # noqa: SLF001
+
+
+def hyperfields(model: Type[HyperModel]) -> List[AbstractHyperField[Any]]:
+    """Return the hyperfield definitions of ``model``, in link containers too."""
+    fields: List[AbstractHyperField[Any]] = []
+    for field in model.model_fields.values():
+        default = field.default
+        candidates = (
+            list(default.values()) if isinstance(default, Mapping) else [default]
+        )
+        for candidate in candidates:
+            elements = (
+                candidate if isinstance(candidate, (list, tuple)) else [candidate]
+            )
+            fields.extend(
+                element
+                for element in elements
+                if isinstance(element, AbstractHyperField)
+            )
+    return fields
+
+
+def walk(model: Type[HyperModel], data: Mapping[str, Any]) -> Iterator[Element]:
+    """
+    Yield the elements of a document of ``model``, nested elements included,
+    paired with the hyperfields resolved from their values.
+    """
+    yield Element(tuple(hyperfields(model)), data)
+
+    for name, hypermodel in get_embedded_fields(model).items():
+        value = data.get(model.model_fields[name].alias or name)
+        children = value if isinstance(value, list) else [value]
+        for child in children:
+            if isinstance(child, Mapping):
+                yield from walk(hypermodel, child)
+
+
+def resolve_links(app: FastAPI, elements: Sequence[Element]) -> int:
+    resolved = 0
+    for element in elements:
+        values = values_view(element.values)
+        for hyperfield in element.hyperfields:
+            if hyperfield(app, values):
+                resolved += 1
+    return resolved
+
+
+def validate(route: APIRoute, data: Mapping[str, Any]) -> Any:
+    response_field = route.response_field
+    if response_field is None:
+        error_message = f"Route {route.name} has no response model"
+        raise ValueError(error_message)
+
+    value, errors = response_field.validate(data, {}, loc=("response",))
+    if errors:
+        error_message = f"Invalid response for {route.name}: {errors}"
+        raise ValueError(error_message)
+    return value
+
+
+def encode(route: APIRoute, value: Any) -> bytes:
+    response_field = route.response_field
+    if response_field is None:
+        error_message = f"Route {route.name} has no response model"
+        raise ValueError(error_message)
+
+    content = response_field.serialize(
+        value,
+        mode="json",
+        by_alias=route.response_model_by_alias,
+        exclude_unset=route.response_model_exclude_unset,
+    )
+    response = response_class_of(route)(content)
+    return bytes(response.body)
+
+
+def timed(function: Callable[[], Any], repeat: int) -> List[float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return timings
+
+
+def measure(
+    suite: Suite, items: int, depth: int, fanout: int, repeat: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Time every phase of rendering a collection of ``items`` elements,
+    ``depth`` levels deep, and yield a result per phase.
+    """
+    document = make_document(suite, items, depth, fanout)
+
+    elements = list(walk(document.model, document.data))
+    validated = validate(document.route, document.data)
+
+    def build() -> None:
+        with hypermedia_disabled(document.model):
+            document.model.model_validate(document.data)
+
+    phases: Dict[str, Callable[[], Any]] = {
+        "build": build,
+        "links": lambda: resolve_links(suite.app, elements),
+        "validate": lambda: validate(document.route, document.data),
+        "encode": lambda: encode(document.route, validated),
+    }
+
+    for phase, function in phases.items():
+        timings = timed(function, repeat)
+        best = min(timings)
+        yield {
+            "benchmark": "render",
+            "format": suite.name,
+            "phase": phase,
+            "items": items,
+            "depth": depth,
+            "fanout": fanout,
+            "models": len(elements),
+            "repeat": repeat,
+            "min_seconds": best,
+            "median_seconds": statistics.median(timings),
+            "us_per_model": round(best / len(elements) * 1e6, 3),
+        }
+
+
+def parse_sizes(value: str) -> List[int]:
+    return [int(size) for size in value.split(",") if size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--formats", default=",".join(SUITES))
+    parser.add_argument("--items", type=parse_sizes, default="10,100,1000,10000")
+    parser.add_argument("--depths", type=parse_sizes, default="1,2,3,4,5")
+    parser.add_argument("--fanout", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--label", default=None, help="Name of the run")
+    arguments = parser.parse_args()
+
+    # Embedded hypermodels are serialized as their own type, not as ``Self``
+    warnings.filterwarnings("ignore", "Pydantic serializer warnings")
+
+    metadata = run_metadata(arguments.label)
+
+    for name in arguments.formats.split(","):
+        suite = SUITES[name]
+        for depth in arguments.depths:
+            for items in arguments.items:
+                for result in measure(
+                    suite, items, depth, arguments.fanout, arguments.repeat
+                ):
+                    sys.stdout.write(json.dumps({**metadata, **result}) + "\n")
+                    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
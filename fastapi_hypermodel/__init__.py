@@ -1,13 +1,40 @@
 from .base import (
+    DEFAULT_PAGE_SIZE,
+    LAST_CURSOR,
+    MAX_PAGE_SIZE,
     URL_TYPE_SCHEMA,
     AbstractHyperField,
     HasName,
+    HypermediaResponse,
     HyperModel,
     InvalidAttribute,
+    InvalidCursor,
+    InvalidHyperField,
+    InvalidLinkTable,
+    InvalidURITemplate,
+    LinkTable,
+    Page,
+    PageModel,
+    Selection,
+    SelectionMiddleware,
+    URITemplate,
     UrlType,
+    expand_uri_template,
     extract_value_by_name,
     get_route_from_app,
+    paginate,
     resolve_param_values,
+    use_selection,
+)
+from .cache import (
+    CacheBackend,
+    CachedResponse,
+    LRUCacheBackend,
+    ResponseCacheMiddleware,
+)
+from .diagnostics import (
+    create_profile_router,
+    create_stats_router,
 )
 from .hal import (
     FrozenDict,
@@ -15,9 +42,22 @@ from .hal import (
     HALForType,
     HALHyperModel,
     HALLinks,
+    HALPage,
     HALResponse,
     get_hal_link,
 )
+from .instrumentation import (
+    Event,
+    InMemoryAggregator,
+    Instrument,
+    ProfileStore,
+    ProfilingMiddleware,
+    ServerTimingMiddleware,
+    SlowRenderDetector,
+    add_instrument,
+    instrumented,
+    remove_instrument,
+)
 from .siren import (
     SirenActionFor,
     SirenActionType,
@@ -26,6 +66,7 @@ from .siren import (
     SirenHyperModel,
     SirenLinkFor,
     SirenLinkType,
+    SirenPage,
     SirenResponse,
     get_siren_action,
     get_siren_link,
@@ -33,17 +74,41 @@ from .siren import (
 from .url_for import UrlFor
 
 __all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "LAST_CURSOR",
+    "MAX_PAGE_SIZE",
     "URL_TYPE_SCHEMA",
     "AbstractHyperField",
+    "CacheBackend",
+    "CachedResponse",
+    "Event",
     "FrozenDict",
     "HALFor",
     "HALForType",
     "HALHyperModel",
     "HALLinks",
+    "HALPage",
     "HALResponse",
     "HasName",
     "HyperModel",
+    "HypermediaResponse",
+    "InMemoryAggregator",
+    "Instrument",
     "InvalidAttribute",
+    "InvalidCursor",
+    "InvalidHyperField",
+    "InvalidLinkTable",
+    "InvalidURITemplate",
+    "LRUCacheBackend",
+    "LinkTable",
+    "Page",
+    "PageModel",
+    "ProfileStore",
+    "ProfilingMiddleware",
+    "ResponseCacheMiddleware",
+    "Selection",
+    "SelectionMiddleware",
+    "ServerTimingMiddleware",
     "SirenActionFor",
     "SirenActionType",
     "SirenEmbeddedType",
@@ -51,13 +116,24 @@ __all__ = [
     "SirenHyperModel",
     "SirenLinkFor",
     "SirenLinkType",
+    "SirenPage",
     "SirenResponse",
+    "SlowRenderDetector",
+    "URITemplate",
     "UrlFor",
     "UrlType",
+    "add_instrument",
+    "create_profile_router",
+    "create_stats_router",
+    "expand_uri_template",
     "extract_value_by_name",
     "get_hal_link",
     "get_route_from_app",
     "get_siren_action",
     "get_siren_link",
+    "instrumented",
+    "paginate",
+    "remove_instrument",
     "resolve_param_values",
+    "use_selection",
 ]
@@ -0,0 +1,116 @@
+import argparse
+import importlib
+import sys
+from functools import reduce
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    Type,
+)
+
+from starlette.applications import Starlette
+
+from fastapi_hypermodel.base import HyperModel, InvalidHyperField
+
+DEFAULT_LINK_TABLE = "hypermodel_links.json"
+
+
+def import_object(reference: str) -> Any:
+    """
+    Import the object referenced as ``module:attribute``, the attribute
+    possibly dotted, as in ``app.main:app``.
+
+    Raises:
+        ValueError: The reference is malformed or does not resolve
+    """
+    module_name, separator, attribute = reference.partition(":")
+    if not separator or not module_name or not attribute:
+        error_message = f"{reference} is not in the format module:attribute"
+        raise ValueError(error_message)
+
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as error:
+        error_message = f"Cannot import {module_name}: {error}"
+        raise ValueError(error_message) from error
+
+    try:
+        return reduce(getattr, attribute.split("."), module)
+    except AttributeError as error:
+        error_message = f"{module_name} has no attribute {attribute}"
+        raise ValueError(error_message) from error
+
+
+def compile_command(arguments: argparse.Namespace) -> int:
+    app = import_object(arguments.app)
+    if not isinstance(app, Starlette):
+        error_message = f"{arguments.app} is not a Starlette application"
+        raise TypeError(error_message)
+
+    base: Type[HyperModel] = (
+        import_object(arguments.base) if arguments.base else HyperModel
+    )
+    table = base.compile_link_table(app)
+    table.dump(arguments.output)
+
+    hyperfields = sum(len(paths) for paths in table.models.values())
+    print(  # noqa: T201
+        f"Compiled {hyperfields} hyperfields of {len(table.models)} models "
+        f"against {len(table.routes)} routes into {arguments.output}"
+    )
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m fastapi_hypermodel")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile",
+        help="Check the hyperfields of an app and write its link table",
+    )
+    compile_parser.add_argument("app", help="Application, as module:attribute")
+    compile_parser.add_argument(
+        "-o",
+        "--output",
+        default=DEFAULT_LINK_TABLE,
+        help=f"Link table file to write, {DEFAULT_LINK_TABLE} by default",
+    )
+    compile_parser.add_argument(
+        "--base",
+        help="HyperModel subclass whose subclasses to compile, as "
+        "module:attribute, HyperModel by default",
+    )
+    compile_parser.set_defaults(handler=compile_command)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the command line, ``python -m fastapi_hypermodel compile app.main:app``
+    writing the link table of the application to load with ``init_app``.
+
+    Returns:
+        int: Exit status, non-zero when the app or its hyperfields are invalid
+    """
+    arguments = _parser().parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = arguments.handler
+
+    # Import the application from the working directory, like ASGI servers
+    sys.path.insert(0, "")
+    try:
+        return handler(arguments)
+    except InvalidHyperField as error:
+        print(error, file=sys.stderr)  # noqa: T201
+    except (TypeError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)  # noqa: T201
+    finally:
+        sys.path.remove("")
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,110 @@
-from .hypermodel import AbstractHyperField, HasName, HyperModel
+from .hypermodel import (
+    NOT_SELECTED,
+    AbstractHyperField,
+    ConstantCache,
+    HasName,
+    HyperModel,
+    InvalidHyperField,
+    construct_unvalidated,
+    get_embedded_fields,
+    hypermodel_caches,
+)
+from .link_table import LINK_TABLE_VERSION, CompiledLink, InvalidLinkTable, LinkTable
+from .pagination import (
+    CURSOR_PARAM,
+    DEFAULT_PAGE_SIZE,
+    LAST_CURSOR,
+    MAX_PAGE_SIZE,
+    SIZE_PARAM,
+    InvalidCursor,
+    Page,
+    PageModel,
+    cap_page_size,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+from .response import (
+    NOT_MODIFIED_HEADERS,
+    HypermediaResponse,
+    etag_matches,
+    make_etag,
+)
+from .selection import Selection, SelectionMiddleware, get_selection, use_selection
+from .uri_template import (
+    InvalidURITemplate,
+    URITemplate,
+    compile_uri_template,
+    expand_uri_template,
+    route_uri_template,
+)
 from .url_type import URL_TYPE_SCHEMA, UrlType
 from .utils import (
     InvalidAttribute,
+    QueryTemplate,
+    encode_query,
     extract_value_by_name,
+    format_uri,
     get_route_from_app,
     resolve_param_values,
+    route_lookup_count,
+    route_lookup_miss_count,
+    route_table_build_count,
+    uri_caches,
+    values_view,
 )
 
 __all__ = [
+    "CURSOR_PARAM",
+    "DEFAULT_PAGE_SIZE",
+    "LAST_CURSOR",
+    "LINK_TABLE_VERSION",
+    "MAX_PAGE_SIZE",
+    "NOT_MODIFIED_HEADERS",
+    "NOT_SELECTED",
+    "SIZE_PARAM",
     "URL_TYPE_SCHEMA",
     "AbstractHyperField",
+    "CompiledLink",
+    "ConstantCache",
     "HasName",
     "HyperModel",
+    "HypermediaResponse",
     "InvalidAttribute",
+    "InvalidCursor",
+    "InvalidHyperField",
+    "InvalidLinkTable",
+    "InvalidURITemplate",
+    "LinkTable",
+    "Page",
+    "PageModel",
+    "QueryTemplate",
+    "Selection",
+    "SelectionMiddleware",
+    "URITemplate",
     "UrlType",
+    "cap_page_size",
+    "compile_uri_template",
+    "construct_unvalidated",
+    "decode_cursor",
+    "encode_cursor",
+    "encode_query",
+    "etag_matches",
+    "expand_uri_template",
     "extract_value_by_name",
+    "format_uri",
+    "get_embedded_fields",
     "get_route_from_app",
+    "get_selection",
+    "hypermodel_caches",
+    "make_etag",
+    "paginate",
     "resolve_param_values",
+    "route_lookup_count",
+    "route_lookup_miss_count",
+    "route_table_build_count",
+    "route_uri_template",
+    "uri_caches",
+    "use_selection",
+    "values_view",
 ]
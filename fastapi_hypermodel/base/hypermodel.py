@@ -1,33 +1,67 @@
 from abc import ABC, abstractmethod
-from string import Formatter
+from contextvars import ContextVar
+from functools import lru_cache
+from time import perf_counter
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Generic,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Protocol,
     Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
     cast,
+    get_args,
+    get_origin,
     runtime_checkable,
 )
 
 from pydantic import (
     BaseModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_validator,
     model_validator,
 )
+from pydantic.fields import FieldInfo
 from starlette.applications import Starlette
 from starlette.routing import Route
 from typing_extensions import Self
 
+from fastapi_hypermodel.base.link_table import (
+    CompiledLink,
+    LinkTable,
+    LinkTablePath,
+    model_key,
+    route_paths,
+)
+from fastapi_hypermodel.base.selection import get_selection
+from fastapi_hypermodel.base.uri_template import route_uri_template
 from fastapi_hypermodel.base.url_type import UrlType
-from fastapi_hypermodel.base.utils import extract_value_by_name, resolve_param_values
+from fastapi_hypermodel.base.utils import (
+    InvalidAttribute,
+    QueryTemplate,
+    format_uri,
+    get_route_from_app,
+    resolve_param_values,
+    values_view,
+)
+from fastapi_hypermodel.instrumentation import hooks, profiling
+
+
+class InvalidHyperField(ValueError):
+    pass
 
 
 @runtime_checkable
@@ -37,14 +71,388 @@ class HasName(Protocol):
 
 T = TypeVar("T", bound=BaseModel)
 
+# Lookups and filled entries of every ConstantCache, for the diagnostics
+_constant_hits = 0  # pylint: disable=invalid-name
+_constant_misses = 0  # pylint: disable=invalid-name
+_constant_entries = 0  # pylint: disable=invalid-name
+
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class ConstantCache(Generic[T]):
+    """
+    Holds the output of a hyperfield whose result does not depend on the
+    instance values, resolved once per bound app.
+
+    Pydantic deep-copies field defaults for every model instance, so copying
+    returns the same cache and all copies of a hyperfield share the result.
+    """
+
+    __slots__ = ("_app", "_value")
+
+    def __init__(self: Self) -> None:
+        self._app: Optional[Starlette] = None
+        self._value: Optional[T] = None
+
+    def __copy__(self: Self) -> Self:
+        return self
+
+    def __deepcopy__(self: Self, _: Any) -> Self:
+        return self
+
+    def get(self: Self, app: Starlette) -> Optional[T]:
+        global _constant_hits, _constant_misses  # pylint: disable=global-statement
+        if self._app is app:
+            _constant_hits += 1
+            return self._value
+
+        _constant_misses += 1
+        return None
+
+    def set(self: Self, app: Starlette, value: T) -> None:
+        global _constant_entries  # pylint: disable=global-statement
+        if self._app is None:
+            _constant_entries += 1
+
+        self._app = app
+        self._value = value
+
+    @staticmethod
+    def cache_info() -> _CacheInfo:
+        """
+        Return the lookups of every ``ConstantCache``, the misses including
+        the hyperfields depending on the instance values, and the number of
+        caches holding an output.
+        """
+        return _CacheInfo(_constant_hits, _constant_misses, _constant_entries)
+
+
+class _ModelFields(NamedTuple):
+    fields: Tuple[Tuple[str, FieldInfo], ...]
+    # Shared by the instances built with every field given. Adding a field
+    # name to it is a no-op, so pydantic never changes it through them
+    all_set: Set[str]
+
+
+@lru_cache(maxsize=None)
+def _model_fields(model: Type[BaseModel]) -> _ModelFields:
+    return _ModelFields(tuple(model.model_fields.items()), set(model.model_fields))
+
+
+@lru_cache(maxsize=None)
+def _field_names_by_alias(model: Type[BaseModel]) -> Mapping[str, str]:
+    return {
+        field.alias: name
+        for name, field in model.model_fields.items()
+        if field.alias and field.alias != name
+    }
+
+
+def construct_unvalidated(model: Type[T], **values: Any) -> T:
+    """
+    Build an instance of ``model`` from values that are already valid,
+    without running validation. This is the cheap path for the resolved
+    hypermedia, built for every link of every instance from hyperfields that
+    were validated when declared.
+
+    The instance is a regular model: values are given by field name, missing
+    fields get their default, and the given fields are the ones set. When
+    every field is given, all the instances share the same set of fields
+    set instead of holding a copy each. It is meant for models without
+    private attributes.
+
+    Args:
+        model (Type[T]): Model to build
+        **values (Any): Valid values of the fields, by field name
+
+    Returns:
+        T: The model instance
+    """
+    model_fields = _model_fields(model)
+    if len(values) == len(model_fields.fields):
+        fields_set = model_fields.all_set
+    else:
+        fields_set = set(values)
+        for name, field in model_fields.fields:
+            if name not in values:
+                values[name] = field.get_default(call_default_factory=True)
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
 
 class AbstractHyperField(ABC, Generic[T]):
+    """
+    Definition of a hypermedia field, declared as a field default and
+    resolved into its output for each instance.
+
+    The built-in hyperfields return themselves when copied, so a single
+    definition is shared by every instance of a model. Calling them never
+    changes their state, other than filling their ``ConstantCache``.
+    """
+
     @abstractmethod
     def __call__(
         self: Self, app: Optional[Starlette], values: Mapping[str, Any]
     ) -> Optional[T]:
         raise NotImplementedError
 
+    def compile(self: Self, app: Starlette) -> Optional[CompiledLink]:
+        """
+        Check the hyperfield resolves against the routes of ``app`` before
+        the first request and prepare what does not depend on the instance
+        values, raising ValueError on a mismatch. Hyperfields without a route
+        have nothing to check.
+
+        Args:
+            app (Starlette): Application the hyperfield will be resolved with
+
+        Returns:
+            Optional[CompiledLink]: The hyperfield as recorded in a link
+                table, None for hyperfields without a route
+        """
+
+    def load(self: Self, app: Starlette, link: Optional[CompiledLink]) -> None:
+        """
+        Check ``link``, the hyperfield as recorded in a link table, still
+        matches the hyperfield and the routes of ``app``, raising ValueError
+        otherwise, and fill what ``compile`` would have prepared from it.
+        Hyperfields without a route have nothing to check.
+
+        Args:
+            app (Starlette): Application the hyperfield will be resolved with
+            link (Optional[CompiledLink]): The hyperfield in the link table,
+                None when missing from it
+        """
+
+    def _compile_route(
+        self: Self,
+        app: Starlette,
+        endpoint: str,
+        params: Mapping[str, str],
+        *,
+        templated: Optional[bool],
+        condition: Optional[Callable[[Mapping[str, Any]], bool]],
+        query: Optional[QueryTemplate] = None,
+    ) -> CompiledLink:
+        """
+        Check ``endpoint`` is a route of ``app`` taking exactly the path
+        parameters ``params``, unless templated, then resolve the hyperfield
+        once when it is constant so that its ``ConstantCache`` is filled.
+        """
+        route = get_route_from_app(app, endpoint)
+
+        expected = set(route.param_convertors)
+        if not templated and set(params) != expected:
+            error_message = (
+                f"Endpoint {endpoint} takes the path parameters {sorted(expected)}, "
+                f"not {sorted(params)}"
+            )
+            raise ValueError(error_message)
+
+        link = self._link_for(
+            endpoint,
+            params,
+            route.path,
+            templated=templated,
+            condition=condition,
+            query=query,
+        )
+        if not link.constant:
+            return link
+
+        self(app, {})
+        href = self._get_uri_path(
+            templated=templated,
+            endpoint=endpoint,
+            app=app,
+            values={},
+            params=params,
+            route=route,
+            query=query,
+        )
+        return link._replace(href=href)
+
+    def _load_route(
+        self: Self,
+        app: Starlette,
+        link: Optional[CompiledLink],
+        build: Callable[[UrlType], T],
+        *,
+        constant: ConstantCache[T],
+        endpoint: str,
+        params: Mapping[str, str],
+        templated: Optional[bool],
+        condition: Optional[Callable[[Mapping[str, Any]], bool]],
+        query: Optional[QueryTemplate] = None,
+        cacheable: Callable[[T], bool] = lambda _: True,
+    ) -> None:
+        """
+        Check ``link`` was compiled from this hyperfield, pointing to
+        ``endpoint`` at the path of the route in ``app``, then fill
+        ``constant`` with the output of ``build`` for the href compiled when
+        the hyperfield is constant and the output ``cacheable``.
+        """
+        if link is None:
+            error_message = f"Link to {endpoint} is not in the link table"
+            raise ValueError(error_message)
+
+        live = self._link_for(
+            endpoint,
+            params,
+            link.path,
+            templated=templated,
+            condition=condition,
+            query=query,
+        )
+        if (link.endpoint, link.params) != (live.endpoint, live.params):
+            error_message = (
+                f"Link to {endpoint} with the path parameters {list(live.params)} "
+                f"was compiled to {link.endpoint} with {list(link.params)}"
+            )
+            raise ValueError(error_message)
+
+        if link._replace(href=None) != live:
+            error_message = (
+                f"Link to {endpoint} with templated, query and constant "
+                f"{(live.templated, live.query, live.constant)} was compiled with "
+                f"{(link.templated, link.query, link.constant)}"
+            )
+            raise ValueError(error_message)
+
+        route = get_route_from_app(app, endpoint)
+        if route.path != link.path:
+            error_message = (
+                f"Endpoint {endpoint} moved from {link.path} to {route.path}"
+            )
+            raise ValueError(error_message)
+
+        if link.href is None or not live.constant:
+            return
+
+        output = build(UrlType(link.href))
+        if cacheable(output):
+            constant.set(app, output)
+
+    def _resolve_route(
+        self: Self,
+        app: Optional[Starlette],
+        values: Mapping[str, Any],
+        build: Callable[[UrlType], T],
+        *,
+        constant: ConstantCache[T],
+        endpoint: str,
+        params: Mapping[str, str],
+        templated: Optional[bool],
+        condition: Optional[Callable[[Mapping[str, Any]], bool]],
+        query: Optional[QueryTemplate] = None,
+        safe_params: AbstractSet[str] = frozenset(),
+        uri_values: Optional[Mapping[str, Any]] = None,
+        cacheable: Callable[[T], bool] = lambda _: True,
+    ) -> Optional[T]:
+        """
+        Resolve a hyperfield pointing to ``endpoint``: nothing when there is
+        no app or ``condition`` fails, the output cached in ``constant`` when
+        there is one, otherwise the output of ``build`` for the URI path read
+        from ``uri_values``, ``values`` by default, cached when it does not
+        depend on the values and is ``cacheable``.
+        """
+        if app is None:
+            return None
+
+        if condition and not self._check_condition(condition, values, endpoint):
+            return None
+
+        cached = constant.get(app)
+        if cached:
+            return cached
+
+        output = build(
+            self._get_uri_path(
+                templated=templated,
+                endpoint=endpoint,
+                app=app,
+                values=values if uri_values is None else uri_values,
+                params=params,
+                safe_params=safe_params,
+                route=get_route_from_app(app, endpoint),
+                query=query,
+            )
+        )
+
+        if cacheable(output) and self._is_constant(
+            templated=templated, params=params, condition=condition, query=query
+        ):
+            constant.set(app, output)
+
+        return output
+
+    def _link_for(
+        self: Self,
+        endpoint: str,
+        params: Mapping[str, str],
+        path: str,
+        *,
+        templated: Optional[bool],
+        condition: Optional[Callable[[Mapping[str, Any]], bool]],
+        query: Optional[QueryTemplate] = None,
+    ) -> CompiledLink:
+        """Record of the hyperfield in a link table, without its href."""
+        return CompiledLink(
+            endpoint,
+            tuple(sorted(params)),
+            path,
+            templated=bool(templated),
+            query=query.pattern if query else None,
+            constant=self._is_constant(
+                templated=templated, params=params, condition=condition, query=query
+            ),
+        )
+
+    @staticmethod
+    def _is_constant(
+        *,
+        templated: Optional[bool],
+        params: Mapping[str, str],
+        condition: Optional[Callable[[Mapping[str, Any]], bool]],
+        query: Optional[QueryTemplate] = None,
+    ) -> bool:
+        """
+        A hyperfield is constant when its output does not depend on the
+        instance values: it has no condition and either it is templated or it
+        has no parameters to substitute, in its path or its query.
+        """
+        if condition is not None:
+            return False
+
+        if templated:
+            return True
+
+        return not params and (query is None or query.is_constant)
+
+    def _check_condition(
+        self: Self,
+        condition: Callable[[Mapping[str, Any]], bool],
+        values: Mapping[str, Any],
+        endpoint: str,
+    ) -> bool:
+        if not hooks.instruments:
+            return condition(values)
+
+        start = perf_counter()
+        try:
+            return condition(values)
+        finally:
+            hooks.emit(hooks.PHASE_CONDITION, type(self).__name__, endpoint, start)
+
     @staticmethod
     def _get_uri_path(
         *,
@@ -54,30 +462,304 @@ class AbstractHyperField(ABC, Generic[T]):
         route: Union[Route, str],
         params: Mapping[str, str],
         endpoint: str,
+        query: Optional[QueryTemplate] = None,
+        safe_params: AbstractSet[str] = frozenset(),
     ) -> UrlType:
         if templated and isinstance(route, Route):
-            return UrlType(route.path)
+            return UrlType(route_uri_template(route.path, query))
+
+        params = resolve_param_values(params, values, safe_params)
+        uri_path = app.url_path_for(endpoint, **params)
 
-        params = resolve_param_values(params, values)
-        return UrlType(app.url_path_for(endpoint, **params))
+        query_string = query.render(values) if query else ""
+        if not query_string:
+            return UrlType(uri_path)
+
+        return UrlType(f"{uri_path}?{query_string}")
 
 
 R = TypeVar("R", bound=Callable[..., Any])
 
 
+def _call_instrumented(
+    hyper_field: Callable[..., Any],
+    app: Optional[Starlette],
+    values: Mapping[str, Any],
+    model: str,
+) -> Any:
+    # Hyperfields are identified by their endpoint, other factories by type
+    name = getattr(hyper_field, "_endpoint", None) or type(hyper_field).__name__
+    start = perf_counter()
+    try:
+        return hyper_field(app, values)
+    finally:
+        hooks.emit(hooks.PHASE_HYPERFIELD, model, name, start)
+
+
+# Placeholder for embedded hypermodels left out of the current selection
+NOT_SELECTED: Any = object()
+
+
+class _EmbedDepth(NamedTuple):
+    # Nesting level of the hypermodels being validated and the level past
+    # which they are only referenced, if any
+    depth: int = 0
+    limit: Optional[int] = None
+
+
+_embed_depth: ContextVar[Optional[_EmbedDepth]] = ContextVar(
+    "fastapi_hypermodel_embed_depth", default=None
+)
+
+
+# Set while an outermost hypermodel is validated with instrumentation enabled,
+# so the nested hypermodels are not timed twice
+_timing_validation: ContextVar[bool] = ContextVar(
+    "fastapi_hypermodel_timing_validation", default=False
+)
+
+
+def _is_collection(value: Any) -> bool:
+    return isinstance(value, Sequence) and not isinstance(value, str)
+
+
+def _reference_values(model: Type[BaseModel], element: Any) -> Mapping[str, Any]:
+    # Raw input is keyed by alias, while hyperfields read the field names
+    values = values_view(element)
+    aliases = _field_names_by_alias(model)
+    if isinstance(element, BaseModel) or not aliases:
+        return values
+
+    return {aliases.get(key, key): value for key, value in values.items()}
+
+
+def _find_hypermodel(annotation: Any) -> Optional[Type["HyperModel"]]:
+    if isinstance(annotation, type) and issubclass(annotation, HyperModel):
+        return annotation
+
+    for argument in get_args(annotation):
+        hypermodel = _find_hypermodel(argument)
+        if hypermodel:
+            return hypermodel
+
+    return None
+
+
+def _is_mapping_annotation(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is Union:
+        return any(
+            _is_mapping_annotation(argument) for argument in get_args(annotation)
+        )
+
+    return isinstance(origin, type) and issubclass(origin, Mapping)
+
+
+def _with_subclasses(model: Type["HyperModel"]) -> List[Type["HyperModel"]]:
+    models = [model]
+    for subclass in model.__subclasses__():
+        models.extend(_with_subclasses(subclass))
+    return models
+
+
+def _find_hyperfields(
+    value: Any, path: str
+) -> List[Tuple[str, "AbstractHyperField[Any]"]]:
+    if isinstance(value, AbstractHyperField):
+        return [(path, value)]
+
+    if isinstance(value, Mapping):
+        items: Sequence[Tuple[Any, Any]] = list(value.items())
+    elif _is_collection(value):
+        items = list(enumerate(value))
+    else:
+        return []
+
+    hyper_fields: List[Tuple[str, AbstractHyperField[Any]]] = []
+    for key, element in items:
+        hyper_fields.extend(_find_hyperfields(element, f"{path}.{key}"))
+    return hyper_fields
+
+
+def _declared_hyperfields(
+    model: Type["HyperModel"],
+) -> List[Tuple[str, "AbstractHyperField[Any]"]]:
+    # Hyperfields declared as field defaults, directly or in the links and
+    # actions of HAL and Siren models
+    hyper_fields: List[Tuple[str, AbstractHyperField[Any]]] = []
+    for name, field in model.model_fields.items():
+        hyper_fields.extend(_find_hyperfields(field.default, name))
+    return hyper_fields
+
+
+def _compile_hyperfield(
+    hyper_field: "AbstractHyperField[Any]",
+    app: Starlette,
+    name: str,
+    errors: List[str],
+) -> Optional[CompiledLink]:
+    # Compile errors are collected to report every invalid hyperfield at once
+    try:
+        return hyper_field.compile(app)
+    except ValueError as error:
+        errors.append(f"{name}: {error}")
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_embedded_fields(
+    model: Type["HyperModel"],
+) -> Mapping[str, Type["HyperModel"]]:
+    """
+    Return the fields of ``model`` holding nested hypermodels, mapped to the
+    nested hypermodel class.
+    """
+    embedded: Dict[str, Type[HyperModel]] = {}
+    for name, field in model.model_fields.items():
+        hypermodel = _find_hypermodel(field.annotation)
+        if hypermodel:
+            embedded[name] = hypermodel
+    return embedded
+
+
+def hypermodel_caches() -> Mapping[str, Any]:
+    """
+    Return the caches of this module exposing ``cache_info()``, by name, to
+    report in the diagnostics statistics.
+    """
+    return {
+        "embedded_fields": get_embedded_fields,
+        "model_fields": _model_fields,
+        "constant_hyperfields": ConstantCache,
+    }
+
+
+@lru_cache(maxsize=None)
+def _mapping_fields(model: Type["HyperModel"]) -> FrozenSet[str]:
+    # Embedded fields holding hypermodels by key, such as ``Dict[str, Item]``
+    return frozenset(
+        name
+        for name in get_embedded_fields(model)
+        if _is_mapping_annotation(model.model_fields[name].annotation)
+    )
+
+
 class HyperModel(BaseModel):
     _app: ClassVar[Optional[Starlette]] = None
 
+    # Levels of nested hypermodels embedded below this model, unlimited if None
+    max_embed_depth: ClassVar[Optional[int]] = None
+    # Largest number of hypermodels embedded from a single field
+    max_embedded_items: ClassVar[Optional[int]] = None
+
+    @field_validator("*", mode="wrap")
+    @classmethod
+    def _validate_embedded(
+        cls: Type[Self],
+        value: Any,
+        handler: ValidatorFunctionWrapHandler,
+        info: ValidationInfo,
+    ) -> Any:
+        field_name = info.field_name or ""
+        hypermodel = get_embedded_fields(cls).get(field_name)
+        if hypermodel is None or value is None:
+            return handler(value)
+
+        alias = cls.model_fields[field_name].alias or field_name
+        selection = get_selection()
+        if selection and not selection.includes_embedded(field_name, alias):
+            return NOT_SELECTED
+
+        depth, limit = _embed_depth.get() or _EmbedDepth()
+        if cls.max_embed_depth is not None:
+            own_limit = depth + cls.max_embed_depth
+            limit = own_limit if limit is None else min(limit, own_limit)
+
+        is_mapping = field_name in _mapping_fields(cls) and isinstance(value, Mapping)
+        too_deep = limit is not None and depth >= limit
+        too_large = (
+            cls.max_embedded_items is not None
+            and (is_mapping or _is_collection(value))
+            and len(value) > cls.max_embedded_items
+        )
+        if too_deep or too_large:
+            # The values of a mapping are linked like those of a sequence
+            return cls._embed_references(
+                hypermodel, list(value.values()) if is_mapping else value, alias
+            )
+
+        token = _embed_depth.set(_EmbedDepth(depth + 1, limit))
+        try:
+            return handler(value)
+        finally:
+            _embed_depth.reset(token)
+
+    @staticmethod
+    def _embed_references(hypermodel: Type["HyperModel"], value: Any, rel: str) -> Any:
+        elements = value if _is_collection(value) else [value]
+
+        references: List[Any] = []
+        for element in elements:
+            values = _reference_values(hypermodel, element)
+            try:
+                reference = hypermodel.as_reference(values, rel)
+            except InvalidAttribute as error:
+                error_message = f"Cannot reference {hypermodel.__name__}: {error}"
+                raise ValueError(error_message) from error
+
+            if reference is not None:
+                references.append(reference)
+
+        if not references:
+            return NOT_SELECTED
+
+        if _is_collection(value):
+            return references
+
+        first_reference, *_ = references
+        return first_reference
+
+    @classmethod
+    def as_reference(
+        cls: Type[Self], values: Mapping[str, Any], rel: str
+    ) -> Optional[Any]:
+        """
+        Build a link-only reference to an instance of this model, in the
+        format of the model, from its raw values keyed by field name, without
+        validating them or building its hypermedia. Models that cannot be
+        linked to, such as plain hypermodels, return None and are left out
+        instead.
+
+        Args:
+            values (Mapping[str, Any]): Raw values of the referenced instance
+            rel (str): Name of the field embedding the instance
+        """
+
     @model_validator(mode="after")
     def _build_hypermedia(self: Self) -> Self:
+        start = perf_counter() if hooks.instruments else None
+        selection = get_selection()
+        values = values_view(self)
         for key, value in self:
+            if value is NOT_SELECTED:
+                delattr(self, key)
+                continue
+
             if not isinstance(value, AbstractHyperField):
                 setattr(self, key, value)
                 continue
 
+            if selection and not selection.includes_link(key):
+                delattr(self, key)
+                continue
+
             hyper_field = cast(AbstractHyperField[BaseModel], value)
 
-            hypermedia = hyper_field(self._app, vars(self))
+            hypermedia = (
+                _call_instrumented(hyper_field, self._app, values, type(self).__name__)
+                if start is not None
+                else hyper_field(self._app, values)
+            )
 
             if hypermedia:
                 setattr(self, key, hypermedia)
@@ -85,32 +767,155 @@ class HyperModel(BaseModel):
 
             delattr(self, key)
 
+        if start is not None:
+            hooks.emit(hooks.PHASE_HYPERMEDIA, type(self).__name__, None, start)
+
         return self
 
+    @model_validator(mode="wrap")
     @classmethod
-    def init_app(cls: Type[Self], app: Starlette) -> None:
+    def _time_validation(
+        cls: Type[Self], data: Any, handler: ValidatorFunctionWrapHandler
+    ) -> Self:
+        if not hooks.instruments or _timing_validation.get():
+            return cast(Self, handler(data))
+
+        token = _timing_validation.set(True)
+        start = perf_counter()
+        try:
+            with profiling.profiled_thread():
+                return cast(Self, handler(data))
+        finally:
+            _timing_validation.reset(token)
+            hooks.emit(hooks.PHASE_VALIDATION, cls.__name__, None, start)
+
+    @classmethod
+    def init_app(
+        cls: Type[Self],
+        app: Starlette,
+        *,
+        validate: bool = False,
+        link_table: Optional[LinkTablePath] = None,
+    ) -> None:
         """
         Bind a FastAPI app to other HyperModel base class.
         This allows HyperModel to convert endpoint function names into
         working URLs relative to the application root.
 
+        With ``validate``, the hyperfields of every subclass are also checked
+        against the routes of the app, so that a typo in an endpoint name
+        fails at startup instead of on the first request rendering the link.
+        The routes must then be registered before calling ``init_app``.
+
+        A ``link_table`` file written by ``python -m fastapi_hypermodel
+        compile`` replaces this check with a comparison of the routes and
+        models the table was compiled with against the live ones.
+
         Args:
             app (FastAPI): Application to generate URLs from
+            validate (bool): Compile the hyperfields of every subclass,
+                raising InvalidHyperField on a mismatch with the routes
+            link_table (Optional[LinkTablePath]): Link table to check the
+                app against instead, raising InvalidHyperField if outdated
         """
         cls._app = app
+        if link_table is not None:
+            cls.check_link_table(app, LinkTable.load(link_table))
+        elif validate:
+            cls.compile_hyperfields(app)
 
-    @staticmethod
-    def _parse_uri(values: Any, uri_template: str) -> str:
-        parameters: Dict[str, str] = {}
+    @classmethod
+    def compile_link_table(cls: Type[Self], app: Starlette) -> LinkTable:
+        """
+        Compile the hyperfields of this class and its subclasses against the
+        routes of ``app``, and return the table of the routes and hyperfields
+        they were checked with, to be saved and checked again at startup.
 
-        for _, field, *_ in Formatter().parse(uri_template):
-            if not field:
-                error_message = "Empty Fields Cannot be Processed"
-                raise ValueError(error_message)
+        Raises:
+            InvalidHyperField: Listing every hyperfield not matching the routes
+        """
+        return LinkTable(routes=route_paths(app), models=cls._compile_links(app))
 
-            parameters[field] = extract_value_by_name(values, field)
+    @classmethod
+    def check_link_table(cls: Type[Self], app: Starlette, table: LinkTable) -> None:
+        """
+        Check ``table`` still matches the routes of ``app`` and the
+        hyperfields of this class and its subclasses, without compiling them
+        again: the route lookups and the links that do not depend on the
+        instance values are filled from the table.
 
-        return uri_template.format(**parameters)
+        Raises:
+            InvalidHyperField: Listing every difference with the table
+        """
+        errors = table.mismatches(
+            app, (model_key(model) for model in _with_subclasses(cls))
+        )
+
+        loaded: Set[int] = set()
+        for model in _with_subclasses(cls):
+            links = table.models.get(model_key(model))
+            if links is None:
+                continue
+
+            for path, hyper_field in _declared_hyperfields(model):
+                if id(hyper_field) in loaded:
+                    continue
+                loaded.add(id(hyper_field))
+
+                try:
+                    hyper_field.load(app, links.get(path))
+                except ValueError as error:
+                    errors.append(f"{model.__name__}.{path}: {error}")
+
+        if errors:
+            error_message = "Outdated link table:\n" + "\n".join(errors)
+            raise InvalidHyperField(error_message)
+
+    @classmethod
+    def compile_hyperfields(cls: Type[Self], app: Starlette) -> None:
+        """
+        Compile the hyperfields declared by this class and its subclasses
+        against the routes of ``app``: check their endpoint exists and takes
+        the path parameters given, and resolve the links that do not depend
+        on the instance values.
+
+        Args:
+            app (Starlette): Application the hyperfields will be resolved with
+
+        Raises:
+            InvalidHyperField: Listing every hyperfield not matching the routes
+        """
+        cls._compile_links(app)
+
+    @classmethod
+    def _compile_links(
+        cls: Type[Self], app: Starlette
+    ) -> Dict[str, Dict[str, CompiledLink]]:
+        # Hyperfields inherited by subclasses are compiled and reported once
+        errors: List[str] = []
+        compiled: Dict[int, Optional[CompiledLink]] = {}
+        models: Dict[str, Dict[str, CompiledLink]] = {}
+        for model in _with_subclasses(cls):
+            links = models[model_key(model)] = {}
+            for path, hyper_field in _declared_hyperfields(model):
+                if id(hyper_field) not in compiled:
+                    compiled[id(hyper_field)] = _compile_hyperfield(
+                        hyper_field, app, f"{model.__name__}.{path}", errors
+                    )
+
+                link = compiled[id(hyper_field)]
+                if link is not None:
+                    links[path] = link
+
+        if errors:
+            error_message = "Invalid hyperfields:\n" + "\n".join(errors)
+            raise InvalidHyperField(error_message)
+
+        return models
+
+    @staticmethod
+    def _parse_uri(values: Any, uri_template: str) -> str:
+        return format_uri(values, uri_template)
 
     def parse_uri(self: Self, uri_template: str) -> str:
         return self._parse_uri(self, uri_template)
@@ -126,7 +931,13 @@ class HyperModel(BaseModel):
             if not callable(element_factory):
                 validated_elements.append(element_factory)
                 continue
-            element = element_factory(self._app, properties)
+            element = (
+                _call_instrumented(
+                    element_factory, self._app, properties, type(self).__name__
+                )
+                if hooks.instruments
+                else element_factory(self._app, properties)
+            )
             if not element:
                 continue
             validated_elements.append(element)
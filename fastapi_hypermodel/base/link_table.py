@@ -0,0 +1,186 @@
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from starlette.applications import Starlette
+from typing_extensions import Self
+
+from fastapi_hypermodel.base.utils import route_table
+
+LINK_TABLE_VERSION = 3
+
+LinkTablePath = Union[str, Path]
+
+
+class InvalidLinkTable(ValueError):
+    pass
+
+
+def model_key(model: Type[Any]) -> str:
+    """Name of ``model`` in a link table, qualified by its module."""
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+def route_paths(app: Starlette) -> Dict[str, str]:
+    """
+    Return the path of each named route of ``app``, the first route holding
+    a name winning as in ``get_route_from_app``, whose route lookups then
+    need no other scan of the routes.
+    """
+    return {name: route.path for name, route in route_table(app).items()}
+
+
+class CompiledLink(NamedTuple):
+    """
+    Hyperfield pointing to a route, as compiled into a link table.
+
+    Attributes:
+        endpoint: Name of the route
+        params: Names of the path parameters given, sorted
+        path: Path of the route
+        href: Output of the hyperfield when it does not depend on the
+            instance values, None otherwise
+        templated: Whether the hyperfield outputs the route template
+        query: Query string of the hyperfield, with the templated parameters
+            left as templates, None without a query
+        constant: Whether the hyperfield does not depend on the instance
+            values
+    """
+
+    endpoint: str
+    params: Tuple[str, ...]
+    path: str
+    href: Optional[str] = None
+    templated: bool = False
+    query: Optional[str] = None
+    constant: bool = False
+
+
+class LinkTable(NamedTuple):
+    """
+    Routes and hyperfields of an application, compiled ahead of time by
+    ``python -m fastapi_hypermodel compile`` so that startup only compares
+    them with the live router instead of checking every hyperfield.
+
+    Attributes:
+        routes: Path of each named route, by route name
+        models: Hyperfields pointing to a route declared by each hypermodel
+            class, by qualified class name, then by path in the class
+        version: Format of the table
+    """
+
+    routes: Mapping[str, str]
+    models: Mapping[str, Mapping[str, CompiledLink]]
+    version: int = LINK_TABLE_VERSION
+
+    def dumps(self: Self) -> str:
+        table = {
+            "version": self.version,
+            "routes": dict(self.routes),
+            "models": {
+                model: {
+                    path: {
+                        "endpoint": link.endpoint,
+                        "params": list(link.params),
+                        "path": link.path,
+                        "href": link.href,
+                        "templated": link.templated,
+                        "query": link.query,
+                        "constant": link.constant,
+                    }
+                    for path, link in links.items()
+                }
+                for model, links in self.models.items()
+            },
+        }
+        return json.dumps(table, indent=2, sort_keys=True)
+
+    def dump(self: Self, path: LinkTablePath) -> None:
+        Path(path).write_text(self.dumps() + "\n", encoding="utf-8")
+
+    @classmethod
+    def loads(cls: Type[Self], data: str) -> Self:
+        """
+        Parse a link table written by ``dumps``.
+
+        Raises:
+            InvalidLinkTable: The data is not a link table of this version
+        """
+        try:
+            table = json.loads(data)
+            version = table["version"]
+            routes = table["routes"]
+            models = table["models"]
+        except (ValueError, TypeError, KeyError) as error:
+            error_message = f"Not a link table: {error}"
+            raise InvalidLinkTable(error_message) from error
+
+        if version != LINK_TABLE_VERSION:
+            error_message = (
+                f"Link table version {version} is not supported, compile it again"
+            )
+            raise InvalidLinkTable(error_message)
+
+        try:
+            compiled_models = {
+                model: {
+                    path: CompiledLink(
+                        endpoint=link["endpoint"],
+                        params=tuple(link["params"]),
+                        path=link["path"],
+                        href=link["href"],
+                        templated=link["templated"],
+                        query=link["query"],
+                        constant=link["constant"],
+                    )
+                    for path, link in links.items()
+                }
+                for model, links in models.items()
+            }
+        except (AttributeError, TypeError, KeyError) as error:
+            error_message = f"Not a link table: {error}"
+            raise InvalidLinkTable(error_message) from error
+
+        return cls(routes=routes, models=compiled_models, version=version)
+
+    @classmethod
+    def load(cls: Type[Self], path: LinkTablePath) -> Self:
+        return cls.loads(Path(path).read_text(encoding="utf-8"))
+
+    def mismatches(self: Self, app: Starlette, models: Iterable[str]) -> List[str]:
+        """
+        Compare the table with the routes of ``app`` and the hypermodel
+        classes ``models``, by qualified name. Routes added and models
+        removed since the table was compiled do not matter, as no hyperfield
+        in use depends on them.
+
+        Returns:
+            List[str]: A description of each difference, empty if the table
+                is up to date
+        """
+        errors: List[str] = []
+        live_routes = route_paths(app)
+        for name, path in self.routes.items():
+            live_path = live_routes.get(name)
+            if live_path is None:
+                errors.append(f"Route {name} is missing")
+            elif live_path != path:
+                errors.append(f"Route {name} moved from {path} to {live_path}")
+
+        errors.extend(
+            f"Model {model} is not in the link table"
+            for model in models
+            if model not in self.models
+        )
+        return errors
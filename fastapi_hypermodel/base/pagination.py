@@ -0,0 +1,242 @@
+import base64
+import json
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from typing_extensions import Self
+
+from fastapi_hypermodel.base.selection import get_selection
+from fastapi_hypermodel.base.url_type import UrlType
+from fastapi_hypermodel.base.utils import encode_query
+
+CURSOR_PARAM = "cursor"
+SIZE_PARAM = "size"
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+QUERY_SEPARATOR = "?"
+QUERY_PARAM_SEPARATOR = "&"
+
+AFTER = "after"
+BEFORE = "before"
+LAST = "last"
+DIRECTIONS = frozenset({AFTER, BEFORE, LAST})
+
+R = TypeVar("R")
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(direction: str, key: Any = None) -> str:
+    """
+    Encode a keyset cursor as an opaque, URL-safe token.
+
+    Args:
+        direction (str): ``after`` or ``before`` the record with ``key``, or
+            ``last`` for the last page
+        key (Any): JSON-serializable sort key of the boundary record
+
+    Returns:
+        str: The cursor, made of unreserved characters only
+    """
+    payload = json.dumps([direction, key], separators=(",", ":"))
+    token = base64.urlsafe_b64encode(payload.encode("utf-8"))
+    return token.rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, Any]:
+    """
+    Decode a cursor built by ``encode_cursor``. Sort keys made of several
+    values are returned as tuples.
+
+    Raises:
+        InvalidCursor: The cursor was not built by ``encode_cursor``
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        direction, key = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (TypeError, ValueError) as error:
+        error_message = f"Invalid cursor {cursor}"
+        raise InvalidCursor(error_message) from error
+
+    if direction not in DIRECTIONS:
+        error_message = f"Invalid cursor {cursor}"
+        raise InvalidCursor(error_message)
+
+    return direction, tuple(key) if isinstance(key, list) else key
+
+
+LAST_CURSOR = encode_cursor(LAST)
+
+
+def cap_page_size(
+    size: Optional[int],
+    default: int = DEFAULT_PAGE_SIZE,
+    maximum: int = MAX_PAGE_SIZE,
+) -> int:
+    """
+    Return the requested page size, ``default`` if none was requested, kept
+    between 1 and ``maximum``.
+    """
+    if size is None:
+        size = default
+
+    return max(1, min(size, maximum))
+
+
+class Page(NamedTuple):
+    items: Sequence[Any]
+    page_size: int
+    cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class _SortKeys(Generic[R]):
+    """
+    Sort keys of ``records``, computed on access so that bisecting only
+    computes the keys it compares.
+    """
+
+    def __init__(self: Self, records: Sequence[R], key: Callable[[R], Any]) -> None:
+        self._records = records
+        self._key = key
+
+    def __len__(self: Self) -> int:
+        return len(self._records)
+
+    def __getitem__(self: Self, index: int) -> Any:
+        return self._key(self._records[index])
+
+
+def paginate(
+    records: Sequence[R],
+    key: Callable[[R], Any],
+    cursor: Optional[str] = None,
+    size: Optional[int] = None,
+    *,
+    default_size: int = DEFAULT_PAGE_SIZE,
+    max_size: int = MAX_PAGE_SIZE,
+) -> Page:
+    """
+    Slice a page out of ``records`` sorted by ``key``, following a keyset
+    cursor. Only the records of the page are returned, so only they need to
+    be validated and rendered.
+
+    Args:
+        records (Sequence[R]): Records sorted by ``key``
+        key (Callable[[R], Any]): Unique, JSON-serializable sort key
+        cursor (Optional[str]): Cursor of the page, the first page if None
+        size (Optional[int]): Requested page size, capped to ``max_size``
+        default_size (int): Page size when none is requested
+        max_size (int): Largest page size
+
+    Returns:
+        Page: The records of the page and the cursors of its neighbours
+
+    Raises:
+        InvalidCursor: The cursor was not built by ``encode_cursor``
+    """
+    page_size = cap_page_size(size, default_size, max_size)
+    direction, boundary = decode_cursor(cursor) if cursor else (AFTER, None)
+    keys = _SortKeys(records, key)
+
+    if direction == AFTER:
+        start = 0 if boundary is None else bisect_right(keys, boundary)
+        end = min(start + page_size, len(records))
+    else:
+        end = len(records) if direction == LAST else bisect_left(keys, boundary)
+        start = max(end - page_size, 0)
+
+    items = records[start:end]
+    if not items:
+        return Page(items, page_size, cursor)
+
+    return Page(
+        items,
+        page_size,
+        cursor,
+        next_cursor=encode_cursor(AFTER, key(items[-1]))
+        if end < len(records)
+        else None,
+        prev_cursor=encode_cursor(BEFORE, key(items[0])) if start > 0 else None,
+    )
+
+
+class PageModel(BaseModel):
+    """
+    Pagination state shared by the paged collection models. The state is
+    used to build the navigation links and is never rendered itself.
+
+    The ``items`` of the page are capped to ``page_size``, itself capped to
+    ``max_page_size``, so a page never renders more than that.
+    """
+
+    page_size: int = Field(default=DEFAULT_PAGE_SIZE, exclude=True)
+    cursor: Optional[str] = Field(default=None, exclude=True)
+    next_cursor: Optional[str] = Field(default=None, exclude=True)
+    prev_cursor: Optional[str] = Field(default=None, exclude=True)
+
+    cursor_param: ClassVar[str] = CURSOR_PARAM
+    size_param: ClassVar[str] = SIZE_PARAM
+    max_page_size: ClassVar[int] = MAX_PAGE_SIZE
+
+    @field_validator("page_size")
+    @classmethod
+    def limit_page_size(cls: Type[Self], value: int) -> int:
+        return cap_page_size(value, maximum=cls.max_page_size)
+
+    @field_validator("items", mode="before", check_fields=False)
+    @classmethod
+    def limit_items(cls: Type[Self], value: Any, info: ValidationInfo) -> Any:
+        page_size = info.data.get("page_size", DEFAULT_PAGE_SIZE)
+        if isinstance(value, Sequence) and len(value) > page_size:
+            return value[:page_size]
+
+        return value
+
+    def page_href(self: Self, href: str, cursor: Optional[str]) -> UrlType:
+        query = encode_query({
+            self.cursor_param: cursor,
+            self.size_param: self.page_size,
+        })
+        separator = (
+            QUERY_PARAM_SEPARATOR if QUERY_SEPARATOR in href else QUERY_SEPARATOR
+        )
+        return UrlType(f"{href}{separator}{query}")
+
+    def page_cursors(self: Self) -> Dict[str, Optional[str]]:
+        """
+        Return the cursors of the selected neighbour pages by link name.
+        ``prev`` and ``next`` are left out on the first and last pages.
+        """
+        page_cursors = {
+            "first": None,
+            "prev": self.prev_cursor,
+            "next": self.next_cursor,
+            "last": LAST_CURSOR,
+        }
+
+        selection = get_selection()
+        return {
+            name: cursor
+            for name, cursor in page_cursors.items()
+            if (cursor or name not in {"prev", "next"})
+            and (selection is None or selection.includes_link(name))
+        }
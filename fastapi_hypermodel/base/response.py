@@ -0,0 +1,182 @@
+import hashlib
+from http import HTTPStatus
+from time import perf_counter
+from typing import (
+    Any,
+    ClassVar,
+    Mapping,
+    Optional,
+)
+
+from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+from typing_extensions import Self
+
+from fastapi_hypermodel.instrumentation import hooks
+
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+
+ETAG_HEADER = "etag"
+# ``If-None-Match`` value matching any current representation
+ANY_ETAG = "*"
+
+# Headers that RFC 9110 requires to be repeated on a 304 response
+NOT_MODIFIED_HEADERS = (
+    "cache-control",
+    "content-location",
+    "date",
+    ETAG_HEADER,
+    "expires",
+    "vary",
+)
+
+
+def make_etag(data: bytes) -> str:
+    """
+    Build a strong entity tag from the representation bytes.
+
+    Args:
+        data (bytes): Rendered body or any other bytes identifying it
+
+    Returns:
+        str: Quoted entity tag, suitable for the ``ETag`` header
+    """
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Evaluate an ``If-None-Match`` header value against an entity tag, using
+    the weak comparison mandated for conditional GET requests.
+    """
+    if if_none_match.strip() == ANY_ETAG:
+        return True
+
+    expected = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == expected
+        for candidate in if_none_match.split(",")
+    )
+
+
+class HypermediaResponse(JSONResponse):
+    """
+    JSON response with automatic strong ETags and conditional GET support.
+
+    The ETag is computed from the rendered body. When a version is declared,
+    either through ``version`` or through the ``version_field`` of the content,
+    the ETag is derived from it instead and rendering is deferred until the
+    response is sent, so a ``304 Not Modified`` never renders the body.
+    """
+
+    use_etag: ClassVar[bool] = True
+    version_field: ClassVar[Optional[str]] = None
+
+    def __init__(
+        self: Self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        version: Optional[Any] = None,
+    ) -> None:
+        version = self._extract_version(content, version)
+        self._deferred_content: Any = None
+        self._deferred = False
+
+        if version is None:
+            super().__init__(content, status_code, headers, media_type, background)
+            if self._should_set_etag():
+                self.headers[ETAG_HEADER] = make_etag(bytes(self.body))
+            return
+
+        self.status_code = status_code
+        if media_type is not None:
+            self.media_type = media_type
+        self.background = background
+        self.body = b""
+        self.init_headers(headers)
+
+        self._deferred_content = content
+        self._deferred = True
+        if self._should_set_etag():
+            self.headers[ETAG_HEADER] = make_etag(
+                f"{self.media_type}:{version}".encode()
+            )
+
+    def _extract_version(self: Self, content: Any, version: Optional[Any]) -> Any:
+        if version is not None or not self.use_etag:
+            return version
+
+        if not self.version_field or not isinstance(content, Mapping):
+            return None
+
+        return content.get(self.version_field)
+
+    def _should_set_etag(self: Self) -> bool:
+        if not self.use_etag or ETAG_HEADER in self.headers:
+            return False
+
+        return HTTPStatus.OK <= self.status_code < HTTPStatus.MULTIPLE_CHOICES
+
+    def _validate(self: Self, content: Any) -> None:
+        """Check ``content`` follows the format of the response."""
+
+    def render(self: Self, content: Any) -> bytes:
+        if not hooks.instruments:
+            self._validate(content)
+            return super().render(content)
+
+        name = type(self).__name__
+        start = perf_counter()
+        self._validate(content)
+        hooks.emit(hooks.PHASE_RESPONSE_VALIDATION, name, None, start)
+
+        start = perf_counter()
+        body = super().render(content)
+        hooks.emit(hooks.PHASE_ENCODING, name, None, start)
+        return body
+
+    def _render_deferred(self: Self) -> None:
+        if not self._deferred:
+            return
+
+        self.body = self.render(self._deferred_content)
+        self.headers["content-length"] = str(len(self.body))
+        self._deferred_content = None
+        self._deferred = False
+
+    def _is_not_modified(self: Self, scope: Scope) -> bool:
+        etag = self.headers.get(ETAG_HEADER)
+        if not etag or scope.get("method") not in CONDITIONAL_METHODS:
+            return False
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if not if_none_match:
+            return False
+
+        return etag_matches(if_none_match, etag)
+
+    def not_modified(self: Self) -> Response:
+        headers = {
+            name: self.headers[name]
+            for name in NOT_MODIFIED_HEADERS
+            if name in self.headers
+        }
+        return Response(
+            status_code=HTTPStatus.NOT_MODIFIED,
+            headers=headers,
+            background=self.background,
+        )
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._is_not_modified(scope):
+            await self.not_modified()(scope, receive, send)
+            return
+
+        self._render_deferred()
+        await super().__call__(scope, receive, send)
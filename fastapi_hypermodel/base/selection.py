@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    AbstractSet,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Type,
+)
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing_extensions import Self
+
+NONE_SELECTED = "none"
+
+HTTP_SCOPE = "http"
+
+# Links the formats require whenever links are rendered at all
+ALWAYS_SELECTED_LINKS = frozenset({"self", "curies"})
+
+
+def _parse_names(raw: Optional[str]) -> Optional[FrozenSet[str]]:
+    if raw is None:
+        return None
+
+    names = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    return frozenset() if names == {NONE_SELECTED} else names
+
+
+class Selection(NamedTuple):
+    """
+    Sparse fieldset requested for the current render. ``None`` selects
+    everything, an empty set selects nothing.
+
+    Attributes:
+        fields: Names of the plain (non-hypermedia) fields to render
+        links: Names of the links (and Siren actions) to build
+        embed: Names of the embedded hypermodel fields to build
+    """
+
+    fields: Optional[FrozenSet[str]] = None
+    links: Optional[FrozenSet[str]] = None
+    embed: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def from_query(
+        cls: Type[Self],
+        query: Mapping[str, str],
+        fields_param: str = "fields",
+        links_param: str = "links",
+        embed_param: str = "embed",
+    ) -> Optional[Self]:
+        if not any(
+            param in query for param in (fields_param, links_param, embed_param)
+        ):
+            return None
+
+        return cls(
+            fields=_parse_names(query.get(fields_param)),
+            links=_parse_names(query.get(links_param)),
+            embed=_parse_names(query.get(embed_param)),
+        )
+
+    def includes_field(self: Self, *names: str) -> bool:
+        return _includes(self.fields, names)
+
+    def includes_link(self: Self, *names: str) -> bool:
+        return _includes(self.links, names, ALWAYS_SELECTED_LINKS)
+
+    def includes_embedded(self: Self, *names: str) -> bool:
+        return _includes(self.embed, names)
+
+
+def _includes(
+    selected: Optional[FrozenSet[str]],
+    names: Iterable[str],
+    always_selected: AbstractSet[str] = frozenset(),
+) -> bool:
+    if selected is None:
+        return True
+
+    return any(name in selected or name in always_selected for name in names)
+
+
+_selection: ContextVar[Optional[Selection]] = ContextVar(
+    "fastapi_hypermodel_selection", default=None
+)
+
+
+def get_selection() -> Optional[Selection]:
+    return _selection.get()
+
+
+@contextmanager
+def use_selection(selection: Optional[Selection]) -> Iterator[None]:
+    """
+    Render every hypermodel built inside the block with ``selection``.
+    """
+    token = _selection.set(selection)
+    try:
+        yield
+    finally:
+        _selection.reset(token)
+
+
+class SelectionMiddleware:
+    """
+    Read sparse fieldset query parameters, e.g.
+    ``?fields=name,price&links=self,update&embed=none``, and apply them to the
+    hypermodels built while handling the request.
+    """
+
+    def __init__(
+        self: Self,
+        app: ASGIApp,
+        fields_param: str = "fields",
+        links_param: str = "links",
+        embed_param: str = "embed",
+    ) -> None:
+        self.app = app
+        self.fields_param = fields_param
+        self.links_param = links_param
+        self.embed_param = embed_param
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != HTTP_SCOPE:
+            await self.app(scope, receive, send)
+            return
+
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        selection = Selection.from_query(
+            dict(parse_qsl(query_string, keep_blank_values=True)),
+            fields_param=self.fields_param,
+            links_param=self.links_param,
+            embed_param=self.embed_param,
+        )
+
+        with use_selection(selection):
+            await self.app(scope, receive, send)
@@ -0,0 +1,304 @@
+import re
+import urllib.parse
+from functools import lru_cache
+from typing import (
+    Any,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from typing_extensions import Self
+
+from fastapi_hypermodel.base.utils import QueryTemplate, _quote_query_value
+
+URI_TEMPLATE_CACHE_SIZE = 256
+
+_expression_pattern = re.compile(r"\{([^{}]*)\}")
+_path_param_pattern = re.compile(r"\{([^{}:]+)(?::([^{}]+))?\}")
+_varspec_pattern = re.compile(r"([A-Za-z0-9_.%]+)(\*|:[1-9][0-9]{0,3})?")
+
+EXPLODE = "*"
+PATH_CONVERTOR = "path"
+
+# Characters of the reserved set, kept as is by ``+`` and ``#`` expansions
+_RESERVED = ":/?#[]@!$&'()*+,;=%"
+
+
+class _Operator(NamedTuple):
+    first: str
+    separator: str
+    named: bool
+    if_empty: str
+    allow_reserved: bool
+
+
+_OPERATORS = {
+    "": _Operator("", ",", named=False, if_empty="", allow_reserved=False),
+    "+": _Operator("", ",", named=False, if_empty="", allow_reserved=True),
+    "#": _Operator("#", ",", named=False, if_empty="", allow_reserved=True),
+    ".": _Operator(".", ".", named=False, if_empty="", allow_reserved=False),
+    "/": _Operator("/", "/", named=False, if_empty="", allow_reserved=False),
+    ";": _Operator(";", ";", named=True, if_empty="", allow_reserved=False),
+    "?": _Operator("?", "&", named=True, if_empty="=", allow_reserved=False),
+    "&": _Operator("&", "&", named=True, if_empty="=", allow_reserved=False),
+}
+
+
+class InvalidURITemplate(ValueError):
+    pass
+
+
+class _VarSpec(NamedTuple):
+    # Name as written in the template, name of the value to expand, and the
+    # modifiers of the variable
+    varname: str
+    key: str
+    explode: bool
+    prefix: Optional[int]
+
+
+class _Expression(NamedTuple):
+    operator: _Operator
+    variables: Tuple[_VarSpec, ...]
+
+
+def _parse_expression(expression: str) -> _Expression:
+    operator_name = expression[:1] if expression[:1] in _OPERATORS else ""
+    variables: List[_VarSpec] = []
+    for varspec in expression[len(operator_name) :].split(","):
+        match = _varspec_pattern.fullmatch(varspec)
+        if not match:
+            error_message = f"Invalid URI template expression {{{expression}}}"
+            raise InvalidURITemplate(error_message)
+
+        varname, modifier = match.groups()
+        variables.append(
+            _VarSpec(
+                varname,
+                urllib.parse.unquote(varname),
+                explode=modifier == EXPLODE,
+                prefix=int(modifier[1:]) if modifier and modifier != EXPLODE else None,
+            )
+        )
+
+    return _Expression(_OPERATORS[operator_name], tuple(variables))
+
+
+def _encode(value: Any, *, allow_reserved: bool) -> str:
+    if not allow_reserved:
+        return _quote_query_value(value)
+
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    return urllib.parse.quote(text, safe=_RESERVED)
+
+
+def _named(name: str, value: str, operator: _Operator) -> str:
+    return f"{name}={value}" if value else f"{name}{operator.if_empty}"
+
+
+def _expand_list(operator: _Operator, variable: _VarSpec, items: List[str]) -> str:
+    if variable.explode and operator.named:
+        return operator.separator.join(
+            _named(variable.varname, item, operator) for item in items
+        )
+
+    if variable.explode:
+        return operator.separator.join(items)
+
+    joined = ",".join(items)
+    return _named(variable.varname, joined, operator) if operator.named else joined
+
+
+def _expand_mapping(
+    operator: _Operator, variable: _VarSpec, pairs: List[Tuple[str, str]]
+) -> str:
+    if variable.explode:
+        return operator.separator.join(
+            _named(key, item, operator) if operator.named else f"{key}={item}"
+            for key, item in pairs
+        )
+
+    joined = ",".join(f"{key},{item}" for key, item in pairs)
+    return _named(variable.varname, joined, operator) if operator.named else joined
+
+
+def _expand_variable(
+    operator: _Operator, variable: _VarSpec, value: Any
+) -> Optional[str]:
+    allow_reserved = operator.allow_reserved
+
+    if isinstance(value, Mapping):
+        pairs = [
+            (
+                _encode(key, allow_reserved=allow_reserved),
+                _encode(item, allow_reserved=allow_reserved),
+            )
+            for key, item in value.items()
+            if item is not None
+        ]
+        return _expand_mapping(operator, variable, pairs) if pairs else None
+
+    if isinstance(value, (list, tuple)):
+        items = [
+            _encode(item, allow_reserved=allow_reserved)
+            for item in value
+            if item is not None
+        ]
+        return _expand_list(operator, variable, items) if items else None
+
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    if variable.prefix is not None:
+        text = text[: variable.prefix]
+
+    encoded = _encode(text, allow_reserved=allow_reserved)
+    return _named(variable.varname, encoded, operator) if operator.named else encoded
+
+
+class URITemplate:
+    """
+    RFC 6570 URI template, parsed once and expanded many times. All four
+    levels are supported: every operator, the ``*`` explode and the ``:n``
+    prefix modifiers, and lists and mappings as values.
+
+    Variables are looked up by their name as written in the template, with
+    percent-encoded characters decoded, so ``{?page%2Dsize}`` is expanded
+    from ``page-size``. Undefined variables, ``None`` and empty lists and
+    mappings, are left out.
+    """
+
+    __slots__ = ("_parts", "template", "variables")
+
+    def __init__(self: Self, template: str) -> None:
+        parts: List[Union[str, _Expression]] = []
+        position = 0
+        for match in _expression_pattern.finditer(template):
+            if match.start() > position:
+                parts.append(template[position : match.start()])
+            parts.append(_parse_expression(match.group(1)))
+            position = match.end()
+
+        if position < len(template):
+            parts.append(template[position:])
+
+        self._parts = tuple(parts)
+        self.template = template
+        self.variables = tuple(
+            variable.key
+            for part in parts
+            if isinstance(part, _Expression)
+            for variable in part.variables
+        )
+
+    def __copy__(self: Self) -> Self:
+        return self
+
+    def __deepcopy__(self: Self, _: Any) -> Self:
+        return self
+
+    def __repr__(self: Self) -> str:
+        return f"URITemplate({self.template!r})"
+
+    @staticmethod
+    def _expand_expression(
+        expression: _Expression, values: Mapping[str, Any]
+    ) -> Iterator[str]:
+        for variable in expression.variables:
+            value = values.get(variable.key)
+            if value is None:
+                continue
+
+            expanded = _expand_variable(expression.operator, variable, value)
+            if expanded is not None:
+                yield expanded
+
+    def expand(
+        self: Self, values: Optional[Mapping[str, Any]] = None, **kwargs: Any
+    ) -> str:
+        """
+        Expand the template.
+
+        Args:
+            values (Optional[Mapping[str, Any]]): Values of the variables
+            **kwargs (Any): More values, overriding those in ``values``
+
+        Returns:
+            str: The expanded URI
+        """
+        if kwargs:
+            values = {**(values or {}), **kwargs}
+        values = values or {}
+
+        expanded: List[str] = []
+        for part in self._parts:
+            if isinstance(part, str):
+                expanded.append(part)
+                continue
+
+            items = list(self._expand_expression(part, values))
+            if items:
+                operator = part.operator
+                expanded.append(operator.first + operator.separator.join(items))
+
+        return "".join(expanded)
+
+
+@lru_cache(maxsize=URI_TEMPLATE_CACHE_SIZE)
+def compile_uri_template(template: str) -> URITemplate:
+    """Return the parsed ``template``, parsing each template only once."""
+    return URITemplate(template)
+
+
+def expand_uri_template(
+    template: str, values: Optional[Mapping[str, Any]] = None, **kwargs: Any
+) -> str:
+    """
+    Expand an RFC 6570 URI template, such as the ``href`` of a templated
+    link. Templates are parsed once and cached, so expanding the same
+    template again only substitutes the values.
+    """
+    return compile_uri_template(template).expand(values, **kwargs)
+
+
+def _path_expression(match: "re.Match[str]") -> str:
+    # Path parameters can hold slashes, which simple expansion would encode
+    name, convertor = match.groups()
+    operator = "+" if convertor == PATH_CONVERTOR else ""
+    return f"{{{operator}{name}}}"
+
+
+def _query_varname(name: str) -> str:
+    # Query names are already percent-encoded, but ``-`` and ``~`` are not
+    # allowed in variable names
+    return name.replace("-", "%2D").replace("~", "%7E")
+
+
+@lru_cache(maxsize=URI_TEMPLATE_CACHE_SIZE)
+def route_uri_template(path: str, query: Optional[QueryTemplate] = None) -> str:
+    """
+    Build the RFC 6570 URI template of a route ``path``, such as
+    ``/items/{id_:int}``, with the templated
+    parameters of ``query`` as query variables and its constant parameters
+    as literals, e.g. ``/items/{id_}?size=20{&owner}``. Path convertors are
+    dropped, except ``path`` parameters which use reserved expansion.
+
+    The template is computed once per path and query.
+    """
+    template = _path_param_pattern.sub(_path_expression, path)
+    if query is None:
+        return template
+
+    constant = query.render(constant_only=True)
+    variables = ",".join(_query_varname(name) for name in query.variables)
+    if constant:
+        template = f"{template}?{constant}"
+
+    if variables:
+        operator = "&" if constant else "?"
+        template = f"{template}{{{operator}{variables}}}"
+
+    return template
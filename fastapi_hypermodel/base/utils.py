@@ -1,16 +1,27 @@
 import re
 import urllib
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
 from typing import (
+    AbstractSet,
     Any,
+    Callable,
     Dict,
+    Iterator,
+    List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
+from weakref import WeakKeyDictionary
 
 from starlette.applications import Starlette
 from starlette.routing import Route
+from typing_extensions import Self
 
 
 class InvalidAttribute(AttributeError):
@@ -54,13 +65,162 @@ def _get_value_for_key(obj: Any, key: str, default: Any) -> Any:
     return getattr(obj, key, default)
 
 
+QUOTE_CACHE_SIZE = 1024
+
+# Characters ``urllib.parse.quote`` leaves as they are in path parameters
+_safe_path_pattern = re.compile(r"[A-Za-z0-9_.~/-]*")
+
+
+@lru_cache(maxsize=QUOTE_CACHE_SIZE)
+def _quote_path_value(value: str) -> str:
+    return urllib.parse.quote(value)
+
+
 def _clean_attribute_value(value: Any) -> Union[str, Any]:
-    return urllib.parse.quote(value) if isinstance(value, str) else value
+    if not isinstance(value, str) or _safe_path_pattern.fullmatch(value):
+        return value
+
+    return _quote_path_value(value)
+
+
+_unreserved_pattern = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+def _quote_query_value(value: Any) -> str:
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    if _unreserved_pattern.fullmatch(text):
+        return text
+
+    return urllib.parse.quote(text, safe="")
+
+
+def _encode_query_pair(name: str, value: Any) -> Iterator[str]:
+    if value is None:
+        return
+
+    values = value if isinstance(value, (list, tuple)) else (value,)
+    for value_ in values:
+        yield f"{name}={_quote_query_value(value_)}"
+
+
+class QueryTemplate:
+    """
+    Query string built from parameter templates, e.g.
+    ``{"owner": "<id_>", "limit": 50}``. Names and constant values are
+    encoded once, when the template is compiled; only the values read from
+    the instance are encoded on render. ``None`` values are left out and
+    lists or tuples repeat the parameter.
+
+    Templates are immutable, so copies share the compiled parts.
+    """
+
+    __slots__ = ("_parts", "attributes")
+
+    def __init__(self: Self, query: Mapping[str, Any]) -> None:
+        parts: List[Union[str, Tuple[str, str]]] = []
+        attributes: List[str] = []
+        for name, value in query.items():
+            encoded_name = _quote_query_value(name)
+            attribute = _parse_template(value) if isinstance(value, str) else None
+            if attribute:
+                parts.append((encoded_name, attribute))
+                attributes.append(attribute)
+                continue
+
+            parts.extend(_encode_query_pair(encoded_name, value))
+
+        self._parts = tuple(parts)
+        self.attributes = tuple(attributes)
+
+    def __copy__(self: Self) -> Self:
+        return self
+
+    def __deepcopy__(self: Self, _: Any) -> Self:
+        return self
+
+    @property
+    def is_constant(self: Self) -> bool:
+        return not self.attributes
+
+    @property
+    def variables(self: Self) -> Tuple[str, ...]:
+        """Encoded names of the templated parameters, in declaration order."""
+        return tuple(part[0] for part in self._parts if isinstance(part, tuple))
+
+    @property
+    def pattern(self: Self) -> str:
+        """
+        Query string with the templated parameters left as templates, e.g.
+        ``owner=<id_>&limit=50``, telling templates apart once encoded.
+        """
+        return "&".join(
+            part if isinstance(part, str) else f"{part[0]}=<{part[1]}>"
+            for part in self._parts
+        )
+
+    def render(self: Self, values: Any = None, *, constant_only: bool = False) -> str:
+        """
+        Render the query string, without the leading ``?``.
+
+        Args:
+            values (Any): Mapping or object holding the templated attributes
+            constant_only (bool): Leave the templated parameters out
+
+        Returns:
+            str: The query string, empty if there are no parameters
+        """
+        rendered: List[str] = []
+        for part in self._parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+
+            if constant_only:
+                continue
+
+            name, attribute = part
+            rendered.extend(_encode_query_pair(name, _get_value(values, attribute)))
+
+        return "&".join(rendered)
+
+
+def encode_query(params: Mapping[str, Any]) -> str:
+    """
+    Encode query parameters, skipping ``None`` values and repeating the
+    parameters whose value is a list or a tuple. Values made of
+    unreserved characters only, such as numbers and pagination cursors, are
+    used as they are instead of being percent-encoded.
+
+    Args:
+        params (Mapping[str, Any]): Query parameters to encode
+
+    Returns:
+        str: Query string, without the leading ``?``
+    """
+    return "&".join(
+        pair
+        for name, value in params.items()
+        for pair in _encode_query_pair(_quote_query_value(name), value)
+    )
+
+
+def values_view(data_object: Any) -> Mapping[str, Any]:
+    """
+    Return a read-only mapping of the attributes of ``data_object``. The view
+    reads the instance attributes as they are, without copying them, so it
+    can be built once and shared by every hyperfield of a model. Mappings are
+    returned unchanged.
+    """
+    if isinstance(data_object, Mapping):
+        return data_object
+
+    return MappingProxyType(vars(data_object))
 
 
 def resolve_param_values(
     param_values_template: Optional[Mapping[str, Any]],
     data_object: Any,
+    safe_params: AbstractSet[str] = frozenset(),
 ) -> Dict[str, Any]:
     """
     Converts a dictionary of URL parameter substitution templates and a
@@ -74,6 +234,8 @@ def resolve_param_values(
         param_values_template (Dict[str, str]): Dictionary of URL parameter
             substitution templates data_object (Dict[str, Any]): Dictionary
             containing name-to-value mapping of all fields
+        safe_params (AbstractSet[str]): Parameters whose values never need
+            quoting, used as they are
 
     Returns:
         Dict[str, str]: Populated dictionary of URL parameters
@@ -87,17 +249,18 @@ def resolve_param_values(
         if not attribute:
             continue
 
-        value = extract_value_by_name(data_object, attribute)
-        param_values[name] = value
+        value = _extract_raw_value(data_object, attribute)
+        param_values[name] = (
+            value if name in safe_params else _clean_attribute_value(value)
+        )
 
     return param_values
 
 
-def extract_value_by_name(
+def _extract_raw_value(
     data_object: Any, attribute: str, default: Optional[Any] = None
-) -> Union[str, Any]:
-    if not isinstance(data_object, Mapping):
-        data_object = vars(data_object)
+) -> Any:
+    data_object = values_view(data_object)
 
     attribute_value = _get_value(data_object, attribute, default)
 
@@ -105,14 +268,187 @@ def extract_value_by_name(
         error_message = f"{attribute} is not a valid attribute of {data_object}"
         raise InvalidAttribute(error_message)
 
-    return _clean_attribute_value(attribute_value)
+    return attribute_value
 
 
-def get_route_from_app(app: Starlette, endpoint_function: str) -> Route:
+def extract_value_by_name(
+    data_object: Any, attribute: str, default: Optional[Any] = None
+) -> Union[str, Any]:
+    return _clean_attribute_value(_extract_raw_value(data_object, attribute, default))
+
+
+PARSE_URI_CACHE_SIZE = 512
+
+_CONVERSIONS: Mapping[str, Callable[[Any], str]] = {
+    "r": repr,
+    "s": str,
+    "a": ascii,
+}
+
+
+class _UriField(NamedTuple):
+    # Attribute of a ``{field}`` replacement, split on dots once, and how to
+    # format its value
+    attribute: str
+    keys: Tuple[str, ...]
+    conversion: Optional[str]
+    format_spec: str
+
+
+@lru_cache(maxsize=PARSE_URI_CACHE_SIZE)
+def _compile_uri(uri_template: str) -> Tuple[Union[str, _UriField], ...]:
+    parts: List[Union[str, _UriField]] = []
+    for literal, field, format_spec, conversion in Formatter().parse(uri_template):
+        if literal:
+            parts.append(literal)
+
+        if field is None:
+            continue
+
+        if not field:
+            error_message = "Empty Fields Cannot be Processed"
+            raise ValueError(error_message)
+
+        parts.append(
+            _UriField(field, tuple(field.split(".")), conversion, format_spec or "")
+        )
+
+    return tuple(parts)
+
+
+def uri_caches() -> Mapping[str, Any]:
+    """
+    Return the caches of this module exposing ``cache_info()``, by name, to
+    report in the diagnostics statistics.
+    """
+    return {"quote_path_value": _quote_path_value, "compile_uri": _compile_uri}
+
+
+def format_uri(data_object: Any, uri_template: str) -> str:
+    """
+    Replace the ``{field}`` placeholders of ``uri_template`` with the
+    attributes of ``data_object``, dotted names included. Templates are
+    parsed once and kept in a bounded cache, so formatting the same template
+    for many objects only reads and formats the values.
+
+    Args:
+        data_object (Any): Mapping or object holding the attributes
+        uri_template (str): Template using ``str.format`` placeholders
+
+    Returns:
+        str: The formatted URI
+
+    Raises:
+        InvalidAttribute: An attribute is missing or empty
+        ValueError: The template holds an empty ``{}`` placeholder
+    """
+    parts = _compile_uri(uri_template)
+    data_object = values_view(data_object)
+
+    formatted: List[str] = []
+    for part in parts:
+        if isinstance(part, str):
+            formatted.append(part)
+            continue
+
+        value = _get_value_for_keys(data_object, part.keys, None)
+        if not value:
+            error_message = (
+                f"{part.attribute} is not a valid attribute of {data_object}"
+            )
+            raise InvalidAttribute(error_message)
+
+        value = _clean_attribute_value(value)
+        if part.conversion:
+            value = _CONVERSIONS[part.conversion](value)
+        formatted.append(format(value, part.format_spec))
+
+    return "".join(formatted)
+
+
+# Number of routes looked up by endpoint name, of the lookups building the
+# route table first and of route tables built, reported by the diagnostics
+_route_lookups = 0  # pylint: disable=invalid-name
+_route_lookup_misses = 0  # pylint: disable=invalid-name
+_route_table_builds = 0  # pylint: disable=invalid-name
+
+
+class _RouteTable(NamedTuple):
+    # Number of routes of the app when the table was built, which changes
+    # when routes are added after it
+    size: int
+    routes: Mapping[str, Route]
+
+
+_route_tables: "WeakKeyDictionary[Starlette, _RouteTable]" = WeakKeyDictionary()
+
+
+def route_lookup_count() -> int:
+    return _route_lookups
+
+
+def route_lookup_miss_count() -> int:
+    return _route_lookup_misses
+
+
+def route_table_build_count() -> int:
+    return _route_table_builds
+
+
+def _build_route_table(app: Starlette) -> _RouteTable:
+    global _route_table_builds  # pylint: disable=global-statement
+    _route_table_builds += 1
+
+    routes: Dict[str, Route] = {}
     for route in app.routes:
-        if isinstance(route, Route) and route.name == endpoint_function:
-            break
-    else:
+        if isinstance(route, Route):
+            routes.setdefault(route.name, route)
+
+    table = _RouteTable(len(app.routes), routes)
+    _route_tables[app] = table
+    return table
+
+
+def _current_route_table(app: Starlette) -> Optional[_RouteTable]:
+    table = _route_tables.get(app)
+    if table is None or table.size != len(app.routes):
+        return None
+    return table
+
+
+def route_table(app: Starlette) -> Mapping[str, Route]:
+    """
+    Return the routes of ``app`` by name, the first route holding a name
+    winning, from the table ``get_route_from_app`` looks routes up in.
+    """
+    table = _current_route_table(app) or _build_route_table(app)
+    return table.routes
+
+
+def get_route_from_app(app: Starlette, endpoint_function: str) -> Route:
+    """
+    Return the first route of ``app`` named ``endpoint_function``.
+
+    Routes are looked up in a table of the app routes by name, built on the
+    first lookup and rebuilt when the number of routes changes.
+
+    Args:
+        app (Starlette): Application holding the route
+        endpoint_function (str): Name of the route
+
+    Returns:
+        Route: The route
+    """
+    global _route_lookups, _route_lookup_misses  # pylint: disable=global-statement
+    _route_lookups += 1
+
+    table = _current_route_table(app)
+    if table is None:
+        _route_lookup_misses += 1
+        table = _build_route_table(app)
+
+    route = table.routes.get(endpoint_function)
+    if route is None:
         error_message = f"No route found for endpoint {endpoint_function}"
         raise ValueError(error_message)
 
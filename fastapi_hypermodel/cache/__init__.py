@@ -0,0 +1,15 @@
+from .response_cache import (
+    CacheBackend,
+    CachedResponse,
+    LRUCacheBackend,
+    ResponseCacheMiddleware,
+    extract_link_targets,
+)
+
+__all__ = [
+    "CacheBackend",
+    "CachedResponse",
+    "LRUCacheBackend",
+    "ResponseCacheMiddleware",
+    "extract_link_targets",
+]
@@ -0,0 +1,300 @@
+import json
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    runtime_checkable,
+)
+from urllib.parse import urlsplit
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing_extensions import Self
+
+from fastapi_hypermodel.base import NOT_MODIFIED_HEADERS, etag_matches
+from fastapi_hypermodel.hal import HALResponse
+from fastapi_hypermodel.siren import SirenResponse
+
+RawHeaders = Sequence[Tuple[bytes, bytes]]
+
+CACHED_METHOD = "GET"
+SAFE_METHODS = frozenset({CACHED_METHOD, "HEAD", "OPTIONS", "TRACE"})
+DEFAULT_VARY_HEADERS = ("accept", "accept-encoding", "authorization")
+DEFAULT_MEDIA_TYPES = (HALResponse.media_type, SirenResponse.media_type)
+UNCACHEABLE_DIRECTIVES = ("no-store", "private")
+UNCACHEABLE_HEADERS = frozenset({"set-cookie"})
+
+# Stored headers repeated on the 304 responses to conditional requests
+NOT_MODIFIED_RAW_HEADERS = frozenset(
+    name.encode("latin-1") for name in NOT_MODIFIED_HEADERS
+)
+
+HTTP_SCOPE = "http"
+RESPONSE_START = "http.response.start"
+RESPONSE_BODY = "http.response.body"
+
+HREF_KEY = "href"
+# Start of an expression in a templated link, which has no target to tag
+TEMPLATE_EXPRESSION = "{"
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: RawHeaders
+    body: bytes
+    tags: FrozenSet[str]
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    def get(self: Self, key: str) -> Optional[CachedResponse]: ...
+
+    def set(self: Self, key: str, response: CachedResponse) -> None: ...
+
+    def invalidate(self: Self, tag: str) -> int: ...
+
+    def clear(self: Self) -> None: ...
+
+
+class LRUCacheBackend:
+    """
+    In-process cache keeping the ``max_entries`` most recently used responses,
+    with an index from tags to the keys tagged with them.
+    """
+
+    def __init__(self: Self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            error_message = "max_entries must be a positive integer"
+            raise ValueError(error_message)
+
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self: Self) -> int:
+        return len(self._entries)
+
+    def get(self: Self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set(self: Self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = response
+            for tag in response.tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            # A single entry is added at a time, so a single one overflows
+            if len(self._entries) > self.max_entries:
+                oldest, oldest_response = self._entries.popitem(last=False)
+                self._untag(oldest, oldest_response)
+
+    def invalidate(self: Self, tag: str) -> int:
+        with self._lock:
+            keys = self._tags.pop(tag, set())
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def clear(self: Self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def _discard(self: Self, key: str) -> None:
+        response = self._entries.pop(key, None)
+        if response is not None:
+            self._untag(key, response)
+
+    def _untag(self: Self, key: str, response: CachedResponse) -> None:
+        for tag in response.tags:
+            keys = self._tags.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+
+def _collect_hrefs(content: Any, hrefs: Set[str]) -> None:
+    if isinstance(content, list):
+        for element in content:
+            _collect_hrefs(element, hrefs)
+        return
+
+    if not isinstance(content, dict):
+        return
+
+    for key, value in content.items():
+        if (
+            key == HREF_KEY
+            and isinstance(value, str)
+            and TEMPLATE_EXPRESSION not in value
+        ):
+            hrefs.add(urlsplit(value).path)
+            continue
+        _collect_hrefs(value, hrefs)
+
+
+def extract_link_targets(body: bytes) -> FrozenSet[str]:
+    """
+    Return the paths of every non-templated ``href`` in a rendered hypermedia
+    document, including those of embedded resources.
+    """
+    try:
+        content = json.loads(body)
+    except ValueError:
+        return frozenset()
+
+    hrefs: Set[str] = set()
+    _collect_hrefs(content, hrefs)
+    return frozenset(hrefs)
+
+
+class ResponseCacheMiddleware:
+    """
+    Cache rendered hypermedia responses to ``GET`` requests.
+
+    Entries are keyed by path, query string and the values of
+    ``vary_headers``, and tagged with the request path and every link target
+    in the document. A successful request with an unsafe method, such as the
+    ``PUT`` an ``update`` link points to, invalidates all entries tagged with
+    its path, including collections embedding the modified resource.
+    """
+
+    def __init__(
+        self: Self,
+        app: ASGIApp,
+        backend: Optional[CacheBackend] = None,
+        vary_headers: Iterable[str] = DEFAULT_VARY_HEADERS,
+        media_types: Iterable[str] = DEFAULT_MEDIA_TYPES,
+    ) -> None:
+        self.app = app
+        self.backend = backend if backend is not None else LRUCacheBackend()
+        self.vary_headers = tuple(header.lower() for header in vary_headers)
+        self.media_types = frozenset(media_types)
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != HTTP_SCOPE:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method == CACHED_METHOD:
+            await self._serve_cached(scope, receive, send)
+            return
+
+        if method in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        await self._serve_invalidating(scope, receive, send)
+
+    def _cache_key(self: Self, scope: Scope) -> str:
+        headers = Headers(scope=scope)
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        vary = "|".join(headers.get(name, "") for name in self.vary_headers)
+        return f"{scope['path']}?{query_string}|{vary}"
+
+    def _is_cacheable(self: Self, status: int, headers: RawHeaders) -> bool:
+        if status != HTTPStatus.OK:
+            return False
+
+        response_headers = Headers(raw=list(headers))
+        if any(header in response_headers for header in UNCACHEABLE_HEADERS):
+            return False
+
+        cache_control = response_headers.get("cache-control", "").lower()
+        if any(directive in cache_control for directive in UNCACHEABLE_DIRECTIVES):
+            return False
+
+        media_type, *_ = response_headers.get("content-type", "").partition(";")
+        return media_type.strip() in self.media_types
+
+    async def _serve_cached(
+        self: Self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        key = self._cache_key(scope)
+        cached = self.backend.get(key)
+        if cached is not None:
+            await self._replay(cached, scope, send)
+            return
+
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == RESPONSE_START:
+                start.update(message)
+            elif message["type"] == RESPONSE_BODY:
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self._store(key, scope, start, b"".join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _store(
+        self: Self, key: str, scope: Scope, start: Dict[str, Any], body: bytes
+    ) -> None:
+        status = start.get("status", HTTPStatus.INTERNAL_SERVER_ERROR)
+        headers: RawHeaders = start.get("headers", [])
+        if not self._is_cacheable(status, headers):
+            return
+
+        tags = extract_link_targets(body) | {scope["path"]}
+        self.backend.set(key, CachedResponse(status, list(headers), body, tags))
+
+    @staticmethod
+    async def _replay(cached: CachedResponse, scope: Scope, send: Send) -> None:
+        response_headers = Headers(raw=list(cached.headers))
+        etag = response_headers.get("etag")
+        if_none_match = Headers(scope=scope).get("if-none-match")
+
+        if etag and if_none_match and etag_matches(if_none_match, etag):
+            await send({
+                "type": RESPONSE_START,
+                "status": HTTPStatus.NOT_MODIFIED,
+                "headers": [
+                    (name, value)
+                    for name, value in cached.headers
+                    if name.lower() in NOT_MODIFIED_RAW_HEADERS
+                ],
+            })
+            await send({"type": RESPONSE_BODY, "body": b""})
+            return
+
+        await send({
+            "type": RESPONSE_START,
+            "status": cached.status,
+            "headers": list(cached.headers),
+        })
+        await send({"type": RESPONSE_BODY, "body": cached.body})
+
+    async def _serve_invalidating(
+        self: Self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == RESPONSE_START:
+                status = message.get("status", HTTPStatus.INTERNAL_SERVER_ERROR)
+                if status < HTTPStatus.BAD_REQUEST:
+                    self.backend.invalidate(scope["path"])
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,34 @@
+from .router import create_profile_router, create_stats_router
+from .stats import (
+    BUILTIN_CACHES,
+    METRIC_COUNTER,
+    METRIC_GAUGE,
+    PROMETHEUS_MEDIA_TYPE,
+    HasCacheInfo,
+    Sample,
+    StatsProvider,
+    StatsRegistry,
+    aggregator_samples,
+    cache_samples,
+    route_samples,
+    slow_render_samples,
+    stats_registry,
+)
+
+__all__ = [
+    "BUILTIN_CACHES",
+    "METRIC_COUNTER",
+    "METRIC_GAUGE",
+    "PROMETHEUS_MEDIA_TYPE",
+    "HasCacheInfo",
+    "Sample",
+    "StatsProvider",
+    "StatsRegistry",
+    "aggregator_samples",
+    "cache_samples",
+    "create_profile_router",
+    "create_stats_router",
+    "route_samples",
+    "slow_render_samples",
+    "stats_registry",
+]
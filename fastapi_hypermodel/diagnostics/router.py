@@ -0,0 +1,94 @@
+import hmac
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from fastapi_hypermodel.instrumentation import DEFAULT_PROFILE_HEADER, ProfileStore
+
+from .stats import PROMETHEUS_MEDIA_TYPE, StatsRegistry, stats_registry
+
+PROMETHEUS_FORMAT = "prometheus"
+PSTATS_FORMAT = "pstats"
+
+
+def create_stats_router(
+    registry: Optional[StatsRegistry] = None,
+    prefix: str = "/_hypermodel",
+) -> APIRouter:
+    """
+    Build a router serving the samples of ``registry`` at ``{prefix}/stats``,
+    as JSON or, with ``?format=prometheus``, in the Prometheus text
+    exposition format. The route is left out of the OpenAPI schema.
+
+    Args:
+        registry (Optional[StatsRegistry]): Registry reported, the default
+            ``stats_registry`` if None
+        prefix (str): Path the router is mounted at
+
+    Returns:
+        APIRouter: The router, to include in the app
+    """
+    registry = registry if registry is not None else stats_registry
+    router = APIRouter(prefix=prefix, include_in_schema=False)
+
+    @router.get("/stats")
+    def read_hypermodel_stats(
+        output_format: str = Query("json", alias="format"),
+    ) -> Response:
+        if output_format == PROMETHEUS_FORMAT:
+            return Response(registry.to_prometheus(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+        return JSONResponse(registry.to_json())
+
+    return router
+
+
+def create_profile_router(
+    store: ProfileStore,
+    secret: str,
+    header: str = DEFAULT_PROFILE_HEADER,
+    prefix: str = "/_hypermodel",
+) -> APIRouter:
+    """
+    Build a router serving the profiles of ``store`` at
+    ``{prefix}/profiles/{id_}``, to the requests carrying ``secret`` in the
+    ``header`` request header, as for ``ProfilingMiddleware``. Profiles are
+    served as their text report or, with ``?format=pstats``, as a file to
+    load with ``pstats.Stats``. The route is left out of the OpenAPI schema.
+
+    Args:
+        store (ProfileStore): Store of the profiling middleware
+        secret (str): Secret of the profiling middleware
+        header (str): Request header holding the secret
+        prefix (str): Path the router is mounted at
+
+    Returns:
+        APIRouter: The router, to include in the app
+    """
+    expected = secret.encode("latin-1")
+    router = APIRouter(prefix=prefix, include_in_schema=False)
+
+    @router.get("/profiles/{id_}")
+    def read_hypermodel_profile(
+        id_: str,
+        request: Request,
+        output_format: str = Query("text", alias="format"),
+    ) -> Response:
+        # Unauthorized requests cannot tell whether the profile exists
+        value = request.headers.get(header, "").encode("latin-1")
+        profile = store.get(id_) if hmac.compare_digest(value, expected) else None
+        if profile is None:
+            raise HTTPException(status_code=HTTPStatus.NOT_FOUND)
+
+        if output_format == PSTATS_FORMAT:
+            return Response(
+                profile.data,
+                media_type="application/octet-stream",
+                headers={"content-disposition": f'attachment; filename="{id_}.pstats"'},
+            )
+
+        return PlainTextResponse(profile.report)
+
+    return router
@@ -0,0 +1,251 @@
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Protocol,
+    runtime_checkable,
+)
+
+from typing_extensions import Self
+
+from fastapi_hypermodel.base import (
+    compile_uri_template,
+    hypermodel_caches,
+    route_lookup_count,
+    route_lookup_miss_count,
+    route_table_build_count,
+    route_uri_template,
+    uri_caches,
+)
+from fastapi_hypermodel.instrumentation import InMemoryAggregator, SlowRenderDetector
+
+METRIC_COUNTER = "counter"
+METRIC_GAUGE = "gauge"
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Sample(NamedTuple):
+    """
+    Value of a metric, identified by its labels.
+
+    Attributes:
+        metric: Name of the metric, in the Prometheus naming conventions
+        labels: Labels telling apart the samples of the metric
+        value: Current value of the metric
+        kind: Prometheus type of the metric, ``METRIC_COUNTER`` or ``METRIC_GAUGE``
+    """
+
+    metric: str
+    labels: Mapping[str, str]
+    value: float
+    kind: str = METRIC_COUNTER
+
+
+StatsProvider = Callable[[], Iterable[Sample]]
+
+
+class CacheInfo(Protocol):
+    @property
+    def hits(self: Self) -> int: ...
+
+    @property
+    def misses(self: Self) -> int: ...
+
+    @property
+    def currsize(self: Self) -> int: ...
+
+
+@runtime_checkable
+class HasCacheInfo(Protocol):
+    def cache_info(self: Self) -> CacheInfo: ...
+
+
+BUILTIN_CACHES: Mapping[str, HasCacheInfo] = {
+    **uri_caches(),
+    "compile_uri_template": compile_uri_template,
+    "route_uri_template": route_uri_template,
+    **hypermodel_caches(),
+}
+
+
+def cache_samples(caches: Mapping[str, HasCacheInfo]) -> StatsProvider:
+    """
+    Report the hits, misses, hit ratio and size of caches exposing a
+    ``cache_info()`` method, such as the functions decorated with
+    ``functools.lru_cache``.
+    """
+
+    def collect() -> Iterable[Sample]:
+        for name, cache in caches.items():
+            info = cache.cache_info()
+            labels = {"cache": name}
+            lookups = info.hits + info.misses
+            yield Sample("hypermodel_cache_hits_total", labels, info.hits)
+            yield Sample("hypermodel_cache_misses_total", labels, info.misses)
+            yield Sample(
+                "hypermodel_cache_hit_ratio",
+                labels,
+                info.hits / lookups if lookups else 0.0,
+                METRIC_GAUGE,
+            )
+            yield Sample("hypermodel_cache_size", labels, info.currsize, METRIC_GAUGE)
+
+    return collect
+
+
+def route_samples() -> Iterable[Sample]:
+    """
+    Report the number of routes looked up by endpoint name, the lookups
+    served by the route table built for the app and the ones building it
+    first with their hit ratio, and the number of route tables built.
+    """
+    lookups = route_lookup_count()
+    misses = route_lookup_miss_count()
+    yield Sample("hypermodel_route_lookups_total", {}, lookups)
+    yield Sample("hypermodel_route_lookup_hits_total", {}, lookups - misses)
+    yield Sample("hypermodel_route_lookup_misses_total", {}, misses)
+    yield Sample(
+        "hypermodel_route_lookup_hit_ratio",
+        {},
+        (lookups - misses) / lookups if lookups else 0.0,
+        METRIC_GAUGE,
+    )
+    yield Sample("hypermodel_route_table_builds_total", {}, route_table_build_count())
+
+
+def aggregator_samples(aggregator: InMemoryAggregator) -> StatsProvider:
+    """
+    Report the calls and time of each phase aggregated by ``aggregator``, by
+    model class and, for hyperfields and conditions, by endpoint. The
+    condition phase counts the condition evaluations.
+    """
+
+    def collect() -> Iterable[Sample]:
+        for stats in aggregator.stats():
+            labels = {"phase": stats.phase, "model": stats.model}
+            if stats.name is not None:
+                labels["endpoint"] = stats.name
+            yield Sample("hypermodel_phase_calls_total", labels, stats.calls)
+            yield Sample("hypermodel_phase_seconds_total", labels, stats.total)
+            yield Sample(
+                "hypermodel_phase_max_seconds", labels, stats.maximum, METRIC_GAUGE
+            )
+
+    return collect
+
+
+def slow_render_samples(detector: SlowRenderDetector) -> StatsProvider:
+    """
+    Report the renders seen by ``detector``, the ones sampled with the
+    fraction of renders they make up, and the slow renders logged.
+    """
+
+    def collect() -> Iterable[Sample]:
+        renders = detector.renders
+        sampled = detector.sampled_renders
+        yield Sample("hypermodel_renders_total", {}, renders)
+        yield Sample("hypermodel_sampled_renders_total", {}, sampled)
+        yield Sample(
+            "hypermodel_render_sample_ratio",
+            {},
+            sampled / renders if renders else 0.0,
+            METRIC_GAUGE,
+        )
+        yield Sample("hypermodel_slow_renders_total", {}, detector.slow_renders)
+
+    return collect
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_sample(sample: Sample) -> str:
+    if not sample.labels:
+        return f"{sample.metric} {sample.value}"
+
+    labels = ",".join(
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in sample.labels.items()
+    )
+    return f"{sample.metric}{{{labels}}} {sample.value}"
+
+
+class StatsRegistry:
+    """
+    In-process registry of the statistics providers reported by the
+    diagnostics router, each a callable returning the current samples:
+
+    ```python
+    aggregator = InMemoryAggregator()
+    add_instrument(aggregator)
+    stats_registry.register("render", aggregator_samples(aggregator))
+    ```
+    """
+
+    def __init__(self: Self) -> None:
+        self._providers: Dict[str, StatsProvider] = {}
+        self._lock = threading.Lock()
+
+    def register(self: Self, name: str, provider: StatsProvider) -> None:
+        """Report the samples of ``provider`` under ``name``, replacing any."""
+        with self._lock:
+            self._providers[name] = provider
+
+    def unregister(self: Self, name: str) -> None:
+        with self._lock:
+            self._providers.pop(name, None)
+
+    def collect(self: Self) -> Dict[str, List[Sample]]:
+        """
+        Return the current samples of every provider.
+
+        Returns:
+            Dict[str, List[Sample]]: The samples, by provider name
+        """
+        with self._lock:
+            providers = dict(self._providers)
+
+        return {name: list(provider()) for name, provider in providers.items()}
+
+    def to_json(self: Self) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            name: [
+                {
+                    "metric": sample.metric,
+                    "labels": dict(sample.labels),
+                    "value": sample.value,
+                }
+                for sample in samples
+            ]
+            for name, samples in self.collect().items()
+        }
+
+    def to_prometheus(self: Self) -> str:
+        """
+        Return the samples in the Prometheus text exposition format, the
+        samples of each metric grouped under its type.
+        """
+        metrics: Dict[str, List[Sample]] = {}
+        for samples in self.collect().values():
+            for sample in samples:
+                metrics.setdefault(sample.metric, []).append(sample)
+
+        lines: List[str] = []
+        for metric, samples in metrics.items():
+            first_sample, *_ = samples
+            lines.append(f"# TYPE {metric} {first_sample.kind}")
+            lines.extend(_format_sample(sample) for sample in samples)
+
+        return "".join(f"{line}\n" for line in lines)
+
+
+stats_registry = StatsRegistry()
+stats_registry.register("caches", cache_samples(BUILTIN_CACHES))
+stats_registry.register("routes", route_samples)
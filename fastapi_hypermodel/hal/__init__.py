@@ -1,4 +1,5 @@
 from .hal_hypermodel import FrozenDict, HALFor, HALForType, HALHyperModel, HALLinks
+from .hal_page import HALPage
 from .hal_response import HALResponse, get_hal_link
 
 __all__ = [
@@ -7,6 +8,7 @@ __all__ = [
     "HALForType",
     "HALHyperModel",
     "HALLinks",
+    "HALPage",
     "HALResponse",
     "get_hal_link",
 ]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import copy
+from time import perf_counter
 from typing import (
     Any,
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
+    Iterable,
     Mapping,
     Optional,
     Sequence,
@@ -30,11 +34,18 @@ from typing_extensions import Annotated, Self
 
 from fastapi_hypermodel.base import (
     AbstractHyperField,
+    CompiledLink,
+    ConstantCache,
     HasName,
     HyperModel,
+    QueryTemplate,
     UrlType,
-    get_route_from_app,
+    construct_unvalidated,
+    get_embedded_fields,
+    get_selection,
+    values_view,
 )
+from fastapi_hypermodel.instrumentation import hooks
 
 
 class HALForType(BaseModel):
@@ -68,6 +79,7 @@ class HALFor(HALForType, AbstractHyperField[HALForType]):
     # pylint: disable=too-many-instance-attributes
     _endpoint: str = PrivateAttr()
     _param_values: Mapping[str, str] = PrivateAttr()
+    _safe_params: FrozenSet[str] = PrivateAttr()
     _condition: Optional[Callable[[Mapping[str, Any]], bool]] = PrivateAttr()
     _templated: Optional[bool] = PrivateAttr()
     # For details on the folllowing fields, check https://datatracker.ietf.org/doc/html/draft-kelly-json-hal
@@ -77,6 +89,8 @@ class HALFor(HALForType, AbstractHyperField[HALForType]):
     _hreflang: Optional[str] = PrivateAttr()
     _profile: Optional[str] = PrivateAttr()
     _deprecation: Optional[str] = PrivateAttr()
+    _query: Optional[QueryTemplate] = PrivateAttr()
+    _constant: ConstantCache[HALForType] = PrivateAttr(default_factory=ConstantCache)
 
     def __init__(
         self: Self,
@@ -90,12 +104,16 @@ class HALFor(HALForType, AbstractHyperField[HALForType]):
         hreflang: Optional[str] = None,
         profile: Optional[str] = None,
         deprecation: Optional[str] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        safe_params: Optional[Iterable[str]] = None,
     ) -> None:
         super().__init__()
         self._endpoint = (
             endpoint.__name__ if isinstance(endpoint, HasName) else endpoint
         )
         self._param_values = param_values or {}
+        self._safe_params = frozenset(safe_params or ())
+        self._query = QueryTemplate(query) if query else None
         self._condition = condition
         self._templated = templated
         self._title = title
@@ -105,32 +123,59 @@ class HALFor(HALForType, AbstractHyperField[HALForType]):
         self._profile = profile
         self._deprecation = deprecation
 
-    def __call__(
-        self: Self, app: Optional[Starlette], values: Mapping[str, Any]
-    ) -> Optional[HALForType]:
-        if app is None:
-            return None
+    def __copy__(self: Self) -> Self:
+        return self
 
-        if self._condition and not self._condition(values):
-            return None
+    def __deepcopy__(self: Self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        return self
 
-        route = get_route_from_app(app, self._endpoint)
+    def compile(self: Self, app: Starlette) -> CompiledLink:
+        return self._compile_route(
+            app,
+            self._endpoint,
+            self._param_values,
+            templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+        )
 
-        uri_path = self._get_uri_path(
+    def load(self: Self, app: Starlette, link: Optional[CompiledLink]) -> None:
+        self._load_route(
+            app,
+            link,
+            self._build_link,
+            constant=self._constant,
+            endpoint=self._endpoint,
+            params=self._param_values,
             templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+        )
+
+    def __call__(
+        self: Self, app: Optional[Starlette], values: Mapping[str, Any]
+    ) -> Optional[HALForType]:
+        return self._resolve_route(
+            app,
+            values,
+            self._build_link,
+            constant=self._constant,
             endpoint=self._endpoint,
-            app=app,
-            values=values,
             params=self._param_values,
-            route=route,
+            templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+            safe_params=self._safe_params,
         )
 
-        return HALForType(
-            href=uri_path,
+    def _build_link(self: Self, href: UrlType) -> HALForType:
+        return construct_unvalidated(
+            HALForType,
+            href=href,
             templated=self._templated,
             title=self._title,
             name=self._name,
-            type_=self._type,  # type: ignore
+            type_=self._type,
             hreflang=self._hreflang,
             profile=self._profile,
             deprecation=self._deprecation,
@@ -141,6 +186,13 @@ HALLinkType = Union[HALFor, Sequence[HALFor]]
 
 
 class FrozenDict(frozendict):  # type: ignore
+    def __deepcopy__(self: Self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        copied = {key: copy.deepcopy(value, memo) for key, value in self.items()}
+        if all(copied[key] is value for key, value in self.items()):
+            return self
+
+        return type(self)(copied)
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls: Type[Self],
@@ -188,7 +240,10 @@ class HALHyperModel(HyperModel):
 
     @model_validator(mode="after")
     def add_links(self: Self) -> Self:
+        start = perf_counter() if hooks.instruments else None
         links_key = "_links"
+        selection = get_selection()
+        values = values_view(self)
 
         validated_links: Dict[str, HALLinkType] = {}
         for name, value in self:
@@ -199,7 +254,10 @@ class HALHyperModel(HyperModel):
 
             links = cast(Mapping[str, HALLinkType], value)
             for link_name, link_ in links.items():
-                valid_links = self._validate_factory(link_, vars(self))
+                if selection and not selection.includes_link(link_name):
+                    continue
+
+                valid_links = self._validate_factory(link_, values)
 
                 if not valid_links:
                     continue
@@ -213,28 +271,81 @@ class HALHyperModel(HyperModel):
 
             self.links = FrozenDict(validated_links)
 
+        if start is not None:
+            hooks.emit(hooks.PHASE_LINKS, type(self).__name__, None, start)
+
         return self
 
+    @classmethod
+    def as_reference(
+        cls: Type[Self],
+        values: Mapping[str, Any],
+        rel: str,  # noqa: ARG003
+    ) -> Optional[HALForType]:
+        links = cls.model_fields["links"].default
+        self_link = links.get("self") if isinstance(links, Mapping) else None
+
+        if isinstance(self_link, HALFor):
+            return self_link(cls._app, values)
+
+        return self_link if isinstance(self_link, HALForType) else None
+
     @model_validator(mode="after")
     def add_hypermodels_to_embedded(self: Self) -> Self:
+        start = perf_counter() if hooks.instruments else None
         embedded: Dict[str, Union[Self, Sequence[Self]]] = {}
+        references: Dict[str, HALLinkType] = {}
+        embedded_fields = get_embedded_fields(type(self))
         for name, field in self:
             value: Sequence[Union[Any, Self]] = (
                 field if isinstance(field, Sequence) else [field]
             )
 
+            key = self.model_fields[name].alias or name
+
+            if (
+                value
+                and name in embedded_fields
+                and all(isinstance(element, HALForType) for element in value)
+            ):
+                references[key] = field
+                delattr(self, name)
+                continue
+
             if not all(isinstance(element, HALHyperModel) for element in value):
                 continue
 
-            key = self.model_fields[name].alias or name
             embedded[key] = value
             delattr(self, name)
 
+        if references:
+            self.links = FrozenDict({**(self.links or {}), **references})
+
         self.embedded = embedded
 
         if not self.embedded:
             delattr(self, "embedded")
 
+        if start is not None:
+            hooks.emit(hooks.PHASE_EMBEDDED, type(self).__name__, None, start)
+
+        return self
+
+    @model_validator(mode="after")
+    def apply_field_selection(self: Self) -> Self:
+        selection = get_selection()
+        if selection is None or selection.fields is None:
+            return self
+
+        reserved_fields = {"links", "embedded"}
+        for name, _ in self:
+            if name in reserved_fields or self.model_fields[name].exclude:
+                continue
+
+            alias = self.model_fields[name].alias or name
+            if not selection.includes_field(name, alias):
+                delattr(self, name)
+
         return self
 
     @field_serializer("links")
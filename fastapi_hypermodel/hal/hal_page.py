@@ -0,0 +1,46 @@
+from typing import (
+    Dict,
+    Generic,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from pydantic import ConfigDict, model_validator
+from typing_extensions import Self
+
+from fastapi_hypermodel.base import PageModel
+
+from .hal_hypermodel import FrozenDict, HALForType, HALHyperModel, HALLinkType
+
+T = TypeVar("T")
+
+
+class HALPage(HALHyperModel, PageModel, Generic[T]):
+    """
+    A page of a collection, embedding its items and linking to the ``first``,
+    ``prev``, ``next`` and ``last`` pages. The pagination links are built from
+    the ``self`` link of the collection by adding the cursor and page size to
+    its query string.
+    """
+
+    items: Sequence[T]
+
+    model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
+
+    @model_validator(mode="after")
+    def add_page_links(self: Self) -> Self:
+        links: Dict[str, Union[HALLinkType, HALForType]] = dict(self.links or {})
+        self_link = links.get("self")
+        if not isinstance(self_link, HALForType):
+            return self
+
+        for name, cursor in self.page_cursors().items():
+            links[name] = HALForType(href=self.page_href(self_link.href, cursor))
+
+        links["self"] = self_link.model_copy(
+            update={"href": self.page_href(self_link.href, self.cursor)}
+        )
+        self.links = FrozenDict(links)
+
+        return self
@@ -10,16 +10,17 @@ from typing import (
     Union,
 )
 
-from starlette.responses import JSONResponse
 from typing_extensions import Self
 
+from fastapi_hypermodel.base import HypermediaResponse
+
 from .hal_hypermodel import HALForType
 
 EmbeddedRawType = Union[Mapping[str, Union[Sequence[Any], Any]], Any]
 LinksRawType = Union[Mapping[str, Union[Any, Sequence[Any]]], Any]
 
 
-class HALResponse(JSONResponse):
+class HALResponse(HypermediaResponse):
     media_type = "application/hal+json"
 
     @staticmethod
@@ -157,10 +158,6 @@ class HALResponse(JSONResponse):
             for element in embedded_:
                 self._validate(element, parent_curies=combined_curies)
 
-    def render(self: Self, content: Any) -> bytes:
-        self._validate(content)
-        return super().render(content)
-
 
 def get_hal_link(response: Any, link_name: str) -> Optional[HALForType]:
     links = response.get("_links", {})
@@ -0,0 +1,72 @@
+from .aggregator import InMemoryAggregator, PhaseStats
+from .hooks import (
+    PHASE_ACTIONS,
+    PHASE_CONDITION,
+    PHASE_EMBEDDED,
+    PHASE_ENCODING,
+    PHASE_HYPERFIELD,
+    PHASE_HYPERMEDIA,
+    PHASE_LINKS,
+    PHASE_RESPONSE_VALIDATION,
+    PHASE_VALIDATION,
+    Event,
+    Instrument,
+    add_instrument,
+    instrumented,
+    remove_instrument,
+)
+from .profiling import (
+    DEFAULT_PROFILE_HEADER,
+    DEFAULT_PROFILE_LIMIT,
+    DEFAULT_PROFILED_MODULES,
+    PROFILE_ID_HEADER,
+    Profile,
+    ProfileStore,
+    ProfilingMiddleware,
+)
+from .server_timing import (
+    SERVER_TIMING_DESCRIPTIONS,
+    SERVER_TIMING_METRICS,
+    ServerTimingMiddleware,
+    format_server_timing,
+)
+from .slow_render import (
+    DEFAULT_SLOW_RENDER_THRESHOLD,
+    SlowRender,
+    SlowRenderDetector,
+    slow_render_logger,
+)
+
+__all__ = [
+    "DEFAULT_PROFILED_MODULES",
+    "DEFAULT_PROFILE_HEADER",
+    "DEFAULT_PROFILE_LIMIT",
+    "DEFAULT_SLOW_RENDER_THRESHOLD",
+    "PHASE_ACTIONS",
+    "PHASE_CONDITION",
+    "PHASE_EMBEDDED",
+    "PHASE_ENCODING",
+    "PHASE_HYPERFIELD",
+    "PHASE_HYPERMEDIA",
+    "PHASE_LINKS",
+    "PHASE_RESPONSE_VALIDATION",
+    "PHASE_VALIDATION",
+    "PROFILE_ID_HEADER",
+    "SERVER_TIMING_DESCRIPTIONS",
+    "SERVER_TIMING_METRICS",
+    "Event",
+    "InMemoryAggregator",
+    "Instrument",
+    "PhaseStats",
+    "Profile",
+    "ProfileStore",
+    "ProfilingMiddleware",
+    "ServerTimingMiddleware",
+    "SlowRender",
+    "SlowRenderDetector",
+    "add_instrument",
+    "format_server_timing",
+    "instrumented",
+    "remove_instrument",
+    "slow_render_logger",
+]
@@ -0,0 +1,105 @@
+import threading
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from typing_extensions import Self
+
+from .hooks import Event
+
+StatsKey = Tuple[str, str, Optional[str]]
+
+
+class PhaseStats(NamedTuple):
+    """
+    Aggregated time of a phase, for a model and, for hyperfields, an
+    endpoint.
+    """
+
+    phase: str
+    model: str
+    name: Optional[str]
+    calls: int
+    total: float
+    minimum: float
+    maximum: float
+
+    @property
+    def mean(self: Self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class InMemoryAggregator:
+    """
+    Instrument aggregating the events in process, by phase, model and
+    hyperfield endpoint, and queried at runtime:
+
+    ```python
+    aggregator = InMemoryAggregator()
+    add_instrument(aggregator)
+
+    slowest_links = aggregator.stats(phase=PHASE_HYPERFIELD)[:10]
+    ```
+    """
+
+    def __init__(self: Self) -> None:
+        self._stats: Dict[StatsKey, PhaseStats] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self: Self) -> int:
+        return len(self._stats)
+
+    def record(self: Self, event: Event) -> None:
+        key = (event.phase, event.model, event.name)
+        duration = event.duration
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = PhaseStats(
+                    *key, calls=1, total=duration, minimum=duration, maximum=duration
+                )
+                return
+
+            self._stats[key] = stats._replace(
+                calls=stats.calls + 1,
+                total=stats.total + duration,
+                minimum=min(stats.minimum, duration),
+                maximum=max(stats.maximum, duration),
+            )
+
+    def stats(
+        self: Self,
+        phase: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> List[PhaseStats]:
+        """
+        Return the aggregated phases, the longest in total first.
+
+        Args:
+            phase (Optional[str]): Only return the stats of this phase
+            model (Optional[str]): Only return the stats of this model
+
+        Returns:
+            List[PhaseStats]: The stats matching the filters
+        """
+        with self._lock:
+            stats = list(self._stats.values())
+
+        return sorted(
+            (
+                stats_
+                for stats_ in stats
+                if (phase is None or stats_.phase == phase)
+                and (model is None or stats_.model == model)
+            ),
+            key=lambda stats_: stats_.total,
+            reverse=True,
+        )
+
+    def reset(self: Self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,100 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import (
+    Iterator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    runtime_checkable,
+)
+
+from typing_extensions import Self
+
+# Validating a response model, nested hypermodels included, reported for the
+# outermost hypermodel only
+PHASE_VALIDATION = "validation"
+# Building the hyperfields of a model
+PHASE_HYPERMEDIA = "hypermedia"
+# Resolving a single hyperfield, named after its endpoint
+PHASE_HYPERFIELD = "hyperfield"
+# Evaluating the condition of a hyperfield, named after its endpoint
+PHASE_CONDITION = "condition"
+# Building the links and the actions of HAL and Siren models
+PHASE_LINKS = "links"
+PHASE_ACTIONS = "actions"
+# Moving the nested hypermodels to the embedded resources or entities
+PHASE_EMBEDDED = "embedded"
+# Checking the rendered content follows the format, then encoding it
+PHASE_RESPONSE_VALIDATION = "response_validation"
+PHASE_ENCODING = "encoding"
+
+
+class Event(NamedTuple):
+    """
+    Time spent in a phase of the rendering.
+
+    Attributes:
+        phase: Phase measured, one of the ``PHASE_*`` constants
+        model: Name of the model class, of the response class or, for
+            conditions, of the hyperfield class
+        name: Endpoint of the hyperfield resolved, if any
+        duration: Time spent in the phase, in seconds
+    """
+
+    phase: str
+    model: str
+    name: Optional[str]
+    duration: float
+
+
+@runtime_checkable
+class Instrument(Protocol):
+    def record(self: Self, event: Event) -> None: ...
+
+
+# Instruments receiving the events, none when instrumentation is disabled.
+# The hot paths only check this tuple, so disabled instrumentation costs a
+# single attribute lookup.
+instruments: Tuple[Instrument, ...] = ()
+
+
+def add_instrument(instrument: Instrument) -> None:
+    """
+    Send the events of every rendering to ``instrument``, enabling the
+    instrumentation.
+    """
+    global instruments  # pylint: disable=global-statement
+    if instrument not in instruments:
+        instruments = (*instruments, instrument)
+
+
+def remove_instrument(instrument: Instrument) -> None:
+    """
+    Stop sending events to ``instrument``. Instrumentation is disabled once
+    no instrument is left.
+    """
+    global instruments  # pylint: disable=global-statement
+    instruments = tuple(
+        instrument_ for instrument_ in instruments if instrument_ is not instrument
+    )
+
+
+@contextmanager
+def instrumented(instrument: Instrument) -> Iterator[Instrument]:
+    """Send the events to ``instrument`` within the ``with`` block."""
+    add_instrument(instrument)
+    try:
+        yield instrument
+    finally:
+        remove_instrument(instrument)
+
+
+def emit(phase: str, model: str, name: Optional[str], start: float) -> None:
+    """
+    Send to every instrument the event of a phase started at ``start``, as
+    returned by ``time.perf_counter``.
+    """
+    event = Event(phase, model, name, perf_counter() - start)
+    for instrument in instruments:
+        instrument.record(event)
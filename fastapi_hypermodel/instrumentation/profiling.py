@@ -0,0 +1,243 @@
+import cProfile
+import hmac
+import io
+import marshal
+import pstats
+import re
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+from uuid import uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing_extensions import Self
+
+from .hooks import Event, add_instrument, remove_instrument
+
+DEFAULT_PROFILE_HEADER = "x-hypermodel-profile"
+PROFILE_ID_HEADER = "x-hypermodel-profile-id"
+DEFAULT_PROFILED_MODULES = (
+    "fastapi_hypermodel.base",
+    "fastapi_hypermodel.hal",
+    "fastapi_hypermodel.siren",
+)
+DEFAULT_PROFILE_LIMIT = 50
+
+HTTP_SCOPE = "http"
+RESPONSE_START = "http.response.start"
+
+
+class Profile(NamedTuple):
+    """
+    Profile of a request.
+
+    Attributes:
+        id_: Identifier of the profile, sent in the ``PROFILE_ID_HEADER``
+            response header
+        method: Method of the request profiled
+        path: Path of the request profiled
+        report: Functions of the profiled modules, by cumulative time
+        data: Whole profile, in the format of ``pstats.Stats.dump_stats``
+    """
+
+    id_: str
+    method: str
+    path: str
+    report: str
+    data: bytes
+
+
+class ProfileStore:
+    """
+    Keep the last ``max_profiles`` profiles, in memory.
+    """
+
+    def __init__(self: Self, max_profiles: int = 16) -> None:
+        if max_profiles < 1:
+            error_message = "max_profiles must be a positive integer"
+            raise ValueError(error_message)
+
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[str, Profile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self: Self) -> int:
+        return len(self._profiles)
+
+    def add(self: Self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles[profile.id_] = profile
+            # One profile is added at a time, so dropping the oldest is enough
+            if len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self: Self, id_: str) -> Optional[Profile]:
+        with self._lock:
+            return self._profiles.get(id_)
+
+
+class _RequestProfile:
+    # Profiles of a request: one of the thread running the request and one
+    # for each worker thread validating its hypermodels
+    def __init__(self: Self) -> None:
+        self.thread_id = threading.get_ident()
+        self.profiles: List[cProfile.Profile] = [cProfile.Profile()]
+
+
+# From Python 3.12, cProfile relies on sys.monitoring, which is global to the
+# interpreter: the profiler of the request thread also sees the worker
+# threads, and no other profiler can be enabled meanwhile
+_GLOBAL_PROFILER = sys.version_info >= (3, 12)
+
+_request_profile: ContextVar[Optional[_RequestProfile]] = ContextVar(
+    "fastapi_hypermodel_request_profile", default=None
+)
+
+
+@contextmanager
+def profiled_thread() -> Iterator[None]:
+    """
+    Profile the block when it runs in a worker thread on behalf of a
+    profiled request, such as the response model validation of a sync
+    endpoint. The thread running the request is already profiled, as is
+    every thread when the profiler is global to the interpreter.
+    """
+    request_profile = _request_profile.get()
+    if (
+        _GLOBAL_PROFILER
+        or request_profile is None
+        or request_profile.thread_id == threading.get_ident()
+    ):
+        yield
+        return
+
+    profile = cProfile.Profile()
+    request_profile.profiles.append(profile)
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+
+
+class _ProfilingSwitch:
+    # Registered while a request is profiled, so that the hypermodels take
+    # the instrumented path checking for worker threads to profile
+    @staticmethod
+    def record(event: Event) -> None:
+        pass
+
+
+_profiling_switch = _ProfilingSwitch()
+
+
+def _modules_pattern(modules: Iterable[str]) -> str:
+    return "|".join(
+        r"[/\\]".join(re.escape(part) for part in module.split("."))
+        for module in modules
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Profile with ``cProfile`` the requests carrying ``secret`` in the
+    ``header`` request header, and keep the profiles in ``store``. The
+    response of a profiled request holds the profile identifier in the
+    ``PROFILE_ID_HEADER`` header, to download it from
+    ``create_profile_router``.
+
+    The report of each profile only lists the functions of ``modules``, the
+    ``limit`` longest in cumulative time. A single request is profiled at a
+    time, and the profile of the thread running it includes the other
+    requests handled meanwhile by the event loop: profile requests on an
+    instance with little traffic.
+    """
+
+    def __init__(
+        self: Self,
+        app: ASGIApp,
+        secret: str,
+        header: str = DEFAULT_PROFILE_HEADER,
+        store: Optional[ProfileStore] = None,
+        modules: Iterable[str] = DEFAULT_PROFILED_MODULES,
+        limit: int = DEFAULT_PROFILE_LIMIT,
+    ) -> None:
+        if not secret:
+            error_message = "secret must not be empty"
+            raise ValueError(error_message)
+
+        self.app = app
+        self.secret = secret.encode("latin-1")
+        self.header = header.lower()
+        self.store = store if store is not None else ProfileStore()
+        self.modules_pattern = _modules_pattern(modules)
+        self.limit = limit
+        self._profiling = threading.Lock()
+
+    def _is_triggered(self: Self, scope: Scope) -> bool:
+        value = Headers(scope=scope).get(self.header)
+        if value is None:
+            return False
+        return hmac.compare_digest(value.encode("latin-1"), self.secret)
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != HTTP_SCOPE or not self._is_triggered(scope):
+            await self.app(scope, receive, send)
+            return
+
+        # Profilers of concurrent requests would replace each other
+        if not self._profiling.acquire(blocking=False):  # pylint: disable=consider-using-with
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._profiling.release()
+
+    async def _profile(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        id_ = uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == RESPONSE_START:
+                headers = MutableHeaders(scope=message)
+                headers.append(PROFILE_ID_HEADER, id_)
+            await send(message)
+
+        request_profile = _RequestProfile()
+        request_thread_profile, *_ = request_profile.profiles
+        token = _request_profile.set(request_profile)
+        add_instrument(_profiling_switch)
+        request_thread_profile.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_thread_profile.disable()
+            remove_instrument(_profiling_switch)
+            _request_profile.reset(token)
+            self.store.add(self._build_profile(id_, scope, request_profile.profiles))
+
+    def _build_profile(
+        self: Self, id_: str, scope: Scope, profiles: List[cProfile.Profile]
+    ) -> Profile:
+        stream = io.StringIO()
+        stats = pstats.Stats(*profiles, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        stats.print_stats(self.modules_pattern, self.limit)
+        return Profile(
+            id_=id_,
+            method=scope["method"],
+            path=scope["path"],
+            report=stream.getvalue(),
+            data=marshal.dumps(stats.stats),  # type: ignore[attr-defined]
+        )
@@ -0,0 +1,167 @@
+from contextvars import ContextVar
+from typing import (
+    Dict,
+    Mapping,
+    Optional,
+)
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing_extensions import Self
+
+from .hooks import (
+    PHASE_ACTIONS,
+    PHASE_CONDITION,
+    PHASE_EMBEDDED,
+    PHASE_ENCODING,
+    PHASE_HYPERMEDIA,
+    PHASE_LINKS,
+    PHASE_RESPONSE_VALIDATION,
+    PHASE_VALIDATION,
+    Event,
+    add_instrument,
+    remove_instrument,
+)
+
+HTTP_SCOPE = "http"
+LIFESPAN_SCOPE = "lifespan"
+LIFESPAN_STARTUP = "lifespan.startup"
+RESPONSE_START = "http.response.start"
+
+# Server-Timing metric reporting each phase, in the order of the header. The
+# hyperfield phase is left out, as it is already part of the phases building
+# the links.
+SERVER_TIMING_METRICS: Mapping[str, str] = {
+    PHASE_VALIDATION: "validation",
+    PHASE_HYPERMEDIA: "links",
+    PHASE_LINKS: "links",
+    PHASE_ACTIONS: "links",
+    PHASE_CONDITION: "conditions",
+    PHASE_EMBEDDED: "embedded",
+    PHASE_RESPONSE_VALIDATION: "response-validation",
+    PHASE_ENCODING: "encoding",
+}
+
+# Description of each metric, telling which metrics are part of which: the
+# durations are inclusive, so nested metrics are not to be added up. Commas
+# are left out, as they separate the metrics in the header.
+SERVER_TIMING_DESCRIPTIONS: Mapping[str, str] = {
+    "validation": "Validation with links and embedding",
+    "links": "Links and actions within validation",
+    "conditions": "Link conditions within links",
+    "embedded": "Embedding within validation",
+    "response-validation": "Response format check",
+    "encoding": "Response encoding",
+}
+
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "fastapi_hypermodel_server_timing", default=None
+)
+
+
+class _RequestTimings:
+    """
+    Instrument adding up the time of each metric for the request being
+    handled, ignoring the events outside of a request.
+    """
+
+    @staticmethod
+    def record(event: Event) -> None:
+        timings = _timings.get()
+        metric = SERVER_TIMING_METRICS.get(event.phase)
+        if timings is None or metric is None:
+            return
+
+        timings[metric] = timings.get(metric, 0.0) + event.duration
+
+
+_request_timings = _RequestTimings()
+
+# Applications started with a ServerTimingMiddleware, the instrument being
+# registered while there is one
+_started_apps = 0  # pylint: disable=invalid-name
+
+
+def _start_timings() -> None:
+    global _started_apps  # pylint: disable=global-statement
+    _started_apps += 1
+    add_instrument(_request_timings)
+
+
+def _stop_timings() -> None:
+    global _started_apps  # pylint: disable=global-statement
+    _started_apps -= 1
+    if not _started_apps:
+        remove_instrument(_request_timings)
+
+
+def format_server_timing(timings: Mapping[str, float]) -> str:
+    """
+    Format the time of each metric, in seconds, as a ``Server-Timing`` header
+    value, in milliseconds, described by ``SERVER_TIMING_DESCRIPTIONS`` and
+    in the order of ``SERVER_TIMING_METRICS``.
+    """
+    metrics = dict.fromkeys(SERVER_TIMING_METRICS.values())
+    return ", ".join(
+        f"{metric};dur={timings[metric] * 1000:.3f};"
+        f'desc="{SERVER_TIMING_DESCRIPTIONS[metric]}"'
+        for metric in metrics
+        if metric in timings
+    )
+
+
+class ServerTimingMiddleware:
+    """
+    Add a ``Server-Timing`` header breaking down the time spent by the library
+    on each response: validating the hypermodels, building their links,
+    evaluating the link conditions, embedding the nested hypermodels, then
+    validating and encoding the hypermedia response, e.g.
+    ``validation;dur=4.210;desc="...", links;dur=1.802;desc="..."``.
+
+    The instrumentation is enabled for the whole process from the startup of
+    the application to its shutdown. Only the responses rendering hypermodels
+    get the header.
+    """
+
+    def __init__(self: Self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == LIFESPAN_SCOPE:
+            await self._lifespan(scope, receive, send)
+            return
+
+        if scope["type"] != HTTP_SCOPE:
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == RESPONSE_START and timings:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", format_server_timing(timings))
+            await send(message)
+
+        token = _timings.set(timings)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _timings.reset(token)
+
+    async def _lifespan(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        started = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal started
+            message = await receive()
+            if message["type"] == LIFESPAN_STARTUP and not started:
+                _start_timings()
+                started = True
+            return message
+
+        try:
+            await self.app(scope, receive_wrapper, send)
+        finally:
+            if started:
+                _stop_timings()
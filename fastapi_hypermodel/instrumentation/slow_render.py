@@ -0,0 +1,187 @@
+import logging
+import random
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
+
+from typing_extensions import Self
+
+from .hooks import (
+    PHASE_CONDITION,
+    PHASE_ENCODING,
+    PHASE_HYPERFIELD,
+    PHASE_HYPERMEDIA,
+    PHASE_RESPONSE_VALIDATION,
+    PHASE_VALIDATION,
+    Event,
+)
+
+DEFAULT_SLOW_RENDER_THRESHOLD = 0.1
+
+slow_render_logger = logging.getLogger("fastapi_hypermodel.slow_render")
+
+
+class SlowRender(NamedTuple):
+    """
+    Breakdown of a render slower than its threshold.
+
+    Attributes:
+        model: Name of the outermost model class rendered
+        duration: Time spent validating the model, in seconds
+        threshold: Threshold the duration crossed, in seconds
+        models: Instances built, by model class, the outermost one included
+        hyperfields: Hyperfields resolved, by endpoint
+        conditions: Number of hyperfield conditions evaluated
+        phases: Time spent in each phase, in seconds
+    """
+
+    model: str
+    duration: float
+    threshold: float
+    models: Dict[str, int]
+    hyperfields: Dict[str, int]
+    conditions: int
+    phases: Dict[str, float]
+
+
+class _Render:
+    # Events of the render in progress, until its model is validated
+    __slots__ = ("conditions", "hyperfields", "models", "phases")
+
+    def __init__(self: Self) -> None:
+        self.models: Dict[str, int] = {}
+        self.hyperfields: Dict[str, int] = {}
+        self.conditions = 0
+        self.phases: Dict[str, float] = {}
+
+    def add(self: Self, event: Event) -> None:
+        self.phases[event.phase] = self.phases.get(event.phase, 0.0) + event.duration
+        if event.phase == PHASE_HYPERMEDIA:
+            self.models[event.model] = self.models.get(event.model, 0) + 1
+        elif event.phase == PHASE_HYPERFIELD:
+            name = event.name or event.model
+            self.hyperfields[name] = self.hyperfields.get(name, 0) + 1
+        elif event.phase == PHASE_CONDITION:
+            self.conditions += 1
+
+
+# Placeholder for the renders left out of the sample
+_SKIPPED = object()
+
+# Phases of the response, timed once the model is already validated
+_RESPONSE_PHASES = frozenset({PHASE_RESPONSE_VALIDATION, PHASE_ENCODING})
+
+# Render in progress in the current context, by detector
+_renders: ContextVar[Optional[Mapping["SlowRenderDetector", object]]] = ContextVar(
+    "fastapi_hypermodel_slow_render", default=None
+)
+
+
+class SlowRenderDetector:
+    """
+    Instrument logging the renders slower than a threshold, with the models,
+    hyperfields and conditions they involved and the time of each phase:
+
+    ```python
+    add_instrument(SlowRenderDetector(threshold=0.05, sample_rate=0.1))
+    ```
+
+    A render covers the validation of an outermost hypermodel, such as a
+    response model, nested hypermodels included. It is slow past
+    ``threshold`` seconds, or the threshold of its model class name in
+    ``thresholds``. Only a ``sample_rate`` fraction of the renders is
+    checked and aggregated. While the detector is registered, the phases of
+    every render are still timed and emitted, sampled or not. Slow renders
+    are logged as warnings to ``logger``.
+
+    ``renders``, ``sampled_renders`` and ``slow_renders`` count the renders
+    seen, checked and logged since the detector was created.
+    """
+
+    def __init__(
+        self: Self,
+        threshold: float = DEFAULT_SLOW_RENDER_THRESHOLD,
+        thresholds: Optional[Mapping[str, float]] = None,
+        sample_rate: float = 1.0,
+        logger: logging.Logger = slow_render_logger,
+    ) -> None:
+        if not 0 <= sample_rate <= 1:
+            error_message = "sample_rate must be between 0 and 1"
+            raise ValueError(error_message)
+
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+        self.sample_rate = sample_rate
+        self.logger = logger
+        self.renders = 0
+        self.sampled_renders = 0
+        self.slow_renders = 0
+
+    def _set_render(self: Self, render: Optional[object]) -> None:
+        # Copied, as the contexts copied from the current one share the mapping
+        renders = dict(_renders.get() or {})
+        if render is None:
+            renders.pop(self, None)
+        else:
+            renders[self] = render
+        _renders.set(renders or None)
+
+    def record(self: Self, event: Event) -> None:
+        if event.phase in _RESPONSE_PHASES:
+            return
+
+        renders = _renders.get()
+        render = renders.get(self) if renders else None
+        if render is None:
+            # Sampling, not security
+            sampled = random.random() < self.sample_rate  # nosec B311
+            render = _Render() if sampled else _SKIPPED
+            self._set_render(render)
+
+        if event.phase != PHASE_VALIDATION:
+            if isinstance(render, _Render):
+                render.add(event)
+            return
+
+        self._set_render(None)
+        self.renders += 1
+        if not isinstance(render, _Render):
+            return
+
+        self.sampled_renders += 1
+        threshold = self.thresholds.get(event.model, self.threshold)
+        if event.duration < threshold:
+            return
+
+        self.slow_renders += 1
+
+        self.log(
+            SlowRender(
+                model=event.model,
+                duration=event.duration,
+                threshold=threshold,
+                models=render.models,
+                hyperfields=render.hyperfields,
+                conditions=render.conditions,
+                phases=render.phases,
+            )
+        )
+
+    def log(self: Self, slow_render: SlowRender) -> None:
+        """
+        Log ``slow_render`` as a warning, its fields in the ``slow_render``
+        attribute of the log record for structured handlers.
+        """
+        extra: Dict[str, Any] = {"slow_render": slow_render._asdict()}
+        self.logger.warning(
+            "Slow render of %s: %.3f ms, threshold %.3f ms",
+            slow_render.model,
+            slow_render.duration * 1000,
+            slow_render.threshold * 1000,
+            extra=extra,
+        )
@@ -13,6 +13,7 @@ from .siren_link import (
     SirenLinkFor,
     SirenLinkType,
 )
+from .siren_page import SirenPage
 from .siren_response import (
     SirenResponse,
     get_siren_action,
@@ -27,6 +28,7 @@ __all__ = [
     "SirenHyperModel",
     "SirenLinkFor",
     "SirenLinkType",
+    "SirenPage",
     "SirenResponse",
     "get_siren_action",
     "get_siren_link",
@@ -5,6 +5,8 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -28,8 +30,11 @@ from typing_extensions import Self
 
 from fastapi_hypermodel.base import (
     AbstractHyperField,
+    CompiledLink,
+    ConstantCache,
     HasName,
     UrlType,
+    construct_unvalidated,
     get_route_from_app,
 )
 
@@ -61,6 +66,7 @@ class SirenActionType(SirenBase):
 class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # pylint: disable=too-many-instance-attributes
     _endpoint: str = PrivateAttr()
     _param_values: Mapping[str, str] = PrivateAttr()
+    _safe_params: FrozenSet[str] = PrivateAttr()
     _templated: Optional[bool] = PrivateAttr()
     _condition: Optional[Callable[[Mapping[str, Any]], bool]] = PrivateAttr()
     _populate_fields: bool = PrivateAttr()
@@ -72,6 +78,9 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
     _method: Optional[str] = PrivateAttr()
     _type: Optional[str] = PrivateAttr()
     _fields: Optional[Sequence[SirenFieldType]] = PrivateAttr()
+    _constant: ConstantCache[SirenActionType] = PrivateAttr(
+        default_factory=ConstantCache
+    )
 
     def __init__(
         self: Self,
@@ -86,6 +95,7 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
         fields: Optional[Sequence[SirenFieldType]] = None,
         method: Optional[str] = None,
         name: str = "",
+        safe_params: Optional[Iterable[str]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -93,6 +103,7 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
             endpoint.__name__ if isinstance(endpoint, HasName) else endpoint
         )
         self._param_values = param_values or {}
+        self._safe_params = frozenset(safe_params or ())
         self._templated = templated
         self._condition = condition
         self._populate_fields = populate_fields
@@ -103,6 +114,41 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
         self._name = name
         self._class = class_
 
+    def __copy__(self: Self) -> Self:
+        return self
+
+    def __deepcopy__(self: Self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        return self
+
+    def compile(self: Self, app: Starlette) -> CompiledLink:
+        link = self._compile_route(
+            app,
+            self._endpoint,
+            self._param_values,
+            templated=self._templated,
+            condition=self._condition,
+        )
+        # Actions whose fields are filled with the instance values are not
+        # cached, whatever their href
+        if link.href is not None and self._constant.get(app) is None:
+            return link._replace(href=None)
+        return link
+
+    def load(self: Self, app: Starlette, link: Optional[CompiledLink]) -> None:
+        self._load_route(
+            app,
+            link,
+            lambda href: self._build_action(
+                get_route_from_app(app, self._endpoint), href, {}
+            ),
+            constant=self._constant,
+            endpoint=self._endpoint,
+            params=self._param_values,
+            templated=self._templated,
+            condition=self._condition,
+            cacheable=lambda action: not self._is_populated(action),
+        )
+
     def _prepopulate_fields(
         self: Self, fields: Sequence[SirenFieldType], values: Mapping[str, Any]
     ) -> List[SirenFieldType]:
@@ -132,42 +178,57 @@ class SirenActionFor(SirenActionType, AbstractHyperField[SirenActionType]):  # p
         fields = list(starmap(SirenFieldType.from_field_info, model_fields.items()))
         return self._prepopulate_fields(fields, values)
 
+    def selection_names(self: Self) -> Sequence[str]:
+        return (self._name,)
+
     def __call__(
         self: Self, app: Optional[Starlette], values: Mapping[str, Any]
     ) -> Optional[SirenActionType]:
         if app is None:
             return None
 
-        if self._condition and not self._condition(values):
-            return None
-
-        route = get_route_from_app(app, self._endpoint)
-
-        if not self._method:
-            self._method = next(iter(route.methods or {}), "GET")
-
-        uri_path = self._get_uri_path(
-            templated=self._templated,
+        return self._resolve_route(
+            app,
+            values,
+            lambda href: self._build_action(
+                get_route_from_app(app, self._endpoint), href, values
+            ),
+            constant=self._constant,
             endpoint=self._endpoint,
-            app=app,
-            values=values,
             params=self._param_values,
-            route=route,
-        )
-
-        if not self._fields:
-            self._fields = self._compute_fields(route, values)
-
-        if not self._type and self._fields:
-            self._type = "application/x-www-form-urlencoded"
-
-        return SirenActionType(
-            href=uri_path,
-            name=self._name,
-            fields=self._fields,
-            method=self._method,
-            title=self._title,
-            type_=self._type,  # type: ignore
-            class_=self._class,  # type: ignore
             templated=self._templated,
+            condition=self._condition,
+            safe_params=self._safe_params,
+            cacheable=lambda action: not self._is_populated(action),
         )
+
+    def _is_populated(self: Self, action: SirenActionType) -> bool:
+        # Fields read from the route are filled with the instance values
+        return bool(action.fields) and self._populate_fields and not self._fields
+
+    def _build_action(
+        self: Self, route: Route, href: UrlType, values: Mapping[str, Any]
+    ) -> SirenActionType:
+        method = self._method or next(iter(route.methods or {}), "GET")
+
+        fields = self._fields or self._compute_fields(route, values)
+
+        type_ = self._type
+        if not type_ and fields:
+            type_ = "application/x-www-form-urlencoded"
+
+        action_values: Dict[str, Any] = {
+            "href": href,
+            "name": self._name,
+            "fields": fields,
+            "method": method,
+            "title": self._title,
+            "type_": type_,
+            "class_": self._class,
+            "templated": self._templated,
+        }
+        # Validating only reports the missing mandatory fields
+        if self._name and href:
+            return construct_unvalidated(SirenActionType, **action_values)
+
+        return SirenActionType(**action_values)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from time import perf_counter
 from typing import (
     Any,
     Dict,
     List,
     Mapping,
+    Optional,
     Sequence,
+    Type,
     Union,
     cast,
 )
@@ -18,7 +21,13 @@ from pydantic import (
 )
 from typing_extensions import Self
 
-from fastapi_hypermodel.base import AbstractHyperField, HyperModel
+from fastapi_hypermodel.base import (
+    AbstractHyperField,
+    HyperModel,
+    Selection,
+    get_selection,
+)
+from fastapi_hypermodel.instrumentation import hooks
 
 from .siren_action import SirenActionFor, SirenActionType
 from .siren_base import SirenBase
@@ -43,6 +52,29 @@ SIREN_RESERVED_FIELDS = {
     "actions",
 }
 
+SELF_REL = "self"
+
+
+def _selection_names(element: Any) -> Sequence[str]:
+    if isinstance(element, (SirenLinkFor, SirenActionFor)):
+        return element.selection_names()
+
+    if isinstance(element, SirenLinkType):
+        return element.rel
+
+    return (element.name,)
+
+
+def _select(elements: Sequence[Any], selection: Optional[Selection]) -> List[Any]:
+    if selection is None:
+        return list(elements)
+
+    return [
+        element
+        for element in elements
+        if selection.includes_link(*_selection_names(element))
+    ]
+
 
 class SirenHyperModel(HyperModel):
     properties: Dict[str, Any] = Field(default_factory=dict)
@@ -55,8 +87,28 @@ class SirenHyperModel(HyperModel):
     # This config is needed to use the Self in Embedded
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @classmethod
+    def as_reference(
+        cls: Type[Self], values: Mapping[str, Any], rel: str
+    ) -> Optional[SirenLinkType]:
+        links = cls.model_fields["links"].default
+        if not isinstance(links, Sequence):
+            return None
+
+        self_link = next(
+            (link for link in links if SELF_REL in _selection_names(link)), None
+        )
+        if callable(self_link):
+            self_link = self_link(cls._app, values)
+
+        if not self_link:
+            return None
+
+        return SirenLinkType(rel=[rel], href=self_link.href)
+
     @model_validator(mode="after")
     def add_hypermodels_to_entities(self: Self) -> Self:
+        start = perf_counter() if hooks.instruments else None
         entities: List[Union[SirenEmbeddedType, SirenLinkType]] = []
         for name, field in self:
             alias = self.model_fields[name].alias or name
@@ -86,6 +138,9 @@ class SirenHyperModel(HyperModel):
 
         self.entities = entities
 
+        if start is not None:
+            hooks.emit(hooks.PHASE_EMBEDDED, type(self).__name__, None, start)
+
         return self
 
     @model_validator(mode="after")
@@ -94,7 +149,7 @@ class SirenHyperModel(HyperModel):
         for name, field in self:
             alias = self.model_fields[name].alias or name
 
-            if alias in SIREN_RESERVED_FIELDS:
+            if alias in SIREN_RESERVED_FIELDS or self.model_fields[name].exclude:
                 continue
 
             value: Sequence[Any] = field if isinstance(field, Sequence) else [field]
@@ -123,6 +178,7 @@ class SirenHyperModel(HyperModel):
 
     @model_validator(mode="after")
     def add_links(self: Self) -> Self:
+        start = perf_counter() if hooks.instruments else None
         links_key = "links"
         validated_links: List[SirenLinkFor] = []
         for name, value in self:
@@ -131,13 +187,16 @@ class SirenHyperModel(HyperModel):
             if alias != links_key or not value:
                 continue
 
-            links = cast(Sequence[SirenLinkFor], value)
+            links = _select(cast(Sequence[SirenLinkFor], value), get_selection())
             properties = self.properties or {}
             validated_links = self._validate_factory(links, properties)
             self.links = validated_links
 
         self.validate_has_self_link(validated_links)
 
+        if start is not None:
+            hooks.emit(hooks.PHASE_LINKS, type(self).__name__, None, start)
+
         return self
 
     @staticmethod
@@ -145,7 +204,7 @@ class SirenHyperModel(HyperModel):
         if not links:
             return
 
-        if any(link.rel == ["self"] for link in links):
+        if any(link.rel == [SELF_REL] for link in links):
             return
 
         error_message = "If links are present, a link with rel self must be present"
@@ -153,6 +212,7 @@ class SirenHyperModel(HyperModel):
 
     @model_validator(mode="after")
     def add_actions(self: Self) -> Self:
+        start = perf_counter() if hooks.instruments else None
         actions_key = "actions"
         for name, value in self:
             alias = self.model_fields[name].alias or name
@@ -161,9 +221,26 @@ class SirenHyperModel(HyperModel):
                 continue
 
             properties = self.properties or {}
-            actions = cast(Sequence[SirenActionFor], value)
+            actions = _select(cast(Sequence[SirenActionFor], value), get_selection())
             self.actions = self._validate_factory(actions, properties)
 
+        if start is not None:
+            hooks.emit(hooks.PHASE_ACTIONS, type(self).__name__, None, start)
+
+        return self
+
+    @model_validator(mode="after")
+    def apply_field_selection(self: Self) -> Self:
+        selection = get_selection()
+        if selection is None or selection.fields is None or not self.properties:
+            return self
+
+        self.properties = {
+            name: value
+            for name, value in self.properties.items()
+            if selection.includes_field(name)
+        }
+
         return self
 
     @model_validator(mode="after")
@@ -179,7 +256,11 @@ class SirenHyperModel(HyperModel):
 
     @model_serializer
     def serialize(self: Self) -> Mapping[str, Any]:
-        return {self.model_fields[k].alias or k: v for k, v in self if v}
+        return {
+            self.model_fields[k].alias or k: v
+            for k, v in self
+            if v and not self.model_fields[k].exclude
+        }
 
     @staticmethod
     def as_embedded(field: SirenHyperModel, rel: str) -> SirenEmbeddedType:
@@ -3,6 +3,9 @@ from __future__ import annotations
 from typing import (
     Any,
     Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
     Mapping,
     Optional,
     Sequence,
@@ -21,9 +24,12 @@ from typing_extensions import Self
 
 from fastapi_hypermodel.base import (
     AbstractHyperField,
+    CompiledLink,
+    ConstantCache,
     HasName,
+    QueryTemplate,
     UrlType,
-    get_route_from_app,
+    construct_unvalidated,
 )
 
 from .siren_base import SirenBase
@@ -49,6 +55,7 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
     # pylint: disable=too-many-instance-attributes
     _endpoint: str = PrivateAttr()
     _param_values: Mapping[str, str] = PrivateAttr()
+    _safe_params: FrozenSet[str] = PrivateAttr()
     _templated: Optional[bool] = PrivateAttr()
     _condition: Optional[Callable[[Mapping[str, Any]], bool]] = PrivateAttr()
 
@@ -57,6 +64,8 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
     _type: Optional[str] = PrivateAttr()
     _rel: Sequence[str] = PrivateAttr()
     _class: Optional[Sequence[str]] = PrivateAttr()
+    _query: Optional[QueryTemplate] = PrivateAttr()
+    _constant: ConstantCache[SirenLinkType] = PrivateAttr(default_factory=ConstantCache)
 
     def __init__(
         self: Self,
@@ -68,6 +77,8 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
         type_: Optional[str] = None,
         rel: Optional[Sequence[str]] = None,
         class_: Optional[Sequence[str]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        safe_params: Optional[Iterable[str]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -75,6 +86,8 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
             endpoint.__name__ if isinstance(endpoint, HasName) else endpoint
         )
         self._param_values = param_values or {}
+        self._safe_params = frozenset(safe_params or ())
+        self._query = QueryTemplate(query) if query else None
         self._templated = templated
         self._condition = condition
         self._title = title
@@ -82,32 +95,65 @@ class SirenLinkFor(SirenLinkType, AbstractHyperField[SirenLinkType]):
         self._rel = rel or []
         self._class = class_
 
-    def __call__(
-        self: Self, app: Optional[Starlette], values: Mapping[str, Any]
-    ) -> Optional[SirenLinkType]:
-        if app is None:
-            return None
-
-        if self._condition and not self._condition(values):
-            return None
+    def __copy__(self: Self) -> Self:
+        return self
 
-        route = get_route_from_app(app, self._endpoint)
+    def __deepcopy__(self: Self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        return self
 
-        properties = values.get("properties", values)
-        uri_path = self._get_uri_path(
+    def compile(self: Self, app: Starlette) -> CompiledLink:
+        return self._compile_route(
+            app,
+            self._endpoint,
+            self._param_values,
             templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+        )
+
+    def selection_names(self: Self) -> Sequence[str]:
+        return self._rel
+
+    def load(self: Self, app: Starlette, link: Optional[CompiledLink]) -> None:
+        self._load_route(
+            app,
+            link,
+            self._build_link,
+            constant=self._constant,
             endpoint=self._endpoint,
-            app=app,
-            values=properties,
             params=self._param_values,
-            route=route,
+            templated=self._templated,
+            condition=self._condition,
+            query=self._query,
         )
 
-        # Using model_validate to avoid conflicts with keyword class
-        return SirenLinkType(
-            href=uri_path,
-            rel=self._rel,
-            title=self._title,
-            type_=self._type,  # type: ignore
-            class_=self._class,  # type: ignore
+    def _build_link(self: Self, href: UrlType) -> SirenLinkType:
+        link_values: Dict[str, Any] = {
+            "href": href,
+            "rel": self._rel,
+            "title": self._title,
+            "type_": self._type,
+            "class_": self._class,
+        }
+        # Validating only reports the missing mandatory fields
+        if self._rel and href:
+            return construct_unvalidated(SirenLinkType, **link_values)
+
+        return SirenLinkType(**link_values)
+
+    def __call__(
+        self: Self, app: Optional[Starlette], values: Mapping[str, Any]
+    ) -> Optional[SirenLinkType]:
+        return self._resolve_route(
+            app,
+            values,
+            self._build_link,
+            constant=self._constant,
+            endpoint=self._endpoint,
+            params=self._param_values,
+            templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+            safe_params=self._safe_params,
+            uri_values=values.get("properties", values),
         )
@@ -0,0 +1,79 @@
+from typing import (
+    ClassVar,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from pydantic import ConfigDict, model_validator
+from typing_extensions import Self
+
+from fastapi_hypermodel.base import PageModel, UrlType, get_selection
+
+from .siren_action import SirenActionFor, SirenActionType
+from .siren_field import SirenFieldType
+from .siren_hypermodel import SirenHyperModel
+from .siren_link import SirenLinkFor, SirenLinkType
+
+T = TypeVar("T")
+
+
+class SirenPage(SirenHyperModel, PageModel, Generic[T]):
+    """
+    A page of a collection, with its items as sub-entities, links to the
+    ``first``, ``prev``, ``next`` and ``last`` pages and an action to change
+    the page size. The links and the action are built from the ``self`` link
+    of the collection, without resolving any other route.
+    """
+
+    items: Sequence[T]
+
+    size_action: ClassVar[str] = "paginate"
+
+    model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
+
+    @model_validator(mode="after")
+    def add_page_links(self: Self) -> Self:
+        links: List[Union[SirenLinkFor, SirenLinkType]] = list(self.links)
+        self_link = next((link for link in links if link.rel == ["self"]), None)
+        if self_link is None:
+            return self
+
+        href = self_link.href
+        for name, cursor in self.page_cursors().items():
+            links.append(SirenLinkType(rel=[name], href=self.page_href(href, cursor)))
+
+        self_index = links.index(self_link)
+        links[self_index] = self_link.model_copy(
+            update={"href": self.page_href(href, self.cursor)}
+        )
+        self.links = links  # type: ignore
+
+        size_action = self.page_size_action(href)
+        if size_action:
+            actions: List[Union[SirenActionFor, SirenActionType]] = list(self.actions)
+            actions.append(size_action)
+            self.actions = actions  # type: ignore
+
+        return self
+
+    def page_size_action(self: Self, href: UrlType) -> Optional[SirenActionType]:
+        selection = get_selection()
+        if selection and not selection.includes_link(self.size_action):
+            return None
+
+        size_field = SirenFieldType(
+            name=self.size_param,
+            type_="number",  # type: ignore
+            value=self.page_size,
+        )
+        return SirenActionType(
+            name=self.size_action,
+            method="GET",
+            href=href,
+            type_="application/x-www-form-urlencoded",  # type: ignore
+            fields=[size_field],
+        )
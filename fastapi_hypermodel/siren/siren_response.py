@@ -6,25 +6,21 @@ from typing import (
 )
 
 import jsonschema
-from starlette.responses import JSONResponse
 from typing_extensions import Self
 
+from fastapi_hypermodel.base import HypermediaResponse
+
 from .siren_action import SirenActionType
 from .siren_link import SirenLinkType
 from .siren_schema import schema
 
 
-class SirenResponse(JSONResponse):
+class SirenResponse(HypermediaResponse):
     media_type = "application/siren+json"
 
-    @staticmethod
-    def _validate(content: Any) -> None:
+    def _validate(self: Self, content: Any) -> None:
         jsonschema.validate(instance=content, schema=schema)
 
-    def render(self: Self, content: Any) -> bytes:
-        self._validate(content)
-        return super().render(content)
-
 
 def get_siren_link(response: Any, link_name: str) -> Optional[SirenLinkType]:
     links = response.get("links", [])
@@ -1,6 +1,9 @@
 from typing import (
     Any,
     Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
     Mapping,
     Optional,
     Type,
@@ -21,9 +24,12 @@ from typing_extensions import Self
 from fastapi_hypermodel.base import (
     URL_TYPE_SCHEMA,
     AbstractHyperField,
+    CompiledLink,
+    ConstantCache,
     HasName,
+    QueryTemplate,
     UrlType,
-    get_route_from_app,
+    construct_unvalidated,
 )
 
 
@@ -38,8 +44,11 @@ class UrlForType(BaseModel):
 class UrlFor(UrlForType, AbstractHyperField[UrlForType]):
     _endpoint: str = PrivateAttr()
     _param_values: Mapping[str, str] = PrivateAttr()
+    _safe_params: FrozenSet[str] = PrivateAttr()
     _condition: Optional[Callable[[Mapping[str, Any]], bool]] = PrivateAttr()
     _templated: bool = PrivateAttr()
+    _query: Optional[QueryTemplate] = PrivateAttr()
+    _constant: ConstantCache[UrlForType] = PrivateAttr(default_factory=ConstantCache)
 
     def __init__(
         self: Self,
@@ -47,6 +56,8 @@ class UrlFor(UrlForType, AbstractHyperField[UrlForType]):
         param_values: Optional[Mapping[str, Any]] = None,
         condition: Optional[Callable[[Mapping[str, Any]], bool]] = None,
         templated: bool = False,
+        query: Optional[Mapping[str, Any]] = None,
+        safe_params: Optional[Iterable[str]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -54,9 +65,40 @@ class UrlFor(UrlForType, AbstractHyperField[UrlForType]):
             endpoint.__name__ if isinstance(endpoint, HasName) else endpoint
         )
         self._param_values = param_values or {}
+        self._safe_params = frozenset(safe_params or ())
+        self._query = QueryTemplate(query) if query else None
         self._condition = condition
         self._templated = templated
 
+    def __copy__(self: Self) -> Self:
+        return self
+
+    def __deepcopy__(self: Self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        return self
+
+    def compile(self: Self, app: Starlette) -> CompiledLink:
+        return self._compile_route(
+            app,
+            self._endpoint,
+            self._param_values,
+            templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+        )
+
+    def load(self: Self, app: Starlette, link: Optional[CompiledLink]) -> None:
+        self._load_route(
+            app,
+            link,
+            self._build_url,
+            constant=self._constant,
+            endpoint=self._endpoint,
+            params=self._param_values,
+            templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+        )
+
     @classmethod
     def __get_pydantic_json_schema__(  # pylint: disable=arguments-differ
         cls: Type[Self], __core_schema: CoreSchema, handler: GetJsonSchemaHandler
@@ -76,21 +118,19 @@ class UrlFor(UrlForType, AbstractHyperField[UrlForType]):
         app: Optional[Starlette],
         values: Mapping[str, Any],
     ) -> Optional[UrlForType]:
-        if app is None:
-            return None
-
-        if self._condition and not self._condition(values):
-            return None
-
-        route = get_route_from_app(app, self._endpoint)
-
-        uri_path = self._get_uri_path(
-            templated=self._templated,
+        return self._resolve_route(
+            app,
+            values,
+            self._build_url,
+            constant=self._constant,
             endpoint=self._endpoint,
-            app=app,
-            values=values,
             params=self._param_values,
-            route=route,
+            templated=self._templated,
+            condition=self._condition,
+            query=self._query,
+            safe_params=self._safe_params,
         )
 
-        return UrlForType(hypermedia=uri_path)
+    @staticmethod
+    def _build_url(uri_path: UrlType) -> UrlForType:
+        return construct_unvalidated(UrlForType, hypermedia=uri_path)
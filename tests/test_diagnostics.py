@@ -0,0 +1,239 @@
+from typing import Any, Iterable, Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_hypermodel import (
+    HyperModel,
+    InMemoryAggregator,
+    SlowRenderDetector,
+    UrlFor,
+    create_stats_router,
+    instrumented,
+)
+from fastapi_hypermodel.base import (
+    get_route_from_app,
+    route_lookup_count,
+    route_lookup_miss_count,
+)
+from fastapi_hypermodel.diagnostics import (
+    METRIC_GAUGE,
+    PROMETHEUS_MEDIA_TYPE,
+    Sample,
+    StatsRegistry,
+    aggregator_samples,
+    cache_samples,
+    slow_render_samples,
+    stats_registry,
+)
+
+
+class MockItem(HyperModel):
+    id_: str
+
+    href: UrlFor = UrlFor(
+        "read_item",
+        {"id_": "<id_>"},
+        condition=lambda values: values["id_"] != "locked",
+    )
+
+
+class MockCache:
+    class Info:
+        hits = 3
+        misses = 1
+        currsize = 1
+
+    def cache_info(self) -> Any:
+        return self.Info()
+
+
+class MockEmptyCache(MockCache):
+    class Info(MockCache.Info):
+        hits = 0
+        misses = 0
+        currsize = 0
+
+
+def label_provider() -> Iterable[Sample]:
+    yield Sample("mock_total", {"name": 'quoted "name"\\\n'}, 1)
+
+
+@pytest.fixture()
+def stats_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{id_}", response_model=MockItem)
+    def read_item(id_: str) -> Any:
+        return {"id_": id_}
+
+    app.include_router(create_stats_router())
+    HyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def stats_client(stats_app: FastAPI) -> TestClient:
+    return TestClient(stats_app)
+
+
+@pytest.fixture()
+def aggregator() -> Iterator[InMemoryAggregator]:
+    with instrumented(InMemoryAggregator()) as instrument:
+        assert isinstance(instrument, InMemoryAggregator)
+        stats_registry.register("render", aggregator_samples(instrument))
+        yield instrument
+        stats_registry.unregister("render")
+
+
+def test_stats_json(stats_client: TestClient) -> None:
+    stats_client.get("/items/item01")
+    lookups = route_lookup_count()
+    misses = route_lookup_miss_count()
+    stats_client.get("/items/item01")
+
+    response = stats_client.get("/_hypermodel/stats")
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert set(stats) == {"caches", "routes"}
+    lookups_sample, *_ = stats["routes"]
+    assert lookups_sample == {
+        "metric": "hypermodel_route_lookups_total",
+        "labels": {},
+        "value": lookups + 1,
+    }
+    routes = {sample["metric"]: sample["value"] for sample in stats["routes"]}
+    assert routes["hypermodel_route_lookup_hits_total"] == lookups + 1 - misses
+    assert routes["hypermodel_route_lookup_misses_total"] == misses
+    assert routes["hypermodel_route_lookup_hit_ratio"] == pytest.approx(
+        (lookups + 1 - misses) / (lookups + 1)
+    )
+    caches = {sample["labels"]["cache"] for sample in stats["caches"]}
+    assert {"compile_uri", "constant_hyperfields"} <= caches
+
+
+def test_stats_prometheus(stats_client: TestClient) -> None:
+    response = stats_client.get("/_hypermodel/stats", params={"format": "prometheus"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == PROMETHEUS_MEDIA_TYPE
+    lines = response.text.splitlines()
+    assert "# TYPE hypermodel_cache_hits_total counter" in lines
+    assert "# TYPE hypermodel_cache_hit_ratio gauge" in lines
+    assert any(line.startswith("hypermodel_route_lookups_total ") for line in lines)
+
+
+def test_stats_router_not_in_schema(stats_client: TestClient) -> None:
+    schema = stats_client.get("/openapi.json").json()
+
+    assert "/_hypermodel/stats" not in schema["paths"]
+
+
+@pytest.mark.usefixtures("stats_app")
+def test_stats_render_phases(
+    aggregator: InMemoryAggregator, stats_client: TestClient
+) -> None:
+    MockItem(id_="item01")
+    MockItem(id_="locked")
+
+    render = stats_client.get("/_hypermodel/stats").json()["render"]
+
+    conditions = [
+        sample
+        for sample in render
+        if sample["labels"]["phase"] == "condition"
+        and sample["metric"] == "hypermodel_phase_calls_total"
+    ]
+    assert conditions == [
+        {
+            "metric": "hypermodel_phase_calls_total",
+            "labels": {
+                "phase": "condition",
+                "model": "UrlFor",
+                "endpoint": "read_item",
+            },
+            "value": 2,
+        }
+    ]
+    assert len(aggregator.stats(model="MockItem")) > 0
+
+
+def test_cache_samples() -> None:
+    samples = list(cache_samples({"mock": MockCache(), "empty": MockEmptyCache()})())
+
+    values = {
+        (sample.metric, sample.labels["cache"]): sample.value for sample in samples
+    }
+    assert values[("hypermodel_cache_hits_total", "mock")] == 3
+    assert values[("hypermodel_cache_misses_total", "mock")] == 1
+    assert values[("hypermodel_cache_hit_ratio", "mock")] == pytest.approx(0.75)
+    assert values[("hypermodel_cache_hit_ratio", "empty")] == 0.0
+    assert values[("hypermodel_cache_size", "mock")] == 1
+
+    ratio = next(
+        sample for sample in samples if sample.metric == "hypermodel_cache_hit_ratio"
+    )
+    assert ratio.kind == METRIC_GAUGE
+
+
+def test_route_lookup_misses() -> None:
+    app = FastAPI()
+
+    @app.get("/items")
+    def read_items() -> Any:  # pragma: no cover
+        pass
+
+    lookups = route_lookup_count()
+    misses = route_lookup_miss_count()
+
+    get_route_from_app(app, "read_items")
+    get_route_from_app(app, "read_items")
+    app.get("/people")(read_items)
+    get_route_from_app(app, "read_items")
+
+    assert route_lookup_count() == lookups + 3
+    assert route_lookup_miss_count() == misses + 2
+
+
+@pytest.mark.parametrize(
+    ("sample_rate", "threshold", "expected"),
+    [
+        pytest.param(1.0, 0.0, [2, 2, 1.0, 2], id="all slow"),
+        pytest.param(1.0, float("inf"), [2, 2, 1.0, 0], id="none slow"),
+        pytest.param(0.0, 0.0, [2, 0, 0.0, 0], id="none sampled"),
+    ],
+)
+def test_slow_render_samples(
+    sample_rate: float, threshold: float, expected: List[float]
+) -> None:
+    detector = SlowRenderDetector(threshold=threshold, sample_rate=sample_rate)
+    collect = slow_render_samples(detector)
+
+    assert [sample.value for sample in collect()] == [0, 0, 0.0, 0]
+
+    with instrumented(detector):
+        MockItem(id_="item01")
+        MockItem(id_="item02")
+
+    samples = list(collect())
+    assert [sample.metric for sample in samples] == [
+        "hypermodel_renders_total",
+        "hypermodel_sampled_renders_total",
+        "hypermodel_render_sample_ratio",
+        "hypermodel_slow_renders_total",
+    ]
+    assert [sample.value for sample in samples] == expected
+
+
+def test_registry_escapes_label_values() -> None:
+    registry = StatsRegistry()
+    registry.register("mock", label_provider)
+
+    assert registry.to_prometheus() == (
+        '# TYPE mock_total counter\nmock_total{name="quoted \\"name\\"\\\\\\n"} 1\n'
+    )
+
+    registry.unregister("mock")
+    assert registry.collect() == {}
@@ -0,0 +1,342 @@
+from typing import Any, Dict, Optional, Sequence
+
+import pytest
+from fastapi import FastAPI
+from pydantic import Field, ValidationError
+
+from fastapi_hypermodel import (
+    FrozenDict,
+    HALFor,
+    HALForType,
+    HALHyperModel,
+    HALLinks,
+    HyperModel,
+    SirenHyperModel,
+    SirenLinkFor,
+    SirenLinkType,
+)
+
+
+class MockHALChild(HALHyperModel):
+    id_: str
+    name: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+
+class MockHALStaticChild(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({"self": HALForType(href="/static")})
+
+
+class MockHALUnlinkedChild(HALHyperModel):
+    id_: str
+
+
+class MockHALParent(HALHyperModel):
+    id_: str
+    children: Sequence[MockHALChild] = Field(alias="sc:children")
+    favorite: Optional[MockHALChild] = None
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+
+class MockHALShallowParent(MockHALParent):
+    max_embed_depth = 0
+
+
+class MockHALSmallParent(MockHALParent):
+    max_embedded_items = 1
+
+
+class MockHALDeepParent(MockHALParent):
+    max_embed_depth = 5
+
+
+class MockHALAliasedChild(HALHyperModel):
+    id_: str = Field(alias="id")
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+
+class MockHALAliasedParent(HALHyperModel):
+    id_: str
+    children: Sequence[MockHALAliasedChild]
+
+    max_embedded_items = 1
+
+
+class MockHALMappingParent(HALHyperModel):
+    id_: str
+    children: Dict[str, MockHALChild]
+
+    max_embed_depth = 0
+
+
+class MockHALGrandParent(HALHyperModel):
+    id_: str
+    parents: Sequence[MockHALDeepParent]
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+    max_embed_depth = 1
+
+
+class MockHALOtherChildren(HALHyperModel):
+    id_: str
+    static: Sequence[MockHALStaticChild]
+    unlinked: Sequence[MockHALUnlinkedChild] = ()
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+    max_embed_depth = 0
+
+
+class MockSirenChild(SirenHyperModel):
+    id_: str
+    name: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("mock_read_with_path", {"id_": "<id_>"}, rel=["self"]),
+    )
+
+
+class MockSirenHiddenChild(SirenHyperModel):
+    id_: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor(
+            "mock_read_with_path",
+            {"id_": "<id_>"},
+            rel=["self"],
+            condition=lambda _: False,
+        ),
+    )
+
+
+class MockSirenUnlinkedChild(SirenHyperModel):
+    id_: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("mock_read_with_path", {"id_": "<id_>"}, rel=["other"]),
+    )
+
+
+class MockSirenParent(SirenHyperModel):
+    id_: str
+    children: Sequence[MockSirenChild]
+    hidden: Sequence[MockSirenHiddenChild] = ()
+    unlinked: Sequence[MockSirenUnlinkedChild] = ()
+
+    max_embed_depth = 0
+
+
+class MockSirenStaticParent(SirenHyperModel):
+    id_: str
+    children: Sequence[SirenHyperModel]
+
+    max_embed_depth = 0
+
+
+class MockChild(HyperModel):
+    id_: str
+
+
+class MockParent(HyperModel):
+    id_: str
+    child: Optional[MockChild] = None
+
+    max_embed_depth = 0
+
+
+@pytest.fixture()
+def hal_app(app: FastAPI) -> FastAPI:
+    HALHyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def siren_app(app: FastAPI) -> FastAPI:
+    SirenHyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def children() -> Any:
+    return [{"id_": "child01", "name": "Foo"}, {"id_": "child02", "name": "Bar"}]
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_embeds_without_limits(children: Any) -> None:
+    parent = MockHALParent.model_validate({"id_": "parent", "sc:children": children})
+
+    embedded = parent.model_dump(by_alias=True).get("_embedded", {})
+
+    assert [child.get("id_") for child in embedded.get("sc:children", [])] == [
+        "child01",
+        "child02",
+    ]
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_depth_limit_links_children() -> None:
+    parent = MockHALShallowParent.model_validate({
+        "id_": "parent",
+        "sc:children": [{"id_": "child01"}],
+        "favorite": {"id_": "child02"},
+    })
+
+    dumped = parent.model_dump(by_alias=True)
+    links = dumped.get("_links", {})
+
+    assert "_embedded" not in dumped
+    assert links.get("sc:children") == [{"href": "/mock_read/child01"}]
+    assert links.get("favorite") == {"href": "/mock_read/child02"}
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_size_limit_links_children(children: Any) -> None:
+    parent = MockHALSmallParent.model_validate({
+        "id_": "parent",
+        "sc:children": children,
+        "favorite": children[0],
+    })
+
+    dumped = parent.model_dump(by_alias=True)
+
+    assert dumped.get("_links", {}).get("sc:children") == [
+        {"href": "/mock_read/child01"},
+        {"href": "/mock_read/child02"},
+    ]
+    favorite, *_ = dumped.get("_embedded", {}).get("favorite", [])
+    assert favorite.get("name") == "Foo"
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_depth_limit_is_inherited(children: Any) -> None:
+    grand_parent = MockHALGrandParent.model_validate({
+        "id_": "grand_parent",
+        "parents": [{"id_": "parent", "sc:children": children}],
+    })
+
+    embedded = grand_parent.model_dump(by_alias=True).get("_embedded", {})
+    parent, *_ = embedded.get("parents", [])
+
+    assert "_embedded" not in parent
+    assert len(parent.get("_links", {}).get("sc:children")) == 2
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_references_from_instances(children: Any) -> None:
+    child = MockHALChild(**children[0])
+
+    parent = MockHALShallowParent(id_="parent", **{"sc:children": [child]})
+
+    links = parent.model_dump(by_alias=True).get("_links", {})
+    assert links.get("sc:children") == [{"href": "/mock_read/child01"}]
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_references_without_self_link() -> None:
+    parent = MockHALOtherChildren.model_validate({
+        "id_": "parent",
+        "static": [{"id_": "static"}],
+        "unlinked": [{"id_": "unlinked"}],
+    })
+
+    links = parent.model_dump(by_alias=True).get("_links", {})
+
+    assert links.get("static") == [{"href": "/static"}]
+    assert "unlinked" not in links
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_references_from_mapping(children: Any) -> None:
+    parent = MockHALMappingParent.model_validate({
+        "id_": "parent",
+        "children": {"first": children[0], "second": children[1]},
+    })
+
+    links = parent.model_dump(by_alias=True).get("_links", {})
+
+    assert links.get("children") == [
+        {"href": "/mock_read/child01"},
+        {"href": "/mock_read/child02"},
+    ]
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_references_from_aliased_fields() -> None:
+    parent = MockHALAliasedParent.model_validate({
+        "id_": "parent",
+        "children": [{"id": "child01"}, {"id": "child02"}],
+    })
+
+    links = parent.model_dump(by_alias=True).get("_links", {})
+
+    assert links.get("children") == [
+        {"href": "/mock_read/child01"},
+        {"href": "/mock_read/child02"},
+    ]
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_reference_missing_attribute() -> None:
+    with pytest.raises(ValidationError, match="Cannot reference MockHALChild"):
+        MockHALShallowParent.model_validate({
+            "id_": "parent",
+            "sc:children": [{"name": "Foo"}],
+        })
+
+
+@pytest.mark.usefixtures("siren_app")
+def test_siren_depth_limit_links_children(children: Any) -> None:
+    parent = MockSirenParent.model_validate({
+        "id_": "parent",
+        "children": children,
+        "hidden": [{"id_": "hidden"}],
+        "unlinked": [{"id_": "unlinked"}],
+    })
+
+    dumped = parent.model_dump(by_alias=True)
+
+    assert dumped.get("entities") == [
+        {"rel": ["children"], "href": "/mock_read/child01"},
+        {"rel": ["children"], "href": "/mock_read/child02"},
+    ]
+    assert dumped.get("properties") == {"id_": "parent"}
+
+
+@pytest.mark.usefixtures("siren_app")
+def test_siren_references_without_links() -> None:
+    parent = MockSirenStaticParent.model_validate({
+        "id_": "parent",
+        "children": [{}],
+    })
+
+    assert not parent.model_dump().get("entities")
+
+
+@pytest.mark.usefixtures("siren_app")
+def test_siren_reference_is_a_link(children: Any) -> None:
+    reference = MockSirenChild.as_reference(children[0], "item")
+
+    assert reference == SirenLinkType(rel=["item"], href="/mock_read/child01")
+
+
+@pytest.mark.usefixtures("app")
+def test_hypermodel_drops_children_past_limits() -> None:
+    parent = MockParent.model_validate({"id_": "parent", "child": {"id_": "child"}})
+
+    assert parent.model_dump() == {"id_": "parent"}
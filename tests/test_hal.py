@@ -1,3 +1,4 @@
+import copy
 import uuid
 from typing import Any, Generator, List, Mapping, Sequence
 
@@ -66,6 +67,15 @@ class MockClassWithCuries(HALHyperModel):
     })
 
 
+class MockClassWithTemplatedLink(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path_hal", {"id_": "<id_>"}),
+        "find": HALFor("mock_read_with_path_hal", templated=True),
+    })
+
+
 class MockClassWithMissingCuries(HALHyperModel):
     id_: str
 
@@ -468,6 +478,60 @@ def test_build_hypermedia_template(hal_app: FastAPI) -> None:
     assert uri.href == "/mock_read/{id_}"
 
 
+def test_build_hypermedia_template_is_resolved_once(hal_app: FastAPI) -> None:
+    hal_for = HALFor("mock_read_with_path", templated=True)
+
+    first = hal_for(hal_app, {"id_": "first"})
+    second = hal_for(hal_app, {"id_": "second"})
+
+    assert first is second
+
+
+def test_build_hypermedia_with_query(hal_app: FastAPI) -> None:
+    hal_for = HALFor(
+        "mock_read_with_path",
+        {"id_": "<id_>"},
+        query={"sort": "<sort>", "fields": ["id_", "name"]},
+    )
+
+    hal_for_type = hal_for(hal_app, {"id_": "test", "sort": "-name"})
+
+    assert hal_for_type
+    assert hal_for_type.href == "/mock_read/test?sort=-name&fields=id_&fields=name"
+
+
+def test_hal_for_definitions_are_shared() -> None:
+    hal_for = HALFor("mock_read_with_path_hal", {"id_": "<id_>"})
+    links = MockClass.model_fields["links"]
+
+    assert copy.copy(hal_for) is hal_for
+    assert copy.deepcopy(hal_for) is hal_for
+    assert links.get_default(call_default_factory=True) is links.default
+
+
+def test_frozen_dict_copies_resolved_links() -> None:
+    link = HALForType(href="/items")
+    links = FrozenDict({"self": link})
+
+    copied = copy.deepcopy(links)
+
+    assert copied is not links
+    assert isinstance(copied, FrozenDict)
+    assert copied["self"] == link
+    assert copied["self"] is not link
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_constant_links_are_shared_across_instances() -> None:
+    first = MockClassWithTemplatedLink(id_="first")
+    second = MockClassWithTemplatedLink(id_="second")
+
+    assert first.links
+    assert second.links
+    assert first.links["find"] is second.links["find"]
+    assert first.links["self"] is not second.links["self"]
+
+
 def test_build_hypermedia_not_passing_condition(hal_app: FastAPI) -> None:
     sample_id = "test"
     hal_for = HALFor(
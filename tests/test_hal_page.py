@@ -0,0 +1,158 @@
+from typing import Any, List, Optional
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from fastapi_hypermodel import (
+    LAST_CURSOR,
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HALPage,
+    HALResponse,
+    InvalidCursor,
+    Selection,
+    paginate,
+    use_selection,
+)
+
+
+class MockItem(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+
+class MockItemPage(HALPage[MockItem]):
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_items", title="Items"),
+    })
+
+
+class MockUnlinkedPage(HALPage[MockItem]):
+    pass
+
+
+@pytest.fixture()
+def records() -> List[Any]:
+    return [{"id_": f"item{index:02}"} for index in range(1, 6)]
+
+
+@pytest.fixture()
+def page_app(app: FastAPI, records: List[Any]) -> FastAPI:
+    @app.get(
+        "/mock_items",
+        response_model=MockItemPage,
+        response_model_exclude_unset=True,
+        response_class=HALResponse,
+    )
+    def mock_read_items(cursor: Optional[str] = None, size: int = 2) -> Any:
+        try:
+            page = paginate(records, lambda item: item["id_"], cursor, size)
+        except InvalidCursor as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+        return page._asdict()
+
+    HALHyperModel.init_app(app)
+
+    return app
+
+
+def hrefs(page: Any) -> Any:
+    return {
+        name: link.get("href")
+        for name, link in page.get("_links", {}).items()
+        if name != "curies"
+    }
+
+
+@pytest.mark.usefixtures("page_app")
+def test_first_page_links(records: List[Any]) -> None:
+    page = paginate(records, lambda item: item["id_"], size=2)
+
+    dumped = MockItemPage(**page._asdict()).model_dump(by_alias=True)
+
+    assert hrefs(dumped) == {
+        "self": "/mock_items?size=2",
+        "first": "/mock_items?size=2",
+        "next": f"/mock_items?cursor={page.next_cursor}&size=2",
+        "last": f"/mock_items?cursor={LAST_CURSOR}&size=2",
+    }
+    assert dumped.get("_links", {}).get("self", {}).get("title") == "Items"
+    assert len(dumped.get("_embedded", {}).get("items", [])) == 2
+    assert "page_size" not in dumped
+
+
+@pytest.mark.usefixtures("page_app")
+def test_last_page_links(records: List[Any]) -> None:
+    page = paginate(records, lambda item: item["id_"], LAST_CURSOR, 2)
+
+    dumped = MockItemPage(**page._asdict()).model_dump(by_alias=True)
+
+    assert hrefs(dumped) == {
+        "self": f"/mock_items?cursor={LAST_CURSOR}&size=2",
+        "first": "/mock_items?size=2",
+        "prev": f"/mock_items?cursor={page.prev_cursor}&size=2",
+        "last": f"/mock_items?cursor={LAST_CURSOR}&size=2",
+    }
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_links_selection(records: List[Any]) -> None:
+    page = paginate(records, lambda item: item["id_"], size=2)
+
+    with use_selection(Selection(fields=frozenset(), links=frozenset({"next"}))):
+        dumped = MockItemPage(**page._asdict()).model_dump(by_alias=True)
+
+    assert set(hrefs(dumped)) == {"self", "next"}
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_href_keeps_query() -> None:
+    page = MockItemPage(items=[], page_size=10)
+
+    assert (
+        page.page_href("/items?owner=me", "abc") == "/items?owner=me&cursor=abc&size=10"
+    )
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_is_bounded(records: List[Any]) -> None:
+    page = MockItemPage(items=records, page_size=2).model_dump(by_alias=True)
+
+    assert len(page.get("_embedded", {}).get("items", [])) == 2
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_without_self_link() -> None:
+    page = MockUnlinkedPage(items=[{"id_": "item01"}])
+
+    assert not page.links
+
+
+def test_paginated_endpoint(page_app: FastAPI) -> None:
+    client = TestClient(page_app)
+
+    first = client.get("/mock_items").json()
+    second = client.get(hrefs(first)["next"]).json()
+    last = client.get(hrefs(second)["last"]).json()
+
+    assert [item.get("id_") for item in second["_embedded"]["items"]] == [
+        "item03",
+        "item04",
+    ]
+    assert [item.get("id_") for item in last["_embedded"]["items"]] == [
+        "item04",
+        "item05",
+    ]
+    assert "next" not in hrefs(last)
+
+
+def test_paginated_endpoint_invalid_cursor(page_app: FastAPI) -> None:
+    response = TestClient(page_app).get("/mock_items?cursor=invalid")
+
+    assert response.status_code == 400
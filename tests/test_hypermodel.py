@@ -1,3 +1,4 @@
+import copy
 from typing import Any, Optional
 
 import pytest
@@ -6,6 +7,7 @@ from pydantic import BaseModel, PrivateAttr
 from typing_extensions import Self
 
 from fastapi_hypermodel import AbstractHyperField, HyperModel, InvalidAttribute
+from fastapi_hypermodel.base import ConstantCache, construct_unvalidated, format_uri
 
 
 class MockHypermediaType(BaseModel):
@@ -93,3 +95,84 @@ def test_hypermodel_validator_empty() -> None:
     mock = MockClassWithEmptyField()
 
     assert mock == MockClassWithEmptyField()
+
+
+def test_constant_cache_is_shared_by_copies(app: FastAPI) -> None:
+    cache: ConstantCache[MockHypermediaType] = ConstantCache()
+    value = MockHypermediaType(href="test")
+    cache.set(app, value)
+
+    assert copy.copy(cache) is cache
+    assert copy.deepcopy(cache) is cache
+    assert copy.deepcopy(cache).get(app) is value
+
+
+def test_constant_cache_is_bound_to_app(
+    app: FastAPI, unregistered_app: FastAPI
+) -> None:
+    cache: ConstantCache[MockHypermediaType] = ConstantCache()
+    cache.set(app, MockHypermediaType(href="test"))
+
+    assert cache.get(unregistered_app) is None
+
+
+def test_constant_cache_info(app: FastAPI, unregistered_app: FastAPI) -> None:
+    hits, misses, size = ConstantCache.cache_info()
+    cache: ConstantCache[MockHypermediaType] = ConstantCache()
+
+    cache.get(app)
+    cache.set(app, MockHypermediaType(href="test"))
+    cache.get(app)
+    cache.set(unregistered_app, MockHypermediaType(href="other"))
+
+    assert ConstantCache.cache_info() == (hits + 1, misses + 1, size + 1)
+
+
+def test_parse_uri_literals_and_format() -> None:
+    uri_template = "/model/{id_!s:>6}/edit{id_}"
+
+    mock = MockSimpleClass(id_="test")
+
+    assert mock.parse_uri(uri_template) == "/model/  test/edittest"
+    assert mock.parse_uri("/models") == "/models"
+
+
+def test_parse_uri_dotted() -> None:
+    values = {"owner": {"id_": "a b"}}
+
+    assert HyperModel._parse_uri(values, "/people/{owner.id_}") == "/people/a%20b"  # noqa: SLF001
+
+
+def test_format_uri_is_reused_across_values() -> None:
+    uri_template = "/model/{id_}/compiled"
+
+    uris = [format_uri(MockSimpleClass(id_=id_), uri_template) for id_ in "ab"]
+
+    assert uris == ["/model/a/compiled", "/model/b/compiled"]
+    assert format_uri({"id_": "c"}, uri_template) == "/model/c/compiled"
+
+
+def test_construct_unvalidated() -> None:
+    mock = construct_unvalidated(MockHypermediaType, href="/model/test")
+
+    assert mock == MockHypermediaType(href="/model/test")
+    assert mock.model_fields_set == {"href"}
+    assert mock.model_dump() == {"href": "/model/test"}
+
+
+def test_construct_unvalidated_defaults() -> None:
+    mock = construct_unvalidated(MockHypermediaType)
+
+    assert mock.href is None
+    assert not mock.model_fields_set
+
+
+def test_construct_unvalidated_shares_fields_set() -> None:
+    first = construct_unvalidated(MockHypermediaType, href="/first")
+    second = construct_unvalidated(MockHypermediaType, href="/second")
+
+    first.href = "/changed"
+
+    assert first.model_fields_set is second.model_fields_set
+    assert first.model_fields_set == {"href"}
+    assert second.href == "/second"
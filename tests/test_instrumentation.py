@@ -0,0 +1,243 @@
+from typing import Any, Iterator, List, Mapping, Optional, Sequence
+
+import pytest
+from fastapi import FastAPI
+from starlette.applications import Starlette
+
+from fastapi_hypermodel import (
+    AbstractHyperField,
+    Event,
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HALResponse,
+    HyperModel,
+    InMemoryAggregator,
+    Instrument,
+    SirenActionFor,
+    SirenHyperModel,
+    SirenLinkFor,
+    SirenResponse,
+    UrlFor,
+    UrlType,
+    add_instrument,
+    instrumented,
+    remove_instrument,
+)
+from fastapi_hypermodel.instrumentation import (
+    PHASE_ACTIONS,
+    PHASE_EMBEDDED,
+    PHASE_ENCODING,
+    PHASE_HYPERFIELD,
+    PHASE_HYPERMEDIA,
+    PHASE_LINKS,
+    PHASE_RESPONSE_VALIDATION,
+)
+
+
+class MockStaticField(AbstractHyperField[UrlType]):
+    def __call__(
+        self, app: Optional[Starlette], values: Mapping[str, Any]
+    ) -> Optional[UrlType]:
+        return UrlType("/static")
+
+
+class MockItem(HyperModel):
+    id_: str
+
+    href: UrlFor = UrlFor("mock_read_with_path", {"id_": "<id_>"})
+    static: Any = MockStaticField()
+
+
+class MockHALChild(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+
+class MockHALParent(HALHyperModel):
+    id_: str
+    children: Sequence[MockHALChild]
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+
+class MockSirenChild(SirenHyperModel):
+    id_: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("mock_read_with_path", {"id_": "<id_>"}, rel=["self"]),
+    )
+
+
+class MockSirenParent(SirenHyperModel):
+    id_: str
+    children: Sequence[MockSirenChild]
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("mock_read_with_path", {"id_": "<id_>"}, rel=["self"]),
+    )
+
+    actions: Sequence[SirenActionFor] = (
+        SirenActionFor("mock_read_with_path", {"id_": "<id_>"}, name="read"),
+    )
+
+
+class MockInstrument:
+    def __init__(self) -> None:
+        self.events: List[Event] = []
+
+    def record(self, event: Event) -> None:
+        self.events.append(event)
+
+
+@pytest.fixture()
+def aggregator() -> Iterator[InMemoryAggregator]:
+    with instrumented(InMemoryAggregator()) as instrument:
+        yield instrument
+
+
+@pytest.fixture()
+def hal_app(app: FastAPI) -> FastAPI:
+    HALHyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def siren_app(app: FastAPI) -> FastAPI:
+    SirenHyperModel.init_app(app)
+    return app
+
+
+@pytest.mark.usefixtures("app")
+def test_instrumentation_records_hyperfields(aggregator: InMemoryAggregator) -> None:
+    MockItem(id_="item01")
+    MockItem(id_="item02")
+
+    hypermedia, *_ = aggregator.stats(phase=PHASE_HYPERMEDIA)
+    assert hypermedia.model == "MockItem"
+    assert hypermedia.name is None
+    assert hypermedia.calls == 2
+
+    hyperfields = {
+        stats.name: stats.calls for stats in aggregator.stats(phase=PHASE_HYPERFIELD)
+    }
+    assert hyperfields == {"mock_read_with_path": 2, "MockStaticField": 2}
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_instrumentation_records_hal_phases(aggregator: InMemoryAggregator) -> None:
+    MockHALParent.model_validate({
+        "id_": "parent",
+        "children": [{"id_": "child01"}, {"id_": "child02"}],
+    })
+
+    links = {stats.model: stats.calls for stats in aggregator.stats(phase=PHASE_LINKS)}
+    assert links == {"MockHALChild": 2, "MockHALParent": 1}
+
+    embedded = aggregator.stats(phase=PHASE_EMBEDDED, model="MockHALParent")
+    assert len(embedded) == 1
+
+    hyperfields = aggregator.stats(phase=PHASE_HYPERFIELD, model="MockHALChild")
+    assert [stats.name for stats in hyperfields] == ["mock_read_with_path"]
+
+
+@pytest.mark.usefixtures("siren_app")
+def test_instrumentation_records_siren_phases(aggregator: InMemoryAggregator) -> None:
+    MockSirenParent.model_validate({
+        "id_": "parent",
+        "children": [{"id_": "child01"}],
+    })
+
+    phases = {(stats.phase, stats.model) for stats in aggregator.stats()}
+    assert (PHASE_LINKS, "MockSirenChild") in phases
+    assert (PHASE_LINKS, "MockSirenParent") in phases
+    assert (PHASE_ACTIONS, "MockSirenParent") in phases
+    assert (PHASE_EMBEDDED, "MockSirenParent") in phases
+
+
+@pytest.mark.parametrize(
+    ("response_class", "content"),
+    [
+        pytest.param(HALResponse, {"id_": "item01"}, id="HAL"),
+        pytest.param(SirenResponse, {"properties": {}}, id="Siren"),
+    ],
+)
+def test_instrumentation_records_response_phases(
+    aggregator: InMemoryAggregator, response_class: Any, content: Any
+) -> None:
+    response_class(content)
+
+    phases = {(stats.phase, stats.model) for stats in aggregator.stats()}
+    assert phases == {
+        (PHASE_RESPONSE_VALIDATION, response_class.__name__),
+        (PHASE_ENCODING, response_class.__name__),
+    }
+
+
+@pytest.mark.usefixtures("app")
+def test_instrumentation_is_disabled_without_instruments() -> None:
+    instrument = MockInstrument()
+    with instrumented(instrument):
+        MockItem(id_="item01")
+
+    recorded = len(instrument.events)
+    MockItem(id_="item02")
+
+    assert recorded
+    assert len(instrument.events) == recorded
+
+
+@pytest.mark.usefixtures("app")
+def test_instrument_is_added_once() -> None:
+    instrument = MockInstrument()
+    add_instrument(instrument)
+    add_instrument(instrument)
+    try:
+        MockItem(id_="item01")
+    finally:
+        remove_instrument(instrument)
+
+    hypermedia = [
+        event for event in instrument.events if event.phase == PHASE_HYPERMEDIA
+    ]
+    assert len(hypermedia) == 1
+    assert isinstance(instrument, Instrument)
+
+
+def test_aggregator_stats() -> None:
+    aggregator = InMemoryAggregator()
+    aggregator.record(Event(PHASE_HYPERFIELD, "Item", "read_item", 0.1))
+    aggregator.record(Event(PHASE_HYPERFIELD, "Item", "read_item", 0.3))
+    aggregator.record(Event(PHASE_HYPERFIELD, "Item", "update_item", 1.0))
+    aggregator.record(Event(PHASE_HYPERMEDIA, "Person", None, 0.5))
+
+    assert len(aggregator) == 3
+
+    slowest, read_item = aggregator.stats(phase=PHASE_HYPERFIELD)
+    assert slowest.name == "update_item"
+    assert read_item.calls == 2
+    assert read_item.total == pytest.approx(0.4)
+    assert read_item.minimum == pytest.approx(0.1)
+    assert read_item.maximum == pytest.approx(0.3)
+    assert read_item.mean == pytest.approx(0.2)
+
+    person, *_ = aggregator.stats(model="Person")
+    assert person.phase == PHASE_HYPERMEDIA
+
+    aggregator.reset()
+    assert aggregator.stats() == []
+
+
+def test_aggregator_stats_mean_without_calls() -> None:
+    aggregator = InMemoryAggregator()
+    aggregator.record(Event(PHASE_HYPERMEDIA, "Item", None, 0.5))
+
+    stats, *_ = aggregator.stats()
+
+    assert stats._replace(calls=0).mean == 0.0
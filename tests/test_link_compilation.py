@@ -0,0 +1,145 @@
+from typing import Any, Sequence
+
+import pytest
+from fastapi import FastAPI
+
+from fastapi_hypermodel import (
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HyperModel,
+    InvalidHyperField,
+    SirenActionFor,
+    SirenHyperModel,
+    SirenLinkFor,
+    UrlFor,
+)
+
+
+class MockValidBase(HyperModel):
+    pass
+
+
+class MockValidItem(MockValidBase):
+    id_: str
+
+    href: UrlFor = UrlFor("read_item", {"id_": "<id_>"})
+    find: UrlFor = UrlFor("read_item", templated=True)
+    collection: UrlFor = UrlFor("read_items")
+
+
+class MockInvalidHALBase(HALHyperModel):
+    pass
+
+
+class MockInvalidHALItem(MockInvalidHALBase):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("read_item", {"id_": "<id_>"}),
+        "collection": HALFor("read_items"),
+        "typo": HALFor("read_itme", {"id_": "<id_>"}),
+        "missing": HALFor("read_item"),
+        "related": [HALFor("read_items", {"id_": "<id_>"})],
+    })
+
+
+class MockInvalidHALChild(MockInvalidHALItem):
+    pass
+
+
+class MockInvalidSirenBase(SirenHyperModel):
+    pass
+
+
+class MockInvalidSirenItem(MockInvalidSirenBase):
+    id_: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("read_item", {"id_": "<id_>"}, rel=["self"]),
+        SirenLinkFor("read_items", rel=["collection"]),
+        SirenLinkFor("read_person", {"id_": "<id_>"}, rel=["owner"]),
+    )
+
+    actions: Sequence[SirenActionFor] = (
+        SirenActionFor("update_item", {"id_": "<id_>"}, name="update"),
+        SirenActionFor("read_items", name="list", method="GET"),
+        SirenActionFor("update_item", name="update_any"),
+    )
+
+
+@pytest.fixture()
+def items_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    def read_items() -> Any:
+        pass
+
+    @app.get("/items/{id_}")
+    def read_item() -> Any:
+        pass
+
+    @app.put("/items/{id_}")
+    def update_item() -> Any:
+        pass
+
+    return app
+
+
+def test_init_app_validates_hyperfields(items_app: FastAPI) -> None:
+    MockValidBase.init_app(items_app, validate=True)
+
+    item = MockValidItem(id_="item01")
+
+    assert item.href.hypermedia == "/items/item01"
+    assert item.find.hypermedia == "/items/{id_}"
+    assert item.collection.hypermedia == "/items"
+
+
+def test_compile_resolves_constant_hyperfields(items_app: FastAPI) -> None:
+    collection = MockValidItem.model_fields["collection"].default
+    href = MockValidItem.model_fields["href"].default
+
+    MockValidBase.compile_hyperfields(items_app)
+
+    assert collection._constant.get(items_app) is not None  # noqa: SLF001
+    assert href._constant.get(items_app) is None  # noqa: SLF001
+
+
+def test_init_app_reports_invalid_hal_hyperfields(items_app: FastAPI) -> None:
+    with pytest.raises(InvalidHyperField) as error:
+        MockInvalidHALBase.init_app(items_app, validate=True)
+
+    message = str(error.value)
+    assert message.splitlines() == [
+        "Invalid hyperfields:",
+        "MockInvalidHALItem.links.typo: No route found for endpoint read_itme",
+        "MockInvalidHALItem.links.missing: Endpoint read_item takes the path "
+        "parameters ['id_'], not []",
+        "MockInvalidHALItem.links.related.0: Endpoint read_items takes the path "
+        "parameters [], not ['id_']",
+    ]
+
+
+def test_init_app_reports_invalid_siren_hyperfields(items_app: FastAPI) -> None:
+    with pytest.raises(InvalidHyperField) as error:
+        MockInvalidSirenBase.init_app(items_app, validate=True)
+
+    assert str(error.value).splitlines() == [
+        "Invalid hyperfields:",
+        "MockInvalidSirenItem.links.2: No route found for endpoint read_person",
+        "MockInvalidSirenItem.actions.2: Endpoint update_item takes the path "
+        "parameters ['id_'], not []",
+    ]
+
+
+def test_init_app_without_validation(items_app: FastAPI) -> None:
+    MockInvalidHALBase.init_app(items_app)
+
+    assert MockInvalidHALItem._app is items_app  # noqa: SLF001
+
+
+def test_invalid_hyperfield_is_value_error() -> None:
+    assert issubclass(InvalidHyperField, ValueError)
@@ -0,0 +1,445 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Sequence, Type
+
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from fastapi_hypermodel import (
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HyperModel,
+    InvalidHyperField,
+    InvalidLinkTable,
+    LinkTable,
+    SirenActionFor,
+    SirenHyperModel,
+    SirenLinkFor,
+    UrlFor,
+)
+from fastapi_hypermodel.__main__ import main
+from fastapi_hypermodel.base import (
+    LINK_TABLE_VERSION,
+    CompiledLink,
+    route_table_build_count,
+)
+from fastapi_hypermodel.base.link_table import model_key, route_paths
+
+
+class MockTableBase(HALHyperModel):
+    pass
+
+
+class MockTableItem(MockTableBase):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("read_item", {"id_": "<id_>"}),
+        "collection": HALFor("read_items"),
+    })
+
+
+class MockTableRenamedBase(HALHyperModel):
+    pass
+
+
+class MockTableRenamedItem(MockTableRenamedBase):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("read_itme", {"id_": "<id_>"}),
+        "collection": HALFor("read_items"),
+    })
+
+
+class MockTableUrlBase(HyperModel):
+    pass
+
+
+class MockTableUrlItem(MockTableUrlBase):
+    collection: UrlFor = UrlFor("read_items")
+
+
+class MockTableQueryBase(HyperModel):
+    pass
+
+
+class MockTableQueryItem(MockTableQueryBase):
+    collection: UrlFor = UrlFor("read_items", query={"limit": 50})
+
+
+class MockTableUntemplatedBase(HyperModel):
+    pass
+
+
+class MockTableUntemplatedItem(MockTableUntemplatedBase):
+    item: UrlFor = UrlFor("read_item")
+
+
+class MockTableSirenBase(SirenHyperModel):
+    pass
+
+
+class MockTableSirenItem(MockTableSirenBase):
+    links: Sequence[SirenLinkFor] = (SirenLinkFor("read_items", rel=["collection"]),)
+
+    actions: Sequence[SirenActionFor] = (
+        SirenActionFor("read_items", name="list"),
+        SirenActionFor("create_item", name="create"),
+    )
+
+
+class MockTableSirenChild(MockTableSirenItem):
+    pass
+
+
+class MockTableItemCreate(BaseModel):
+    name: str
+
+
+class MockTableInvalidBase(HALHyperModel):
+    pass
+
+
+class MockTableInvalidItem(MockTableInvalidBase):
+    links: HALLinks = FrozenDict({
+        "person": HALFor("read_person"),
+    })
+
+
+def create_app() -> FastAPI:
+    app_ = FastAPI()
+
+    @app_.get("/items")
+    def read_items() -> Any:
+        pass
+
+    @app_.get("/items/{id_}")
+    def read_item() -> Any:
+        pass
+
+    @app_.post("/items")
+    def create_item(item: MockTableItemCreate) -> Any:
+        pass
+
+    return app_
+
+
+app = create_app()
+
+BASE = f"{__name__}:MockTableBase"
+ITEM = f"{__name__}.MockTableItem"
+
+SELF_LINK = CompiledLink("read_item", ("id_",), "/items/{id_}")
+COLLECTION_LINK = CompiledLink("read_items", (), "/items", "/items", constant=True)
+
+
+@pytest.fixture()
+def link_table_file(tmp_path: Path) -> Path:
+    return tmp_path / "links.json"
+
+
+def test_compile_link_table() -> None:
+    table = MockTableBase.compile_link_table(app)
+
+    assert table.routes["read_item"] == "/items/{id_}"
+    assert table.models == {
+        f"{__name__}.MockTableBase": {},
+        ITEM: {"links.self": SELF_LINK, "links.collection": COLLECTION_LINK},
+    }
+    assert table.version == LINK_TABLE_VERSION
+
+
+def test_link_table_round_trip(link_table_file: Path) -> None:
+    table = MockTableBase.compile_link_table(app)
+
+    table.dump(link_table_file)
+
+    assert LinkTable.load(link_table_file) == table
+
+
+def test_init_app_with_link_table(link_table_file: Path) -> None:
+    MockTableBase.compile_link_table(app).dump(link_table_file)
+    live_app = create_app()
+
+    builds = route_table_build_count()
+
+    MockTableBase.init_app(live_app, link_table=link_table_file)
+
+    collection = MockTableItem.model_fields["links"].default["collection"]
+    assert collection._constant.get(live_app).href == "/items"  # noqa: SLF001
+    item = MockTableItem(id_="item01")
+    assert item.links["self"].href == "/items/item01"
+    assert route_table_build_count() == builds + 1
+
+
+def test_init_app_with_url_for_link_table(link_table_file: Path) -> None:
+    MockTableUrlBase.compile_link_table(app).dump(link_table_file)
+    live_app = create_app()
+
+    MockTableUrlBase.init_app(live_app, link_table=link_table_file)
+
+    collection = MockTableUrlItem.model_fields["collection"].default
+    assert collection._constant.get(live_app).hypermedia == "/items"  # noqa: SLF001
+
+
+def test_init_app_with_siren_link_table(link_table_file: Path) -> None:
+    table = MockTableSirenBase.compile_link_table(app)
+    table.dump(link_table_file)
+    live_app = create_app()
+
+    MockTableSirenBase.init_app(live_app, link_table=link_table_file)
+
+    assert table.models[f"{__name__}.MockTableSirenChild"] == {
+        "links.0": COLLECTION_LINK,
+        "actions.0": COLLECTION_LINK,
+        "actions.1": CompiledLink("create_item", (), "/items", constant=True),
+    }
+    link, *_ = MockTableSirenItem.model_fields["links"].default
+    list_action, create_action = MockTableSirenItem.model_fields["actions"].default
+    assert link._constant.get(live_app).href == "/items"  # noqa: SLF001
+    assert list_action._constant.get(live_app).method == "GET"  # noqa: SLF001
+    assert create_action._constant.get(live_app) is None  # noqa: SLF001
+
+
+def test_init_app_with_missing_model(link_table_file: Path) -> None:
+    table = MockTableSirenBase.compile_link_table(app)
+    models = dict(table.models)
+    del models[f"{__name__}.MockTableSirenChild"]
+    table._replace(models=models).dump(link_table_file)
+
+    with pytest.raises(InvalidHyperField) as error:
+        MockTableSirenBase.init_app(create_app(), link_table=link_table_file)
+
+    assert str(error.value).splitlines() == [
+        "Outdated link table:",
+        f"Model {__name__}.MockTableSirenChild is not in the link table",
+    ]
+
+
+def test_init_app_with_renamed_endpoint(link_table_file: Path) -> None:
+    table = MockTableBase.compile_link_table(app)
+    LinkTable(
+        routes=table.routes,
+        models={
+            f"{__name__}.MockTableRenamedBase": {},
+            f"{__name__}.MockTableRenamedItem": table.models[ITEM],
+        },
+    ).dump(link_table_file)
+
+    with pytest.raises(InvalidHyperField) as error:
+        MockTableRenamedBase.init_app(create_app(), link_table=link_table_file)
+
+    assert str(error.value).splitlines() == [
+        "Outdated link table:",
+        "MockTableRenamedItem.links.self: Link to read_itme with the path "
+        "parameters ['id_'] was compiled to read_item with ['id_']",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("links", "message"),
+    [
+        pytest.param(
+            {"links.collection": COLLECTION_LINK},
+            "Link to read_item is not in the link table",
+            id="missing",
+        ),
+        pytest.param(
+            {
+                "links.self": SELF_LINK._replace(params=()),
+                "links.collection": COLLECTION_LINK,
+            },
+            "Link to read_item with the path parameters ['id_'] was compiled to "
+            "read_item with []",
+            id="params",
+        ),
+        pytest.param(
+            {
+                "links.self": SELF_LINK._replace(path="/item/{id_}"),
+                "links.collection": COLLECTION_LINK,
+            },
+            "Endpoint read_item moved from /item/{id_} to /items/{id_}",
+            id="moved",
+        ),
+    ],
+)
+def test_init_app_with_outdated_hyperfield(
+    link_table_file: Path, links: Dict[str, CompiledLink], message: str
+) -> None:
+    table = MockTableBase.compile_link_table(app)
+    table._replace(models={**table.models, ITEM: links}).dump(link_table_file)
+
+    with pytest.raises(InvalidHyperField) as error:
+        MockTableBase.init_app(create_app(), link_table=link_table_file)
+
+    assert str(error.value).splitlines() == [
+        "Outdated link table:",
+        f"MockTableItem.links.self: {message}",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("base", "item", "link", "message"),
+    [
+        pytest.param(
+            MockTableQueryBase,
+            MockTableQueryItem,
+            COLLECTION_LINK,
+            "MockTableQueryItem.collection: Link to read_items with templated, "
+            "query and constant (False, 'limit=50', True) was compiled with "
+            "(False, None, True)",
+            id="query",
+        ),
+        pytest.param(
+            MockTableUntemplatedBase,
+            MockTableUntemplatedItem,
+            CompiledLink(
+                "read_item",
+                (),
+                "/items/{id_}",
+                "/items/{id_}",
+                templated=True,
+                constant=True,
+            ),
+            "MockTableUntemplatedItem.item: Link to read_item with templated, "
+            "query and constant (False, None, True) was compiled with "
+            "(True, None, True)",
+            id="templated",
+        ),
+    ],
+)
+def test_init_app_with_stale_href(
+    link_table_file: Path,
+    base: Type[HyperModel],
+    item: Type[HyperModel],
+    link: CompiledLink,
+    message: str,
+) -> None:
+    path, *_ = item.model_fields
+    LinkTable(
+        routes=route_paths(app),
+        models={model_key(base): {}, model_key(item): {path: link}},
+    ).dump(link_table_file)
+    live_app = create_app()
+
+    with pytest.raises(InvalidHyperField) as error:
+        base.init_app(live_app, link_table=link_table_file)
+
+    assert str(error.value).splitlines() == ["Outdated link table:", message]
+    hyperfield = item.model_fields[path].default
+    assert hyperfield._constant.get(live_app) is None  # noqa: SLF001
+
+
+def test_init_app_with_outdated_link_table(link_table_file: Path) -> None:
+    table = MockTableBase.compile_link_table(app)
+    LinkTable(
+        routes={
+            **table.routes,
+            "read_item": "/item/{id_}",
+            "read_person": "/people/{id_}",
+        },
+        models={**table.models, f"{__name__}.MockRemovedItem": {}},
+    ).dump(link_table_file)
+
+    with pytest.raises(InvalidHyperField) as error:
+        MockTableBase.init_app(create_app(), link_table=link_table_file)
+
+    assert str(error.value).splitlines() == [
+        "Outdated link table:",
+        "Route read_item moved from /item/{id_} to /items/{id_}",
+        "Route read_person is missing",
+    ]
+
+
+def test_link_table_new_model() -> None:
+    table = LinkTable(routes={}, models={})
+
+    errors = table.mismatches(app, [ITEM])
+
+    assert errors == [f"Model {ITEM} is not in the link table"]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        pytest.param("{", "Not a link table", id="invalid json"),
+        pytest.param("[]", "Not a link table", id="not an object"),
+        pytest.param('{"version": 1}', "Not a link table", id="missing keys"),
+        pytest.param(
+            '{"version": 3, "routes": {}, "models": {"Item": {"links": {}}}}',
+            "Not a link table",
+            id="invalid hyperfield",
+        ),
+        pytest.param(
+            '{"version": 0, "routes": {}, "models": {}}',
+            "version 0 is not supported",
+            id="other version",
+        ),
+    ],
+)
+def test_load_invalid_link_table(data: str, message: str) -> None:
+    with pytest.raises(InvalidLinkTable, match=message):
+        LinkTable.loads(data)
+
+
+def test_cli_compile(link_table_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    status = main([
+        "compile",
+        f"{__name__}:app",
+        "--base",
+        BASE,
+        "--output",
+        str(link_table_file),
+    ])
+
+    assert status == 0
+    assert "Compiled 2 hyperfields of 2 models" in capsys.readouterr().out
+    table = json.loads(link_table_file.read_text(encoding="utf-8"))
+    assert table["models"][ITEM]["links.collection"] == {
+        "endpoint": "read_items",
+        "params": [],
+        "path": "/items",
+        "href": "/items",
+        "templated": False,
+        "query": None,
+        "constant": True,
+    }
+
+
+def test_cli_compile_invalid_hyperfields(
+    link_table_file: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    status = main([
+        "compile",
+        f"{__name__}:app",
+        "--base",
+        f"{__name__}:MockTableInvalidBase",
+        "-o",
+        str(link_table_file),
+    ])
+
+    assert status == 1
+    assert "No route found for endpoint read_person" in capsys.readouterr().err
+    assert not link_table_file.exists()
+
+
+@pytest.mark.parametrize(
+    ("reference", "message"),
+    [
+        pytest.param("tests", "not in the format module:attribute", id="format"),
+        pytest.param("tests.missing_module:app", "Cannot import", id="module"),
+        pytest.param(f"{__name__}:missing", "has no attribute", id="attribute"),
+        pytest.param(f"{__name__}:BASE", "not a Starlette application", id="type"),
+    ],
+)
+def test_cli_compile_invalid_app(
+    reference: str, message: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    status = main(["compile", reference])
+
+    assert status == 1
+    assert message in capsys.readouterr().err
@@ -0,0 +1,120 @@
+from typing import Any, List, Optional
+
+import pytest
+
+from fastapi_hypermodel import LAST_CURSOR, InvalidCursor, paginate
+from fastapi_hypermodel.base import cap_page_size, decode_cursor, encode_cursor
+
+
+@pytest.fixture()
+def records() -> List[Any]:
+    return [{"id_": f"item{index:02}"} for index in range(1, 8)]
+
+
+def ids(items: Any) -> List[str]:
+    return [item["id_"] for item in items]
+
+
+def by_id(record: Any) -> str:
+    return record["id_"]
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        pytest.param("item01", id="String"),
+        pytest.param(3, id="Number"),
+        pytest.param(("2024-01-01", 3), id="Composite"),
+        pytest.param(None, id="None"),
+    ],
+)
+def test_cursor_round_trip(key: Any) -> None:
+    cursor = encode_cursor("after", key)
+
+    assert cursor.isascii()
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("after", key)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("not a cursor", id="Not base64"),
+        pytest.param(encode_cursor("sideways", 1), id="Invalid direction"),
+        pytest.param("WyJhZnRlciJd", id="Missing key"),
+    ],
+)
+def test_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(InvalidCursor, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        pytest.param(None, 20, id="Default"),
+        pytest.param(5, 5, id="Requested"),
+        pytest.param(1000, 100, id="Capped"),
+        pytest.param(0, 1, id="At least one"),
+    ],
+)
+def test_cap_page_size(size: Optional[int], expected: int) -> None:
+    assert cap_page_size(size) == expected
+
+
+def test_paginate_first_page(records: List[Any]) -> None:
+    page = paginate(records, by_id, size=3)
+
+    assert ids(page.items) == ["item01", "item02", "item03"]
+    assert page.page_size == 3
+    assert page.prev_cursor is None
+    assert page.next_cursor
+
+
+def test_paginate_forward_and_back(records: List[Any]) -> None:
+    first = paginate(records, by_id, size=3)
+    second = paginate(records, by_id, first.next_cursor, size=3)
+    third = paginate(records, by_id, second.next_cursor, size=3)
+    back = paginate(records, by_id, third.prev_cursor, size=3)
+
+    assert ids(second.items) == ["item04", "item05", "item06"]
+    assert ids(third.items) == ["item07"]
+    assert third.next_cursor is None
+    assert ids(back.items) == ids(second.items)
+
+
+def test_paginate_last_page(records: List[Any]) -> None:
+    page = paginate(records, by_id, LAST_CURSOR, size=3)
+
+    assert ids(page.items) == ["item05", "item06", "item07"]
+    assert page.next_cursor is None
+    assert page.prev_cursor
+
+
+def test_paginate_caps_page_size(records: List[Any]) -> None:
+    page = paginate(records, by_id, size=50, max_size=2)
+
+    assert len(page.items) == 2
+
+
+def test_paginate_past_the_end(records: List[Any]) -> None:
+    cursor = encode_cursor("after", "item99")
+
+    page = paginate(records, by_id, cursor)
+
+    assert not page.items
+    assert page.cursor == cursor
+    assert page.next_cursor is None
+    assert page.prev_cursor is None
+
+
+def test_paginate_only_computes_compared_keys(records: List[Any]) -> None:
+    compared: List[str] = []
+
+    def key(record: Any) -> str:
+        compared.append(record["id_"])
+        return record["id_"]
+
+    paginate(records, key, encode_cursor("after", "item04"), size=1)
+
+    assert len(compared) < len(records)
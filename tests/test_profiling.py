@@ -0,0 +1,220 @@
+import pstats
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_hypermodel import (
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HALResponse,
+    ProfileStore,
+    ProfilingMiddleware,
+    create_profile_router,
+)
+from fastapi_hypermodel.instrumentation import (
+    DEFAULT_PROFILE_HEADER,
+    PROFILE_ID_HEADER,
+    Profile,
+    hooks,
+    profiling,
+)
+
+SECRET = "s3cr3t"
+
+
+class MockItem(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("read_item", {"id_": "<id_>"}),
+    })
+
+
+def mock_profile(id_: str) -> Profile:
+    return Profile(id_=id_, method="GET", path="/", report="", data=b"")
+
+
+@pytest.fixture()
+def store() -> ProfileStore:
+    return ProfileStore(max_profiles=4)
+
+
+@pytest.fixture()
+def profiled_app(store: ProfileStore) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, secret=SECRET, store=store)
+
+    @app.get("/items/{id_}", response_model=MockItem, response_class=HALResponse)
+    def read_item(id_: str) -> Any:
+        return {"id_": id_}
+
+    @app.get("/async_items/{id_}", response_model=MockItem, response_class=HALResponse)
+    async def read_async_item(id_: str) -> Any:
+        return {"id_": id_}
+
+    app.include_router(create_profile_router(store, SECRET))
+    HALHyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def profiled_client(profiled_app: FastAPI) -> TestClient:
+    return TestClient(profiled_app)
+
+
+@pytest.mark.parametrize("path", ["/items/item01", "/async_items/item01"])
+def test_profiled_request(
+    profiled_client: TestClient, store: ProfileStore, path: str
+) -> None:
+    response = profiled_client.get(path, headers={DEFAULT_PROFILE_HEADER: SECRET})
+
+    assert response.status_code == 200
+    assert response.json()["id_"] == "item01"
+    profile = store.get(response.headers[PROFILE_ID_HEADER])
+    assert profile is not None
+    assert profile.method == "GET"
+    assert profile.path == path
+    assert "hal_hypermodel.py" in profile.report
+    assert "starlette" not in profile.report
+    assert not hooks.instruments
+
+
+@pytest.mark.parametrize(
+    "global_profiler",
+    [
+        pytest.param(
+            False,
+            marks=pytest.mark.skipif(
+                sys.version_info >= (3, 12), reason="The profiler is global"
+            ),
+            id="thread profilers",
+        ),
+        pytest.param(True, id="global profiler"),
+    ],
+)
+def test_profiled_worker_thread(
+    profiled_client: TestClient,
+    store: ProfileStore,
+    monkeypatch: pytest.MonkeyPatch,
+    global_profiler: bool,
+) -> None:
+    monkeypatch.setattr(profiling, "_GLOBAL_PROFILER", global_profiler)
+    threads: List[int] = []
+    build_profile = ProfilingMiddleware._build_profile  # noqa: SLF001
+
+    def spy(self: ProfilingMiddleware, id_: str, scope: Any, profiles: Any) -> Any:
+        threads.append(len(profiles))
+        return build_profile(self, id_, scope, profiles)
+
+    monkeypatch.setattr(ProfilingMiddleware, "_build_profile", spy)
+
+    response = profiled_client.get(
+        "/items/item01", headers={DEFAULT_PROFILE_HEADER: SECRET}
+    )
+
+    assert response.status_code == 200
+    assert store.get(response.headers[PROFILE_ID_HEADER]) is not None
+    # The sync endpoint validates its response model in a worker thread,
+    # profiled apart unless the profiler of the request thread sees it
+    assert threads == [1 if global_profiler else 2]
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        pytest.param({}, id="without header"),
+        pytest.param({DEFAULT_PROFILE_HEADER: "guess"}, id="wrong secret"),
+    ],
+)
+def test_request_not_profiled(
+    profiled_client: TestClient, store: ProfileStore, headers: Any
+) -> None:
+    response = profiled_client.get("/items/item01", headers=headers)
+
+    assert response.status_code == 200
+    assert PROFILE_ID_HEADER not in response.headers
+    assert len(store) == 0
+
+
+def test_single_request_profiled_at_a_time(store: ProfileStore) -> None:
+    app = FastAPI()
+
+    @app.get("/plain")
+    def read_plain() -> Any:
+        return {}
+
+    middleware = ProfilingMiddleware(app, secret=SECRET, store=store)
+    with middleware._profiling:  # noqa: SLF001
+        response = TestClient(middleware).get(
+            "/plain", headers={DEFAULT_PROFILE_HEADER: SECRET}
+        )
+
+    assert response.status_code == 200
+    assert PROFILE_ID_HEADER not in response.headers
+    assert len(store) == 0
+
+
+def test_lifespan_passthrough(profiled_app: FastAPI, store: ProfileStore) -> None:
+    with TestClient(profiled_app) as client:
+        client.get("/items/item01")
+
+    assert len(store) == 0
+
+
+def test_download_profile(profiled_client: TestClient, tmp_path: Path) -> None:
+    headers = {DEFAULT_PROFILE_HEADER: SECRET}
+    response = profiled_client.get("/items/item01", headers=headers)
+    id_ = response.headers[PROFILE_ID_HEADER]
+
+    report = profiled_client.get(f"/_hypermodel/profiles/{id_}", headers=headers)
+    assert report.status_code == 200
+    assert "cumulative" in report.text
+
+    download = profiled_client.get(
+        f"/_hypermodel/profiles/{id_}", params={"format": "pstats"}, headers=headers
+    )
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/octet-stream"
+
+    profile_file = tmp_path / "profile.pstats"
+    profile_file.write_bytes(download.content)
+    assert pstats.Stats(str(profile_file)).total_calls > 0
+
+
+def test_download_profile_unauthorized(
+    profiled_client: TestClient, store: ProfileStore
+) -> None:
+    store.add(mock_profile("profile01"))
+
+    unauthorized = profiled_client.get("/_hypermodel/profiles/profile01")
+    assert unauthorized.status_code == 404
+
+    missing = profiled_client.get(
+        "/_hypermodel/profiles/missing", headers={DEFAULT_PROFILE_HEADER: SECRET}
+    )
+    assert missing.status_code == 404
+
+
+def test_profile_store_evicts_oldest(store: ProfileStore) -> None:
+    for index in range(5):
+        store.add(mock_profile(f"profile{index:02}"))
+
+    assert len(store) == 4
+    assert store.get("profile00") is None
+    assert store.get("profile04") is not None
+
+
+def test_profile_store_invalid_size() -> None:
+    with pytest.raises(ValueError, match="max_profiles"):
+        ProfileStore(max_profiles=0)
+
+
+def test_profiling_middleware_empty_secret() -> None:
+    with pytest.raises(ValueError, match="secret"):
+        ProfilingMiddleware(FastAPI(), secret="")
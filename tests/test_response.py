@@ -0,0 +1,184 @@
+from typing import Any, ClassVar, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from typing_extensions import Self
+
+from fastapi_hypermodel import HALResponse, HypermediaResponse, SirenResponse
+from fastapi_hypermodel.base import etag_matches, make_etag
+
+
+class CountingResponse(HypermediaResponse):
+    renders: ClassVar[int] = 0
+
+    def render(self: Self, content: Any) -> bytes:
+        CountingResponse.renders += 1
+        return super().render(content)
+
+
+class VersionedResponse(CountingResponse):
+    version_field: ClassVar[Optional[str]] = "version"
+
+
+class NoETagResponse(HypermediaResponse):
+    use_etag: ClassVar[bool] = False
+
+
+@pytest.fixture()
+def response_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/plain", response_class=CountingResponse)
+    def _() -> Any:
+        return {"id_": "test"}
+
+    @app.get("/versioned", response_class=VersionedResponse)
+    def _versioned() -> Any:
+        return {"id_": "test", "version": 3}
+
+    @app.get("/explicit")
+    def _explicit() -> Any:
+        return CountingResponse({"id_": "test"}, version="v1")
+
+    @app.post("/plain", response_class=CountingResponse)
+    def _post() -> Any:
+        return {"id_": "test"}
+
+    @app.get("/not_found", response_class=HypermediaResponse, status_code=404)
+    def _not_found() -> Any:
+        return {"detail": "missing"}
+
+    @app.get("/custom_etag")
+    def _custom_etag() -> Any:
+        return HypermediaResponse({"id_": "test"}, headers={"etag": '"custom"'})
+
+    @app.get("/no_etag", response_class=NoETagResponse)
+    def _no_etag() -> Any:
+        return {"id_": "test", "version": 3}
+
+    return app
+
+
+@pytest.fixture()
+def response_client(response_app: FastAPI) -> TestClient:
+    CountingResponse.renders = 0
+    return TestClient(response_app)
+
+
+def test_make_etag_is_strong_and_stable() -> None:
+    etag = make_etag(b"test")
+
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+    assert etag == make_etag(b"test")
+    assert etag != make_etag(b"other")
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        pytest.param('"abc"', True, id="Exact match"),
+        pytest.param('W/"abc"', True, id="Weak match"),
+        pytest.param('"xyz", "abc"', True, id="Match in list"),
+        pytest.param("*", True, id="Wildcard"),
+        pytest.param('"xyz"', False, id="No match"),
+    ],
+)
+def test_etag_matches(if_none_match: str, expected: bool) -> None:
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_etag_from_body(response_client: TestClient) -> None:
+    response = response_client.get("/plain")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == make_etag(response.content)
+
+
+def test_not_modified(response_client: TestClient) -> None:
+    etag = response_client.get("/plain").headers["etag"]
+
+    response = response_client.get("/plain", headers={"if-none-match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+
+def test_modified(response_client: TestClient) -> None:
+    response = response_client.get("/plain", headers={"if-none-match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json() == {"id_": "test"}
+
+
+def test_conditional_ignored_for_unsafe_methods(response_client: TestClient) -> None:
+    etag = response_client.post("/plain").headers["etag"]
+
+    response = response_client.post("/plain", headers={"if-none-match": etag})
+
+    assert response.status_code == 200
+
+
+def test_version_field_skips_rendering(response_client: TestClient) -> None:
+    etag = response_client.get("/versioned").headers["etag"]
+    assert CountingResponse.renders == 1
+
+    response = response_client.get("/versioned", headers={"if-none-match": etag})
+
+    assert response.status_code == 304
+    assert CountingResponse.renders == 1
+
+
+def test_version_field_renders_when_modified(response_client: TestClient) -> None:
+    response = response_client.get("/versioned")
+
+    assert response.json() == {"id_": "test", "version": 3}
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+def test_explicit_version(response_client: TestClient) -> None:
+    etag = response_client.get("/explicit").headers["etag"]
+
+    response = response_client.get("/explicit", headers={"if-none-match": etag})
+
+    assert response.status_code == 304
+    assert CountingResponse.renders == 1
+
+
+def test_no_etag_for_errors(response_client: TestClient) -> None:
+    response = response_client.get("/not_found")
+
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+
+
+def test_keeps_custom_etag(response_client: TestClient) -> None:
+    response = response_client.get("/custom_etag")
+
+    assert response.headers["etag"] == '"custom"'
+
+
+def test_etag_disabled(response_client: TestClient) -> None:
+    response = response_client.get("/no_etag", headers={"if-none-match": "*"})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+@pytest.mark.parametrize("response_class", [HALResponse, SirenResponse])
+def test_hypermedia_responses_have_etag(response_class: Any) -> None:
+    response = response_class({})
+
+    assert response.headers["etag"] == make_etag(response.body)
+
+
+def test_version_with_media_type() -> None:
+    response = HypermediaResponse(
+        {"id_": "test"}, media_type="application/vnd.test+json", version="v1"
+    )
+
+    assert response.media_type == "application/vnd.test+json"
+    assert response.headers["etag"] == make_etag(b"application/vnd.test+json:v1")
+    assert not response.body
@@ -0,0 +1,258 @@
+from typing import Any, Dict
+
+import pytest
+from fastapi import FastAPI, Response, WebSocket
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from fastapi_hypermodel import (
+    CacheBackend,
+    CachedResponse,
+    HALResponse,
+    LRUCacheBackend,
+    ResponseCacheMiddleware,
+)
+from fastapi_hypermodel.cache import extract_link_targets
+
+
+@pytest.fixture()
+def backend() -> LRUCacheBackend:
+    return LRUCacheBackend(max_entries=8)
+
+
+@pytest.fixture()
+def calls() -> Dict[str, int]:
+    return {"item": 0, "items": 0, "plain": 0}
+
+
+@pytest.fixture()
+def cached_app(backend: LRUCacheBackend, calls: Dict[str, int]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware, backend=backend)
+
+    def item_document(id_: str) -> Any:
+        return {
+            "id_": id_,
+            "_links": {
+                "self": {"href": f"/items/{id_}"},
+                "update": {"href": f"/items/{id_}"},
+            },
+        }
+
+    @app.get("/items", response_class=HALResponse)
+    def read_items() -> Any:
+        calls["items"] += 1
+        return {
+            "_links": {
+                "self": {"href": "/items"},
+                "find": {"href": "/items/{id_}", "templated": True},
+            },
+            "_embedded": {"items": [item_document("item01")]},
+        }
+
+    @app.get("/items/{id_}", response_class=HALResponse)
+    def read_item(id_: str) -> Any:
+        calls["item"] += 1
+        return item_document(id_)
+
+    @app.put("/items/{id_}", response_class=HALResponse)
+    def update_item(id_: str) -> Any:
+        return item_document(id_)
+
+    @app.patch("/items/{id_}", response_class=HALResponse, status_code=422)
+    def failing_update(id_: str) -> Any:
+        return item_document(id_)
+
+    @app.get("/described/{id_}")
+    def read_described_item(id_: str) -> Any:
+        return HALResponse(
+            item_document(id_),
+            headers={
+                "cache-control": "public, max-age=60",
+                "content-location": f"/items/{id_}",
+                "expires": "Thu, 01 Jan 2099 00:00:00 GMT",
+                "vary": "accept",
+                "x-request-id": "request01",
+            },
+        )
+
+    @app.get("/plain")
+    def read_plain() -> Any:
+        calls["plain"] += 1
+        return {"id_": "plain"}
+
+    @app.get("/no_store")
+    def read_no_store() -> Any:
+        return HALResponse({}, headers={"cache-control": "no-store"})
+
+    @app.get("/cookie")
+    def read_cookie(response: Response) -> Any:
+        response.set_cookie("session", "test")
+        return {}
+
+    @app.head("/items/{id_}")
+    def head_item(id_: str) -> Any:  # pragma: no cover
+        return JSONResponse({})
+
+    return app
+
+
+@pytest.fixture()
+def cached_client(cached_app: FastAPI) -> TestClient:
+    return TestClient(cached_app)
+
+
+def test_lru_backend_is_a_cache_backend(backend: LRUCacheBackend) -> None:
+    assert isinstance(backend, CacheBackend)
+
+
+def test_lru_backend_invalid_size() -> None:
+    with pytest.raises(ValueError, match="max_entries must be a positive integer"):
+        LRUCacheBackend(max_entries=0)
+
+
+def test_lru_backend_evicts_least_recently_used() -> None:
+    backend = LRUCacheBackend(max_entries=2)
+    for key in ("a", "b"):
+        backend.set(key, CachedResponse(200, [], b"", frozenset({key, "shared"})))
+
+    assert backend.get("a")
+    backend.set("c", CachedResponse(200, [], b"", frozenset({"c"})))
+
+    assert len(backend) == 2
+    assert backend.get("b") is None
+    assert backend.invalidate("shared") == 1
+    assert backend.get("a") is None
+    assert backend.get("c")
+
+
+def test_lru_backend_replaces_entry() -> None:
+    backend = LRUCacheBackend()
+    backend.set("a", CachedResponse(200, [], b"old", frozenset({"old"})))
+    backend.set("a", CachedResponse(200, [], b"new", frozenset({"new"})))
+
+    assert backend.invalidate("old") == 0
+    assert len(backend) == 1
+
+    backend.clear()
+
+    assert len(backend) == 0
+
+
+def test_extract_link_targets() -> None:
+    body = (
+        b'{"_links": {"self": {"href": "http://test/items"},'
+        b' "find": {"href": "/items/{id_}"}},'
+        b' "entities": [{"href": "/items/item01"}]}'
+    )
+
+    assert extract_link_targets(body) == {"/items", "/items/item01"}
+
+
+def test_extract_link_targets_invalid_json() -> None:
+    assert extract_link_targets(b"not json") == frozenset()
+
+
+def test_cache_hit(cached_client: TestClient, calls: Dict[str, int]) -> None:
+    first = cached_client.get("/items/item01")
+    second = cached_client.get("/items/item01")
+
+    assert calls["item"] == 1
+    assert first.json() == second.json()
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_cache_key_includes_query(
+    cached_client: TestClient, calls: Dict[str, int]
+) -> None:
+    cached_client.get("/items/item01")
+    cached_client.get("/items/item01?fields=id_")
+
+    assert calls["item"] == 2
+
+
+def test_cache_hit_not_modified(cached_client: TestClient) -> None:
+    etag = cached_client.get("/items/item01").headers["etag"]
+
+    response = cached_client.get("/items/item01", headers={"if-none-match": etag})
+
+    assert response.status_code == 304
+    assert not response.content
+
+
+def test_cache_hit_not_modified_headers(cached_client: TestClient) -> None:
+    first = cached_client.get("/described/item01")
+
+    response = cached_client.get(
+        "/described/item01", headers={"if-none-match": first.headers["etag"]}
+    )
+
+    assert response.status_code == 304
+    assert dict(response.headers) == {
+        "cache-control": "public, max-age=60",
+        "content-location": "/items/item01",
+        "etag": first.headers["etag"],
+        "expires": "Thu, 01 Jan 2099 00:00:00 GMT",
+        "vary": "accept",
+    }
+
+
+def test_invalidation_by_link_target(
+    cached_client: TestClient, calls: Dict[str, int]
+) -> None:
+    cached_client.get("/items")
+    cached_client.get("/items/item01")
+    cached_client.get("/items/item02")
+
+    cached_client.put("/items/item01")
+
+    cached_client.get("/items")
+    cached_client.get("/items/item01")
+    cached_client.get("/items/item02")
+
+    assert calls["items"] == 2
+    assert calls["item"] == 3
+
+
+def test_failed_mutation_does_not_invalidate(
+    cached_client: TestClient, backend: LRUCacheBackend
+) -> None:
+    cached_client.get("/items/item01")
+
+    cached_client.patch("/items/item01")
+
+    assert len(backend) == 1
+
+
+@pytest.mark.parametrize("path", ["/plain", "/no_store", "/cookie", "/missing"])
+def test_uncacheable_responses(
+    cached_client: TestClient, backend: LRUCacheBackend, path: str
+) -> None:
+    cached_client.get(path)
+
+    assert len(backend) == 0
+
+
+def test_head_is_not_cached(
+    cached_client: TestClient, backend: LRUCacheBackend
+) -> None:
+    cached_client.head("/items/item01")
+
+    assert len(backend) == 0
+
+
+def test_default_backend() -> None:
+    middleware = ResponseCacheMiddleware(FastAPI())
+
+    assert isinstance(middleware.backend, LRUCacheBackend)
+
+
+def test_websocket_passthrough(cached_app: FastAPI) -> None:
+    @cached_app.websocket("/ws")
+    async def websocket(websocket: WebSocket) -> None:
+        await websocket.accept()
+        await websocket.send_text("ok")
+        await websocket.close()
+
+    with TestClient(cached_app).websocket_connect("/ws") as connection:
+        assert connection.receive_text() == "ok"
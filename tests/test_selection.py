@@ -0,0 +1,255 @@
+from typing import Any, Optional, Sequence
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from pydantic import Field
+
+from fastapi_hypermodel import (
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HALResponse,
+    HyperModel,
+    Selection,
+    SelectionMiddleware,
+    SirenActionFor,
+    SirenActionType,
+    SirenHyperModel,
+    SirenLinkFor,
+    SirenLinkType,
+    UrlFor,
+    use_selection,
+)
+from fastapi_hypermodel.base import get_selection
+
+
+class MockHALItem(HALHyperModel):
+    id_: str
+    name: str
+    price: float
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+        "broken": HALFor("endpoint_that_does_not_exist", {"id_": "<id_>"}),
+    })
+
+
+class MockHALCollection(HALHyperModel):
+    id_: str
+    items: Sequence[MockHALItem] = Field(alias="sc:items")
+    featured: Optional[MockHALItem] = None
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+    })
+
+
+class MockSirenItem(SirenHyperModel):
+    id_: str
+    name: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("mock_read_with_path", {"id_": "<id_>"}, rel=["self"]),
+        SirenLinkFor("endpoint_that_does_not_exist", rel=["broken"]),
+        SirenLinkType(href="/prebuilt", rel=["prebuilt"]),
+    )
+
+    actions: Sequence[SirenActionFor] = (
+        SirenActionFor("mock_read_with_path", {"id_": "<id_>"}, name="read"),
+        SirenActionFor("endpoint_that_does_not_exist", name="broken"),
+        SirenActionType(href="/prebuilt", name="prebuilt"),
+    )
+
+
+class MockSirenCollection(SirenHyperModel):
+    id_: str
+    items: Sequence[MockSirenItem]
+
+
+class MockUrlForItem(HyperModel):
+    id_: str
+
+    href: UrlFor = UrlFor("mock_read_with_path", {"id_": "<id_>"})
+    broken: UrlFor = UrlFor("endpoint_that_does_not_exist")
+
+
+@pytest.fixture()
+def hal_app(app: FastAPI) -> FastAPI:
+    HALHyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def siren_app(app: FastAPI) -> FastAPI:
+    SirenHyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def item() -> Any:
+    return {"id_": "item01", "name": "Foo", "price": 10.2}
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        pytest.param({}, None, id="No parameters"),
+        pytest.param(
+            {"fields": "name, price"},
+            Selection(fields=frozenset({"name", "price"})),
+            id="Fields",
+        ),
+        pytest.param(
+            {"links": "self,update", "embed": "none"},
+            Selection(links=frozenset({"self", "update"}), embed=frozenset()),
+            id="Links and no embedded",
+        ),
+        pytest.param({"fields": ""}, Selection(fields=frozenset()), id="Empty"),
+    ],
+)
+def test_selection_from_query(query: Any, expected: Optional[Selection]) -> None:
+    assert Selection.from_query(query) == expected
+
+
+def test_selection_always_includes_self() -> None:
+    selection = Selection(links=frozenset())
+
+    assert selection.includes_link("self")
+    assert not selection.includes_link("update")
+
+
+def test_use_selection_is_scoped() -> None:
+    selection = Selection(fields=frozenset({"name"}))
+
+    with use_selection(selection):
+        assert get_selection() == selection
+
+    assert get_selection() is None
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_links_selection_skips_unrequested(item: Any) -> None:
+    with use_selection(Selection(links=frozenset({"self"}))):
+        hal_item = MockHALItem(**item)
+
+    assert hal_item.links
+    assert set(hal_item.links) == {"self", "curies"}
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_fields_selection(item: Any) -> None:
+    selection = Selection(fields=frozenset({"name"}), links=frozenset())
+    with use_selection(selection):
+        hal_item = MockHALItem(**item).model_dump(by_alias=True)
+
+    assert hal_item.get("name") == "Foo"
+    assert "price" not in hal_item
+    assert "id_" not in hal_item
+    assert "_links" in hal_item
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_embed_none_skips_children(item: Any) -> None:
+    selection = Selection(embed=frozenset())
+    with use_selection(selection):
+        collection = MockHALCollection.model_validate({
+            "id_": "items",
+            "sc:items": [{"id_": "will_not_be_validated"}],
+            "featured": {},
+        }).model_dump(by_alias=True)
+
+    assert "_embedded" not in collection
+    assert collection.get("id_") == "items"
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_hal_embed_by_alias(item: Any) -> None:
+    selection = Selection(links=frozenset(), embed=frozenset({"sc:items"}))
+    with use_selection(selection):
+        collection = MockHALCollection.model_validate({
+            "id_": "items",
+            "sc:items": [item],
+            "featured": {},
+        }).model_dump(by_alias=True)
+
+    embedded = collection.get("_embedded", {})
+    assert list(embedded) == ["sc:items"]
+
+
+@pytest.mark.usefixtures("siren_app")
+def test_siren_selection(item: Any) -> None:
+    selection = Selection(
+        fields=frozenset({"name"}),
+        links=frozenset({"read", "prebuilt"}),
+    )
+    with use_selection(selection):
+        siren_item = MockSirenItem(**item).model_dump()
+
+    assert siren_item.get("properties") == {"name": "Foo"}
+    assert [link.get("rel") for link in siren_item.get("links", [])] == [
+        ["self"],
+        ["prebuilt"],
+    ]
+    actions = siren_item.get("actions", [])
+    assert [action.get("name") for action in actions] == ["read", "prebuilt"]
+
+
+@pytest.mark.usefixtures("siren_app")
+def test_siren_embed_none(item: Any) -> None:
+    with use_selection(Selection(embed=frozenset())):
+        collection = MockSirenCollection.model_validate({
+            "id_": "items",
+            "items": [{"id_": "will_not_be_validated"}],
+        }).model_dump()
+
+    assert not collection.get("entities")
+    assert collection.get("properties") == {"id_": "items"}
+
+
+@pytest.mark.usefixtures("app")
+def test_url_for_links_selection() -> None:
+    with use_selection(Selection(links=frozenset({"href"}))):
+        url_for_item = MockUrlForItem(id_="item01").model_dump()
+
+    assert url_for_item == {"id_": "item01", "href": "/mock_read/item01"}
+
+
+def test_selection_middleware(app: FastAPI, item: Any) -> None:
+    selection_app = FastAPI()
+    selection_app.add_middleware(SelectionMiddleware)
+    selection_app.router.routes.extend(app.routes)
+
+    @selection_app.get(
+        "/selected_item",
+        response_model=MockHALItem,
+        response_model_exclude_unset=True,
+        response_class=HALResponse,
+    )
+    def _() -> Any:
+        return item
+
+    HALHyperModel.init_app(selection_app)
+    client = TestClient(selection_app)
+
+    response = client.get("/selected_item?fields=name&links=self").json()
+
+    assert response == {
+        "_links": {"self": {"href": "/mock_read/item01"}, "curies": []},
+        "name": "Foo",
+    }
+
+
+def test_selection_middleware_websocket_passthrough() -> None:
+    selection_app = FastAPI()
+    selection_app.add_middleware(SelectionMiddleware)
+
+    @selection_app.websocket("/ws")
+    async def _(websocket: WebSocket) -> None:
+        await websocket.accept()
+        await websocket.send_text(str(get_selection()))
+        await websocket.close()
+
+    with TestClient(selection_app).websocket_connect("/ws") as connection:
+        assert connection.receive_text() == "None"
@@ -0,0 +1,172 @@
+from typing import Any, Iterator, Mapping, Sequence
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+
+from fastapi_hypermodel import (
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    HALResponse,
+    InMemoryAggregator,
+    ServerTimingMiddleware,
+    instrumented,
+)
+from fastapi_hypermodel.instrumentation import (
+    PHASE_CONDITION,
+    PHASE_VALIDATION,
+    SERVER_TIMING_DESCRIPTIONS,
+    format_server_timing,
+    hooks,
+)
+
+
+class MockItem(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("read_item", {"id_": "<id_>"}),
+        "update": HALFor(
+            "read_item",
+            {"id_": "<id_>"},
+            condition=lambda values: values["id_"] != "locked",
+        ),
+    })
+
+
+class MockItemCollection(HALHyperModel):
+    items: Sequence[MockItem]
+
+    links: HALLinks = FrozenDict({"self": HALFor("read_items")})
+
+
+@pytest.fixture()
+def timed_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @app.get("/items", response_model=MockItemCollection, response_class=HALResponse)
+    def read_items() -> Any:
+        return {"items": [{"id_": "item01"}, {"id_": "locked"}]}
+
+    @app.get("/items/{id_}", response_model=MockItem, response_class=HALResponse)
+    def read_item(id_: str) -> Any:  # pragma: no cover
+        return {"id_": id_}
+
+    @app.get("/plain")
+    def read_plain() -> Any:
+        return {"id_": "plain"}
+
+    @app.websocket("/ws")
+    async def websocket_endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+        await websocket.send_text("hello")
+        await websocket.close()
+
+    HALHyperModel.init_app(app)
+    return app
+
+
+@pytest.fixture()
+def timed_client(timed_app: FastAPI) -> Iterator[TestClient]:
+    with TestClient(timed_app) as client:
+        yield client
+
+    assert not hooks.instruments
+
+
+def parse_server_timing(header: str) -> Mapping[str, float]:
+    metrics = {}
+    for entry in header.split(", "):
+        metric, _, params = entry.partition(";dur=")
+        duration, _, description = params.partition(";desc=")
+        assert description == f'"{SERVER_TIMING_DESCRIPTIONS[metric]}"'
+        metrics[metric] = float(duration)
+    return metrics
+
+
+def test_server_timing_header(timed_client: TestClient) -> None:
+    response = timed_client.get("/items")
+
+    assert response.status_code == 200
+    metrics = parse_server_timing(response.headers["server-timing"])
+    assert list(metrics) == [
+        "validation",
+        "links",
+        "conditions",
+        "embedded",
+        "response-validation",
+        "encoding",
+    ]
+    assert all(duration >= 0 for duration in metrics.values())
+
+
+def test_server_timing_without_hypermodels(timed_client: TestClient) -> None:
+    timed_client.get("/items")
+    response = timed_client.get("/plain")
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+
+def test_server_timing_websocket_passthrough(timed_client: TestClient) -> None:
+    with timed_client.websocket_connect("/ws") as websocket:
+        assert websocket.receive_text() == "hello"
+
+
+@pytest.mark.usefixtures("timed_client")
+def test_server_timing_ignores_events_outside_requests() -> None:
+    item = MockItem(id_="item01")
+
+    assert item.links["self"].href == "/items/item01"
+
+
+@pytest.mark.usefixtures("timed_client")
+def test_validation_is_timed_once_per_response_model() -> None:
+    with instrumented(InMemoryAggregator()) as aggregator:
+        MockItemCollection.model_validate({"items": [{"id_": "item01"}]})
+
+    assert isinstance(aggregator, InMemoryAggregator)
+    validation = aggregator.stats(phase=PHASE_VALIDATION)
+    assert [(stats.model, stats.calls) for stats in validation] == [
+        ("MockItemCollection", 1)
+    ]
+
+    conditions = aggregator.stats(phase=PHASE_CONDITION)
+    assert [(stats.model, stats.name) for stats in conditions] == [
+        ("HALFor", "read_item")
+    ]
+
+
+def test_format_server_timing_follows_metric_order() -> None:
+    timings = {"encoding": 0.0005, "validation": 0.0012}
+
+    assert format_server_timing(timings) == (
+        'validation;dur=1.200;desc="Validation with links and embedding", '
+        'encoding;dur=0.500;desc="Response encoding"'
+    )
+
+
+def test_server_timing_registered_while_started(timed_app: FastAPI) -> None:
+    other_app = FastAPI()
+    other_app.add_middleware(ServerTimingMiddleware)
+    client = TestClient(timed_app)
+
+    with client, TestClient(other_app):
+        assert len(hooks.instruments) == 1
+    assert not hooks.instruments
+
+    with TestClient(other_app):
+        with client:
+            pass
+        assert len(hooks.instruments) == 1
+    assert not hooks.instruments
+
+
+def test_server_timing_without_lifespan(timed_app: FastAPI) -> None:
+    response = TestClient(timed_app).get("/items")
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
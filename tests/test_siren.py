@@ -1,3 +1,4 @@
+import copy
 from typing import Any, Optional, Sequence
 
 import pytest
@@ -186,6 +187,33 @@ def test_siren_link_for_templated(siren_app: FastAPI) -> None:
     assert siren_link_for_type.rel == ["test"]
 
 
+def test_siren_link_for_templated_is_resolved_once(siren_app: FastAPI) -> None:
+    siren_link_for = SirenLinkFor(
+        "mock_read_with_path_siren", {"id_": "<id_>"}, rel=["test"], templated=True
+    )
+
+    first = siren_link_for(siren_app, {"id_": "first"})
+    second = siren_link_for(siren_app, {"id_": "second"})
+
+    assert first is second
+
+
+def test_siren_link_for_with_query(siren_app: FastAPI) -> None:
+    siren_link_for = SirenLinkFor(
+        "mock_read_with_path_siren",
+        {"id_": "<id_>"},
+        rel=["test"],
+        query={"owner": "<owner.id_>"},
+    )
+
+    siren_link = siren_link_for(
+        siren_app, {"properties": {"id_": "test", "owner": {"id_": "person01"}}}
+    )
+
+    assert siren_link
+    assert siren_link.href == "/mock_read_with_path_siren/test?owner=person01"
+
+
 def test_siren_link_for_missing_rel(siren_app: FastAPI) -> None:
     mock = MockClass(id_="test")
 
@@ -392,6 +420,42 @@ def test_siren_action_for_condition_false(siren_app: FastAPI) -> None:
     assert siren_action_for_type is None
 
 
+def test_siren_link_for_positional_templated(siren_app: FastAPI) -> None:
+    siren_link_for = SirenLinkFor(
+        "mock_read_with_path_siren", {"id_": "<id_>"}, True, rel=["find"]
+    )
+
+    siren_link_for_type = siren_link_for(siren_app, {})
+
+    assert siren_link_for_type
+    assert siren_link_for_type.href == "/mock_read_with_path_siren/{id_}"
+
+
+def test_siren_link_for_safe_params(siren_app: FastAPI) -> None:
+    siren_link_for = SirenLinkFor(
+        "mock_read_with_path_siren",
+        {"id_": "<id_>"},
+        rel=["self"],
+        safe_params=["id_"],
+    )
+
+    siren_link_for_type = siren_link_for(siren_app, {"id_": "item01"})
+
+    assert siren_link_for_type
+    assert siren_link_for_type.href == "/mock_read_with_path_siren/item01"
+
+
+def test_siren_action_for_positional_templated(siren_app: FastAPI) -> None:
+    siren_action_for = SirenActionFor(
+        "mock_read_with_path_siren", {"id_": "<id_>"}, True, name="find"
+    )
+
+    siren_action_for_type = siren_action_for(siren_app, {})
+
+    assert siren_action_for_type
+    assert siren_action_for_type.href == "/mock_read_with_path_siren/{id_}"
+
+
 def test_siren_aciton_for_templated(siren_app: FastAPI) -> None:
     mock = MockClass(id_="test")
 
@@ -408,6 +472,17 @@ def test_siren_aciton_for_templated(siren_app: FastAPI) -> None:
     assert not siren_action_for_type.fields
 
 
+def test_siren_action_for_templated_is_resolved_once(siren_app: FastAPI) -> None:
+    siren_action_for = SirenActionFor(
+        "mock_read_with_path_siren", {"id_": "<id_>"}, name="test", templated=True
+    )
+
+    first = siren_action_for(siren_app, {"id_": "first"})
+    second = siren_action_for(siren_app, {"id_": "second"})
+
+    assert first is second
+
+
 def test_siren_action_for_with_fields(siren_app: FastAPI) -> None:
     mock = MockClass(id_="test")
 
@@ -456,6 +531,43 @@ def test_siren_action_for_with_fields_no_populate(siren_app: FastAPI) -> None:
     assert siren_action_for_type.type_ == "application/x-www-form-urlencoded"
 
 
+def test_siren_action_for_fields_are_populated_per_call(siren_app: FastAPI) -> None:
+    siren_action_for = SirenActionFor(
+        "mock_read_with_path_siren_with_hypermodel", name="test"
+    )
+
+    first = siren_action_for(siren_app, {"name": "first"})
+    second = siren_action_for(siren_app, {"name": "second"})
+
+    assert first
+    assert second
+    assert [field.value for field in first.fields if field.name == "name"] == ["first"]
+    assert [field.value for field in second.fields if field.name == "name"] == [
+        "second"
+    ]
+
+
+def test_siren_definitions_are_shared() -> None:
+    class MockClassWithLinks(SirenHyperModel):
+        id_: str
+
+        links: Sequence[SirenLinkFor] = (
+            SirenLinkFor("mock_read_with_path_siren", {"id_": "<id_>"}, rel=["self"]),
+        )
+        actions: Sequence[SirenActionFor] = (
+            SirenActionFor("mock_read_with_path_siren", name="read"),
+        )
+
+    links = MockClassWithLinks.model_fields["links"]
+    actions = MockClassWithLinks.model_fields["actions"]
+
+    assert all(copy.copy(link) is link for link in links.default)
+    assert all(copy.copy(action) is action for action in actions.default)
+
+    assert links.get_default(call_default_factory=True) is links.default
+    assert actions.get_default(call_default_factory=True) is actions.default
+
+
 # SirenHypermodel
 
 
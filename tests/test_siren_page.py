@@ -0,0 +1,139 @@
+from typing import Any, ClassVar, List, Optional, Sequence
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_hypermodel import (
+    LAST_CURSOR,
+    Selection,
+    SirenHyperModel,
+    SirenLinkFor,
+    SirenPage,
+    SirenResponse,
+    paginate,
+    use_selection,
+)
+
+
+class MockItem(SirenHyperModel):
+    id_: str
+
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("mock_read_with_path", {"id_": "<id_>"}, rel=["self"]),
+    )
+
+
+class MockItemPage(SirenPage[MockItem]):
+    links: Sequence[SirenLinkFor] = (
+        SirenLinkFor("mock_read_siren_items", rel=["self"]),
+    )
+
+
+class MockSmallItemPage(MockItemPage):
+    max_page_size: ClassVar[int] = 3
+
+
+class MockUnlinkedPage(SirenPage[MockItem]):
+    pass
+
+
+@pytest.fixture()
+def records() -> List[Any]:
+    return [{"id_": f"item{index:02}"} for index in range(1, 6)]
+
+
+@pytest.fixture()
+def page_app(app: FastAPI, records: List[Any]) -> FastAPI:
+    @app.get(
+        "/mock_siren_items",
+        response_model=MockItemPage,
+        response_model_exclude_unset=True,
+        response_class=SirenResponse,
+    )
+    def mock_read_siren_items(cursor: Optional[str] = None, size: int = 2) -> Any:
+        return paginate(records, lambda item: item["id_"], cursor, size)._asdict()
+
+    SirenHyperModel.init_app(app)
+
+    return app
+
+
+def hrefs(page: Any) -> Any:
+    return {link["rel"][0]: link["href"] for link in page.get("links", [])}
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_links(records: List[Any]) -> None:
+    page = paginate(records, lambda item: item["id_"], size=2)
+
+    dumped = MockItemPage(**page._asdict()).model_dump()
+
+    assert hrefs(dumped) == {
+        "self": "/mock_siren_items?size=2",
+        "first": "/mock_siren_items?size=2",
+        "next": f"/mock_siren_items?cursor={page.next_cursor}&size=2",
+        "last": f"/mock_siren_items?cursor={LAST_CURSOR}&size=2",
+    }
+    assert [entity.get("rel") for entity in dumped.get("entities", [])] == [
+        ["items"],
+        ["items"],
+    ]
+    assert "properties" not in dumped
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_size_action(records: List[Any]) -> None:
+    page = paginate(records, lambda item: item["id_"], size=2)
+
+    dumped = MockItemPage(**page._asdict()).model_dump()
+
+    assert dumped.get("actions") == [
+        {
+            "name": "paginate",
+            "method": "GET",
+            "href": "/mock_siren_items",
+            "type": "application/x-www-form-urlencoded",
+            "fields": [{"name": "size", "type": "number", "value": 2}],
+        }
+    ]
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_selection(records: List[Any]) -> None:
+    page = paginate(records, lambda item: item["id_"], size=2)
+
+    with use_selection(Selection(links=frozenset({"next"}))):
+        dumped = MockItemPage(**page._asdict()).model_dump()
+
+    assert set(hrefs(dumped)) == {"self", "next"}
+    assert not dumped.get("actions")
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_is_bounded(records: List[Any]) -> None:
+    page = MockSmallItemPage(items=records, page_size=50)
+
+    assert page.page_size == 3
+    assert len(page.entities) == 3
+
+
+@pytest.mark.usefixtures("page_app")
+def test_page_without_self_link(records: List[Any]) -> None:
+    page = MockUnlinkedPage(items=records)
+
+    assert not page.links
+    assert not page.actions
+
+
+def test_paginated_endpoint(page_app: FastAPI) -> None:
+    client = TestClient(page_app)
+
+    first = client.get("/mock_siren_items").json()
+    second = client.get(hrefs(first)["next"]).json()
+
+    assert [entity["properties"]["id_"] for entity in second["entities"]] == [
+        "item03",
+        "item04",
+    ]
+    assert "prev" in hrefs(second)
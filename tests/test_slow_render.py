@@ -0,0 +1,127 @@
+import logging
+from typing import Sequence
+
+import pytest
+from fastapi import FastAPI
+
+from fastapi_hypermodel import (
+    Event,
+    FrozenDict,
+    HALFor,
+    HALHyperModel,
+    HALLinks,
+    SlowRenderDetector,
+    instrumented,
+)
+from fastapi_hypermodel.instrumentation import (
+    PHASE_CONDITION,
+    PHASE_ENCODING,
+    PHASE_HYPERMEDIA,
+    PHASE_LINKS,
+    PHASE_VALIDATION,
+    SlowRender,
+    slow_render_logger,
+)
+
+
+class MockItem(HALHyperModel):
+    id_: str
+
+    links: HALLinks = FrozenDict({
+        "self": HALFor("mock_read_with_path", {"id_": "<id_>"}),
+        "update": HALFor(
+            "mock_read_with_path",
+            {"id_": "<id_>"},
+            condition=lambda values: values["id_"] != "locked",
+        ),
+    })
+
+
+class MockItemCollection(HALHyperModel):
+    items: Sequence[MockItem]
+
+
+@pytest.fixture()
+def hal_app(app: FastAPI) -> FastAPI:
+    HALHyperModel.init_app(app)
+    return app
+
+
+def slow_renders(caplog: pytest.LogCaptureFixture) -> Sequence[SlowRender]:
+    return [
+        SlowRender(**record.slow_render)
+        for record in caplog.records
+        if record.name == slow_render_logger.name
+    ]
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_slow_render_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    with instrumented(SlowRenderDetector(threshold=0)):
+        MockItemCollection.model_validate({
+            "items": [{"id_": "item01"}, {"id_": "locked"}]
+        })
+
+    slow_render, *others = slow_renders(caplog)
+    assert not others
+    assert slow_render.model == "MockItemCollection"
+    assert slow_render.threshold == 0
+    assert slow_render.models == {"MockItem": 2, "MockItemCollection": 1}
+    assert slow_render.hyperfields == {"mock_read_with_path": 4}
+    assert slow_render.conditions == 2
+    assert PHASE_LINKS in slow_render.phases
+    assert PHASE_VALIDATION not in slow_render.phases
+
+    record, *_ = caplog.records
+    assert record.levelno == logging.WARNING
+    assert record.getMessage().startswith("Slow render of MockItemCollection")
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_fast_render_is_not_logged(caplog: pytest.LogCaptureFixture) -> None:
+    detector = SlowRenderDetector(threshold=0, thresholds={"MockItem": 60})
+    with instrumented(detector):
+        MockItem(id_="item01")
+
+    assert not slow_renders(caplog)
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_unsampled_render_is_not_logged(caplog: pytest.LogCaptureFixture) -> None:
+    with instrumented(SlowRenderDetector(threshold=0, sample_rate=0)):
+        MockItem(id_="item01")
+        MockItem(id_="item02")
+
+    assert not slow_renders(caplog)
+
+
+@pytest.mark.usefixtures("hal_app")
+def test_detectors_sample_renders_apart(caplog: pytest.LogCaptureFixture) -> None:
+    sampled = SlowRenderDetector(threshold=0)
+    with instrumented(SlowRenderDetector(threshold=0, sample_rate=0)):
+        with instrumented(sampled):
+            MockItem(id_="item01")
+
+    slow_render, *others = slow_renders(caplog)
+    assert not others
+    assert slow_render.models == {"MockItem": 1}
+
+
+def test_slow_render_ignores_response_phases(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    detector = SlowRenderDetector(threshold=0)
+    detector.record(Event(PHASE_ENCODING, "HALResponse", None, 1.0))
+    detector.record(Event(PHASE_CONDITION, "HALFor", None, 1.0))
+    detector.record(Event(PHASE_HYPERMEDIA, "MockItem", None, 1.0))
+    detector.record(Event(PHASE_VALIDATION, "MockItem", None, 1.0))
+
+    slow_render, *_ = slow_renders(caplog)
+    assert slow_render.phases == {PHASE_CONDITION: 1.0, PHASE_HYPERMEDIA: 1.0}
+    assert slow_render.hyperfields == {}
+
+
+@pytest.mark.parametrize("sample_rate", [-0.1, 1.1])
+def test_slow_render_invalid_sample_rate(sample_rate: float) -> None:
+    with pytest.raises(ValueError, match="sample_rate"):
+        SlowRenderDetector(sample_rate=sample_rate)
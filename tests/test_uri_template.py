@@ -0,0 +1,112 @@
+import copy
+from typing import Any, Dict
+
+import pytest
+
+from fastapi_hypermodel import InvalidURITemplate, URITemplate, expand_uri_template
+from fastapi_hypermodel.base import QueryTemplate, route_uri_template
+
+VALUES: Dict[str, Any] = {
+    "var": "value",
+    "hello": "Hello World!",
+    "path": "/foo/bar",
+    "list": ["red", "green", "blue"],
+    "keys": {"semi": ";", "dot": ".", "comma": ","},
+    "empty": "",
+    "x": 1024,
+    "y": 768,
+    "who": "fred",
+    "flag": True,
+    "undef": None,
+    "empty_keys": {},
+    "empty_list": [],
+}
+
+
+@pytest.mark.parametrize(
+    ("template", "expected"),
+    [
+        ("{var}", "value"),
+        ("{hello}", "Hello%20World%21"),
+        ("{+hello}", "Hello%20World!"),
+        ("{+path}/here", "/foo/bar/here"),
+        ("{#var}", "#value"),
+        ("{#path:6}/here", "#/foo/b/here"),
+        ("{x,y}", "1024,768"),
+        ("{var:3}", "val"),
+        ("X{.var}", "X.value"),
+        ("{.who,who}", ".fred.fred"),
+        ("{/var,x}/here", "/value/1024/here"),
+        ("{;x,y,empty}", ";x=1024;y=768;empty"),
+        ("{?x,y,empty}", "?x=1024&y=768&empty="),
+        ("?fixed=yes{&x}", "?fixed=yes&x=1024"),
+        ("{?flag}", "?flag=true"),
+        ("{list}", "red,green,blue"),
+        ("{list*}", "red,green,blue"),
+        ("{/list*,path:4}", "/red/green/blue/%2Ffoo"),
+        ("{;list}", ";list=red,green,blue"),
+        ("{?list}", "?list=red,green,blue"),
+        ("{?list*}", "?list=red&list=green&list=blue"),
+        ("{keys}", "semi,%3B,dot,.,comma,%2C"),
+        ("{keys*}", "semi=%3B,dot=.,comma=%2C"),
+        ("{+keys*}", "semi=;,dot=.,comma=,"),
+        ("{?keys}", "?keys=semi,%3B,dot,.,comma,%2C"),
+        ("{?keys*}", "?semi=%3B&dot=.&comma=%2C"),
+        ("/items{?undef,empty_keys,empty_list}", "/items"),
+    ],
+)
+def test_expand_uri_template(template: str, expected: str) -> None:
+    assert expand_uri_template(template, VALUES) == expected
+
+
+def test_expand_uri_template_keywords() -> None:
+    template = URITemplate("/items/{id_}{?owner,page%2Dsize}")
+
+    expanded = template.expand(
+        {"id_": "a", "owner": "b"}, owner="c", **{"page-size": 5}
+    )
+
+    assert expanded == "/items/a?owner=c&page%2Dsize=5"
+    assert template.variables == ("id_", "owner", "page-size")
+    assert template.expand() == "/items/"
+    assert repr(template) == "URITemplate('/items/{id_}{?owner,page%2Dsize}')"
+
+
+def test_uri_template_is_shared_by_copies() -> None:
+    template = URITemplate("/items/{id_}")
+
+    assert copy.copy(template) is template
+    assert copy.deepcopy(template) is template
+
+
+@pytest.mark.parametrize("template", ["/items/{id-}", "/items/{?a,,b}", "/{x:0}"])
+def test_invalid_uri_template(template: str) -> None:
+    with pytest.raises(InvalidURITemplate):
+        URITemplate(template)
+
+
+@pytest.mark.parametrize(
+    ("path", "query", "expected"),
+    [
+        ("/items/{id_}", None, "/items/{id_}"),
+        ("/items/{id_:int}", QueryTemplate({"size": 20}), "/items/{id_}?size=20"),
+        ("/files/{name:path}", QueryTemplate({"q": "<q>"}), "/files/{+name}{?q}"),
+        (
+            "/items",
+            QueryTemplate({"size": 20, "owner": "<owner>", "sort": "<sort>"}),
+            "/items?size=20{&owner,sort}",
+        ),
+    ],
+)
+def test_route_uri_template(path: str, query: Any, expected: str) -> None:
+    assert route_uri_template(path, query) == expected
+
+
+def test_route_uri_template_round_trip() -> None:
+    query = QueryTemplate({"size": 20, "owner": "<owner>"})
+
+    template = route_uri_template("/items/{id_:int}", query)
+
+    assert expand_uri_template(template, id_=3, owner="a b") == (
+        "/items/3?size=20&owner=a%20b"
+    )
@@ -1,3 +1,4 @@
+import copy
 from typing import Any, Mapping
 
 import pytest
@@ -64,6 +65,120 @@ def test_build_hypermedia_template(app: FastAPI) -> None:
     assert uri.hypermedia == "/mock_read/{id_}"
 
 
+def test_build_hypermedia_template_is_resolved_once(app: FastAPI) -> None:
+    url_for = UrlFor("mock_read_with_path", templated=True)
+
+    first = url_for(app, {"id_": "first"})
+    second = url_for(app, {"id_": "second"})
+
+    assert first is second
+
+
+def test_build_hypermedia_template_per_app(
+    app: FastAPI, unregistered_app: FastAPI
+) -> None:
+    @unregistered_app.get("/other_mock_read/{id_}")
+    def mock_read_with_path() -> None:  # pragma: no cover
+        pass
+
+    url_for = UrlFor("mock_read_with_path", templated=True)
+
+    first = url_for(app, {})
+    second = url_for(unregistered_app, {})
+
+    assert first
+    assert second
+    assert first.hypermedia == "/mock_read/{id_}"
+    assert second.hypermedia == "/other_mock_read/{id_}"
+
+
+def test_build_hypermedia_with_query(app: FastAPI) -> None:
+    url_for = UrlFor(
+        "mock_read_with_path",
+        {"id_": "<id_>"},
+        query={"owner": "<owner>", "limit": 50, "q": "a b"},
+    )
+
+    uri = url_for(app, {"id_": "item01", "owner": "person 01"})
+
+    assert uri
+    assert uri.hypermedia == "/mock_read/item01?owner=person%2001&limit=50&q=a%20b"
+
+
+def test_build_hypermedia_with_constant_query_is_resolved_once(app: FastAPI) -> None:
+    url_for = UrlFor("mock_read_with_path", templated=True, query={"limit": 50})
+
+    first = url_for(app, {})
+    second = url_for(app, {})
+
+    assert first is second
+    assert first
+    assert first.hypermedia == "/mock_read/{id_}?limit=50"
+
+
+def test_build_hypermedia_templated_with_query_variables(app: FastAPI) -> None:
+    url_for = UrlFor(
+        "mock_read_with_path",
+        templated=True,
+        query={"limit": 50, "owner": "<owner.id_>", "page-size": "<size>"},
+    )
+
+    uri = url_for(app, {})
+
+    assert uri
+    assert uri.hypermedia == "/mock_read/{id_}?limit=50{&owner,page%2Dsize}"
+
+
+def test_build_hypermedia_templated_drops_convertors(app: FastAPI) -> None:
+    @app.get("/mock_files/{id_:int}/{name:path}")
+    def mock_read_file() -> None:  # pragma: no cover
+        pass
+
+    url_for = UrlFor("mock_read_file", templated=True, query={"fields": "<fields>"})
+
+    uri = url_for(app, {})
+
+    assert uri
+    assert uri.hypermedia == "/mock_files/{id_}/{+name}{?fields}"
+
+
+def test_build_hypermedia_with_templated_query_is_not_shared(app: FastAPI) -> None:
+    @app.get("/mock_read_all")
+    def mock_read_all() -> None:  # pragma: no cover
+        pass
+
+    url_for = UrlFor("mock_read_all", query={"owner": "<owner>"})
+
+    first = url_for(app, {"owner": "first"})
+    second = url_for(app, {"owner": None})
+
+    assert first
+    assert second
+    assert first.hypermedia == "/mock_read_all?owner=first"
+    assert second.hypermedia == "/mock_read_all"
+
+
+def test_build_hypermedia_with_safe_params(app: FastAPI) -> None:
+    url_for = UrlFor("mock_read_with_path", {"id_": "<id_>"}, safe_params=["id_"])
+
+    uri = url_for(app, {"id_": "item%2001"})
+
+    assert uri
+    assert uri.hypermedia == "/mock_read/item%2001"
+
+
+def test_build_hypermedia_with_params_is_not_shared(app: FastAPI) -> None:
+    url_for = UrlFor("mock_read_with_path", {"id_": "<id_>"})
+
+    first = url_for(app, {"id_": "first"})
+    second = url_for(app, {"id_": "second"})
+
+    assert first
+    assert second
+    assert first.hypermedia == "/mock_read/first"
+    assert second.hypermedia == "/mock_read/second"
+
+
 def test_json_serialization(app: FastAPI) -> None:
     url_for = UrlFor(
         "mock_read_with_path",
@@ -98,3 +213,38 @@ def test_openapi_schema(url_type_schema: Mapping[str, Any]) -> None:
     url_for_schema = schema["$defs"]["UrlFor"]
 
     assert all(url_for_schema.get(k) == v for k, v in url_type_schema.items())
+
+
+def test_hyperfields_share_read_only_values(app: FastAPI) -> None:
+    seen = []
+
+    def condition(values: Mapping[str, Any]) -> bool:
+        seen.append(values)
+        return True
+
+    class MockConditionalClass(HyperModel):
+        id_: str
+
+        first: UrlFor = UrlFor(
+            "mock_read_with_path", {"id_": "<id_>"}, condition=condition
+        )
+        second: UrlFor = UrlFor(
+            "mock_read_with_path", {"id_": "<id_>"}, condition=condition
+        )
+
+    HyperModel.init_app(app)
+    mock = MockConditionalClass(id_="test")
+
+    first, second = seen
+    assert first is second
+    assert first["id_"] == "test"
+    assert mock.first.hypermedia == "/mock_read/test"
+    with pytest.raises(TypeError):
+        first["id_"] = "changed"  # type: ignore[index]
+
+
+def test_url_for_definitions_are_shared() -> None:
+    href = MockClass.model_fields["href"]
+
+    assert copy.copy(href.default) is href.default
+    assert href.get_default(call_default_factory=True) is href.default
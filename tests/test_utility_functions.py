@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass
 from typing import Any, Dict, Mapping, Optional
 
@@ -12,6 +13,12 @@ from fastapi_hypermodel import (
     get_route_from_app,
     resolve_param_values,
 )
+from fastapi_hypermodel.base import (
+    QueryTemplate,
+    encode_query,
+    route_table_build_count,
+    values_view,
+)
 
 
 @dataclass
@@ -64,6 +71,36 @@ def test_resolve_param_values_url_escape() -> None:
     assert actual == expected
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("item01", "item01"),
+        (
+            "0b5a7c7e-5f2e-4c41-9d4f-2b1e1d0c4d71",
+            "0b5a7c7e-5f2e-4c41-9d4f-2b1e1d0c4d71",
+        ),
+        ("a/b.c~d_e", "a/b.c~d_e"),
+        ("a b", "a%20b"),
+        ("café", "caf%C3%A9"),
+        (42, 42),
+    ],
+)
+def test_resolve_param_values_quoting(value: Any, expected: Any) -> None:
+    actual = resolve_param_values({"id_": "<id_>"}, {"id_": value})
+
+    assert actual == {"id_": expected}
+
+
+def test_resolve_param_values_safe_params() -> None:
+    actual = resolve_param_values(
+        {"id_": "<id_>", "name": "<name>"},
+        {"id_": "a b", "name": "a b"},
+        safe_params=frozenset({"id_"}),
+    )
+
+    assert actual == {"id_": "a b", "name": "a%20b"}
+
+
 def test_resolve_param_values_empty_attribute(params: Mapping[str, str]) -> None:
     actual = resolve_param_values({"id_": "<>"}, params)
     expected = {}
@@ -145,3 +182,104 @@ def test_get_route_from_app(app: FastAPI) -> Any:
 def test_get_route_from_app_non_existing(app: FastAPI) -> Any:
     with pytest.raises(ValueError, match="No route found for endpoint "):
         get_route_from_app(app, "mock_read")
+
+
+def test_get_route_from_app_reuses_route_table() -> None:
+    app = FastAPI()
+
+    @app.get("/items/{id_}")
+    def read_item() -> None:
+        pass
+
+    builds = route_table_build_count()
+    get_route_from_app(app, "read_item")
+    get_route_from_app(app, "read_item")
+
+    assert route_table_build_count() == builds + 1
+
+
+def test_get_route_from_app_after_adding_routes() -> None:
+    app = FastAPI()
+
+    @app.get("/items/{id_}")
+    def read_item() -> None:
+        pass
+
+    get_route_from_app(app, "read_item")
+
+    @app.get("/people/{id_}")
+    def read_person() -> None:
+        pass
+
+    route = get_route_from_app(app, "read_person")
+
+    assert route.path == "/people/{id_}"
+
+
+def test_get_route_from_app_first_route_with_name() -> None:
+    app = FastAPI()
+
+    @app.get("/items/{id_}", name="read")
+    def read_item() -> None:
+        pass
+
+    @app.get("/people/{id_}", name="read")
+    def read_person() -> None:
+        pass
+
+    route = get_route_from_app(app, "read")
+
+    assert route.path == "/items/{id_}"
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        pytest.param(
+            {"size": 20, "after": "item01"}, "size=20&after=item01", id="Safe"
+        ),
+        pytest.param({"q": "a b&c"}, "q=a%20b%26c", id="Quoted"),
+        pytest.param({"all": True, "skip": None}, "all=true", id="Booleans and None"),
+        pytest.param({}, "", id="Empty"),
+    ],
+)
+def test_encode_query(params: Mapping[str, Any], expected: str) -> None:
+    assert encode_query(params) == expected
+
+
+def test_query_template_render() -> None:
+    query = QueryTemplate({
+        "owner": "<owner.name>",
+        "limit": 50,
+        "tags": ("a", "b c"),
+        "missing": "<missing>",
+        "empty": None,
+    })
+
+    assert query.attributes == ("owner.name", "missing")
+    assert not query.is_constant
+    assert query.render({"owner": {"name": "B&B"}}) == (
+        "owner=B%26B&limit=50&tags=a&tags=b%20c"
+    )
+    assert query.render(constant_only=True) == "limit=50&tags=a&tags=b%20c"
+
+
+def test_query_template_is_shared_by_copies() -> None:
+    query = QueryTemplate({"limit": 50})
+
+    assert query.is_constant
+    assert copy.copy(query) is query
+    assert copy.deepcopy(query) is query
+
+
+def test_values_view() -> None:
+    mapping = {"name": "Bob"}
+    mock_object = MockClass(name="Bob")
+
+    view = values_view(mock_object)
+    mock_object.name = "Alice"
+
+    assert values_view(mapping) is mapping
+    assert view["name"] == "Alice"
+    with pytest.raises(TypeError):
+        view["name"] = "Bob"  # type: ignore[index]